@@ -1,21 +1,14 @@
 """
 AI 분석을 위한 프롬프트 템플릿 모음
 교사-아동 상호작용 분석 및 코칭 가이드 생성용
+
+OpenAI 프롬프트 캐시는 요청 앞부분이 일치할 때만 적용되므로,
+고정된 지시문을 앞에 두고 호출마다 달라지는 데이터는 맨 뒤에 둡니다.
 """
 
 CONVERSATION_ANALYSIS_PROMPT = """
 당신은 유아교육 전문가이자 아동 심리학 전문가입니다. 
-다음 교사-아동 대화를 분석하여 전문적인 코칭 피드백을 제공해주세요.
-
-## 대화 내용
-{transcript}
-
-## 화자 정보
-- 교사: {teacher_info}
-- 아동: {child_info}
-
-## 감정 분석 결과
-{sentiment_analysis}
+아래 교사-아동 대화를 분석하여 전문적인 코칭 피드백을 제공해주세요.
 
 ## 분석 요청사항
 다음 항목들을 한국어로 상세히 분석해주세요:
@@ -51,14 +44,21 @@ CONVERSATION_ANALYSIS_PROMPT = """
 - 아동의 관심사를 활용한 학습 기회
 
 응답은 따뜻하고 격려적인 톤으로, 교사가 성장할 수 있도록 구체적이고 실용적인 조언을 포함해주세요.
-"""
-
-QUICK_FEEDBACK_PROMPT = """
-다음 교사-아동 대화를 빠르게 분석하여 핵심 피드백을 제공해주세요:
 
 ## 대화 내용
 {transcript}
 
+## 화자 정보
+- 교사: {teacher_info}
+- 아동: {child_info}
+
+## 감정 분석 결과
+{sentiment_analysis}
+"""
+
+QUICK_FEEDBACK_PROMPT = """
+아래 교사-아동 대화를 빠르게 분석하여 핵심 피드백을 제공해주세요.
+
 ## 요청사항
 간결하고 실용적인 피드백을 다음 형식으로 제공해주세요:
 
@@ -72,16 +72,13 @@ QUICK_FEEDBACK_PROMPT = """
 - 이 대화에서 가장 중요한 교훈 1가지
 
 따뜻하고 격려적인 톤으로 답변해주세요.
-"""
-
-CHILD_DEVELOPMENT_ANALYSIS_PROMPT = """
-아동 발달 전문가로서 다음 대화에서 나타나는 아동의 발달 상태를 분석해주세요:
 
 ## 대화 내용
 {transcript}
+"""
 
-## 아동 발화 분석
-{child_utterances}
+CHILD_DEVELOPMENT_ANALYSIS_PROMPT = """
+아동 발달 전문가로서 아래 대화에서 나타나는 아동의 발달 상태를 분석해주세요.
 
 ## 분석 요청사항
 
@@ -111,16 +108,16 @@ CHILD_DEVELOPMENT_ANALYSIS_PROMPT = """
 - 주의깊게 관찰할 발달 영역
 
 전문적이면서도 이해하기 쉽게 설명해주세요.
-"""
 
-COACHING_TIPS_PROMPT = """
-교사 코칭 전문가로서 다음 상황에 대한 구체적인 코칭 팁을 제공해주세요:
+## 대화 내용
+{transcript}
 
-## 상황
-{situation}
+## 아동 발화 분석
+{child_utterances}
+"""
 
-## 대화 예시
-{transcript}
+COACHING_TIPS_PROMPT = """
+교사 코칭 전문가로서 아래 상황에 대한 구체적인 코칭 팁을 제공해주세요.
 
 ## 코칭 요청사항
 
@@ -145,16 +142,16 @@ COACHING_TIPS_PROMPT = """
 - 자가 평가 질문들
 
 실용적이고 즉시 적용 가능한 조언을 중심으로 답변해주세요.
-"""
 
-SENTIMENT_INTERPRETATION_PROMPT = """
-다음 감정 분석 결과를 교사 코칭 관점에서 해석해주세요:
+## 상황
+{situation}
 
-## 감정 분석 데이터
-{sentiment_data}
+## 대화 예시
+{transcript}
+"""
 
-## 대화 맥락
-{context}
+SENTIMENT_INTERPRETATION_PROMPT = """
+아래 감정 분석 결과를 교사 코칭 관점에서 해석해주세요.
 
 ## 해석 요청사항
 
@@ -175,4 +172,10 @@ SENTIMENT_INTERPRETATION_PROMPT = """
 - 아동의 긍정적 반응을 이끄는 접근법
 
 교사가 감정을 더 잘 이해하고 활용할 수 있도록 도와주세요.
+
+## 감정 분석 데이터
+{sentiment_data}
+
+## 대화 맥락
+{context}
 """
\ No newline at end of file
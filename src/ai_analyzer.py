@@ -4,22 +4,492 @@ OpenAI GPT-4o-mini 기반 대화 분석 모듈
 """
 
 import os
+import re
+import logging
+import asyncio
+import threading
 import openai
-from typing import Dict, List, Any, Optional
+import httpx
+from tenacity import (
+    retry,
+    wait_random_exponential,
+    stop_after_attempt,
+    retry_if_exception_type,
+    before_sleep_log
+)
+from typing import Dict, List, Any, Optional, Callable, Coroutine, Iterator, AsyncIterator, Tuple, Union
+import io
 import json
+import math
+import time
+import uuid
+import hashlib
+import importlib.util
+from collections import OrderedDict, deque
+from functools import lru_cache
 from datetime import datetime
 import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-from src.prompt_manager import PromptManager
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json으로 직렬화
+    orjson = None
+
+try:
+    import tiktoken
+except ImportError:  # tiktoken이 없으면 글자 수로 토큰 수를 추정
+    tiktoken = None
+
+from src.prompt_manager import get_prompt_manager
 from src.logging_config import get_logger, log_performance, log_api_call
+from src.rate_limiter import TokenBucket
 
 # 로거 설정
 logger = get_logger(__name__)
 
+# HTTP 연결 풀 설정 (keep-alive 연결 재사용)
+HTTP_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=100,
+    max_connections=100,
+    keepalive_expiry=30.0
+)
+HTTP_TIMEOUT = 60.0
+# h2 패키지가 있으면 HTTP/2로 한 연결에서 여러 요청을 다중화
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
+# aiohttp 전송 계층은 동시 요청이 많아도 지연이 안정적이므로 연결 수를 넉넉히 허용
+AIOHTTP_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=64,
+    max_connections=256,
+    keepalive_expiry=30.0
+)
+
+# 일시적인 오류만 재시도 (BadRequestError 등은 즉시 전파)
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,
+    openai.APITimeoutError,
+    openai.InternalServerError
+)
+
+# 지수 백오프 + 지터 재시도 정책 (SDK 자체 재시도는 끄고 여기서만 재시도)
+api_retry = retry(
+    wait=wait_random_exponential(min=1, max=30),
+    stop=stop_after_attempt(6),
+    retry=retry_if_exception_type(RETRYABLE_ERRORS),
+    before_sleep=before_sleep_log(logger, logging.WARNING),
+    reraise=True
+)
+
+# gpt-4o-mini 기본 속도 한도 (조직 등급에 맞게 AIAnalyzer 생성 시 조정)
+DEFAULT_REQUESTS_PER_MINUTE = 500
+DEFAULT_TOKENS_PER_MINUTE = 200000
+
+# gpt-4o-mini 토큰 한도
+MODEL_CONTEXT_WINDOW = 128000
+MODEL_MAX_OUTPUT_TOKENS = 16384
+TOKEN_SAFETY_MARGIN = 64
+
+# 실제 출력 길이 기반 max_tokens 조정 (최근 응답 출력 토큰의 p99 + 10%, 설정값이 상한)
+COMPLETION_SAMPLE_SIZE = 200
+COMPLETION_MIN_SAMPLES = 20
+COMPLETION_HEADROOM = 1.1
+
+# 마크다운 응답의 끝 표시 (시스템 프롬프트에서 요청하고 stop으로 잘라내 뒤따르는 군더더기를 막음)
+RESPONSE_STOP = ["\n## 끝"]
+
+# 응답 캐시 최대 항목 수 (LRU)
+RESPONSE_CACHE_SIZE = 512
+RESPONSE_CACHE_TTL = 3600.0
+# 온도가 높으면 같은 입력에도 다른 답이 기대되므로 결정적에 가까운 호출만 캐시
+CACHEABLE_MAX_TEMPERATURE = 0.3
+
+# 분석 유형 (AnalysisManager의 분석 유형 키와 동일한 순서)
+ANALYSIS_TYPES = (
+    "comprehensive",
+    "quick_feedback",
+    "child_development",
+    "coaching_tips",
+    "sentiment_interpretation"
+)
+
+# 프롬프트 파일 변경 확인 간격 (초)
+PROMPT_REFRESH_INTERVAL = 2.0
+
+# PromptManager에서 관리하는 분석 프롬프트 ID
+PROMPT_IDS = (
+    "conversation_analysis",
+    "quick_feedback",
+    "child_development",
+    "coaching_tips",
+    "sentiment_interpretation"
+)
+
+# 프롬프트 묶음 버전 (시스템 프롬프트/출력 형식을 의도적으로 바꿀 때만 올림)
+# 시스템 메시지 맨 앞에 들어가므로 버전이 바뀌면 프롬프트 캐시와 응답 캐시가 함께 새로 시작됨
+PROMPT_VERSION = "v4"
+
+# 모든 분석이 공유하는 시스템 프롬프트 (프롬프트 캐시가 적용되도록 바이트 단위로 고정)
+SYSTEM_BASE = """당신은 KindCoach의 AI 코치입니다. KindCoach는 유치원·어린이집 교사가 녹음한 교사-아동 대화를 분석해 교사의 상호작용 역량 향상을 돕는 서비스입니다.
+
+## 공통 원칙
+- 모든 응답은 한국어로 작성합니다.
+- 교사를 평가하기보다 성장을 돕는 동료 코치의 관점에서, 따뜻하고 존중하는 어조로 씁니다.
+- 관찰 가능한 근거(실제 발화, 시간, 감정 변화)에 기반해 설명하고, 가능한 경우 대화 속 표현을 짧게 인용합니다.
+- 근거가 부족한 내용은 단정하지 말고 "~로 보입니다", "추가 관찰이 필요합니다"처럼 표현합니다.
+- 아동의 연령과 발달 단계를 고려하며, 아동을 진단하거나 낙인찍는 표현은 사용하지 않습니다.
+- 제안은 교실에서 바로 시도할 수 있도록 구체적인 문장 예시나 행동으로 제시합니다.
+- 잘한 점을 먼저 인정한 뒤 개선점을 제시합니다.
+
+## 입력 데이터 안내
+- 전사본은 음성 인식 결과이므로 오탈자나 화자 구분 오류가 있을 수 있습니다.
+- 화자는 "화자 A", "화자 B"처럼 표시되며, 화자 정보가 주어지면 교사와 아동을 구분하는 데 사용합니다.
+- 감정 분석 결과는 POSITIVE/NEUTRAL/NEGATIVE와 신뢰도로 주어지며, 참고 지표로만 활용합니다.
+- 긴 대화는 중간 부분이 요약되어 "[중략 - 중간 대화 요약]" 표시와 함께 주어질 수 있습니다.
+
+## 출력 형식
+- 마크다운 제목(###)과 글머리표를 사용해 읽기 쉽게 구성합니다.
+- 요청된 항목 순서를 지키고, 불필요한 서론이나 반복은 생략합니다.
+- 마크다운으로 답할 때는 응답을 모두 마친 뒤 마지막 줄에 '## 끝'만 적습니다 (JSON으로 답할 때는 적지 않습니다)."""
+
+# 분석별 역할 (공통 시스템 프롬프트 뒤에 붙음)
+SYSTEM_ROLES = {
+    "conversation_analysis": "당신은 유아교육과 아동 심리학 분야의 전문가입니다. 교사들에게 따뜻하고 실용적인 코칭을 제공합니다.",
+    "quick_feedback": "유아교육 전문가로서 교사들에게 격려적이고 실용적인 피드백을 제공합니다.",
+    "child_development": "아동 발달 전문가로서 과학적이고 체계적인 발달 분석을 제공합니다.",
+    "coaching_tips": "교사 코칭 전문가로서 실용적이고 적용 가능한 조언을 제공합니다.",
+    "sentiment_interpretation": "감정과 소통 전문가로서 교사의 감정 인식과 대응 능력 향상을 돕습니다.",
+    "summary_report": "교육 컨설턴트로서 분석 결과를 실행 가능한 리포트로 정리합니다.",
+    "fused_analysis": "유아교육·아동 발달·교사 코칭 전문가로서 한 대화에 대한 여러 분석을 한 번에 작성합니다.",
+    "transcript_summary": "유아교육 전문가로서 교사-아동 대화의 핵심 흐름을 사실 그대로 간결하게 요약합니다."
+}
+
+# 프롬프트별 시스템 메시지 (공통 접두부가 앞, 역할이 뒤)
+SYSTEM_PREFIX = f"[프롬프트 버전: {PROMPT_VERSION}]\n{SYSTEM_BASE}"
+SYSTEM_ROLE_HEADER = "\n\n## 이번 작업의 역할\n"
+SYSTEM_MESSAGES = {
+    prompt_id: f"{SYSTEM_PREFIX}{SYSTEM_ROLE_HEADER}{role}"
+    for prompt_id, role in SYSTEM_ROLES.items()
+}
+
+# 세션 통계를 시스템 메시지로 옮겼을 때 사용자 프롬프트의 화자 정보 자리에 넣을 참조 문구
+SESSION_STATS_REFERENCE = "(시스템 메시지의 세션 통계 참조)"
+
+# 프롬프트별 생성 파라미터
+GENERATION_PARAMS = {
+    "conversation_analysis": {"temperature": 0.7, "max_tokens": 2000},
+    "quick_feedback": {"temperature": 0.6, "max_tokens": 800},
+    "child_development": {"temperature": 0.5, "max_tokens": 1500},
+    "coaching_tips": {"temperature": 0.7, "max_tokens": 1200},
+    "sentiment_interpretation": {"temperature": 0.6, "max_tokens": 1000},
+    "summary_report": {"temperature": 0.6, "max_tokens": 800},
+    "fused_analysis": {"temperature": 0.6, "max_tokens": 6500},  # 다섯 분석의 토큰 상한 합
+    "transcript_summary": {"temperature": 0.3, "max_tokens": 600}
+}
+
+# 구조화(JSON) 출력 설정 - 스키마가 출력 길이를 제한하므로 토큰 상한을 낮춤
+JSON_RESPONSE_FORMAT = {"type": "json_object"}
+STRUCTURED_GENERATION_PARAMS = {"temperature": 0.2, "max_tokens": 1200}
+STRUCTURED_OUTPUT_INSTRUCTIONS = {
+    "conversation_analysis": """
+
+반드시 아래 키를 가진 JSON 객체로만 응답하세요. 각 목록은 3개 이내의 간결한 문장으로 작성합니다.
+{"quality_scores": {"warmth": 0-10, "engagement": 0-10, "effectiveness": 0-10, "educational_value": 0-10},
+ "strengths": [], "improvements": [], "suggestions": [],
+ "child_development": {"development_level": "", "language": "", "social_emotional": ""},
+ "follow_up_activities": [], "encouragement": ""}""",
+    "child_development": """
+
+반드시 아래 키를 가진 JSON 객체로만 응답하세요. 각 목록은 3개 이내의 간결한 문장으로 작성합니다.
+{"language": [], "cognitive": [], "social_emotional": [],
+ "estimated_age_range": "", "strengths": [], "observe_further": [],
+ "teacher_recommendations": []}"""
+}
+
+# 여러 전사본 빠른 피드백 묶음 요청 설정
+QUICK_FEEDBACK_GROUP_TOKEN_BUDGET = 6000  # 한 요청에 묶을 전사본 총 토큰 수
+QUICK_FEEDBACK_GROUP_MAX_ITEMS = 8        # 한 요청에 묶을 최대 전사본 수
+# (피드백 내용/형식은 사용자가 편집하는 quick_feedback 템플릿을 따르고, 여기서는 묶음 응답 형식만 지정)
+QUICK_FEEDBACK_GROUP_INSTRUCTION = """
+
+대화 내용에는 "## 대화 N" 제목으로 번호가 붙은 여러 개의 교사-아동 대화가 주어집니다. 각 대화마다 요청사항의 형식대로 피드백을 따로 작성하세요.
+반드시 아래 형식의 JSON 객체로만 응답하세요:
+{"feedback": [{"index": 대화 번호, "feedback": "마크다운 피드백"}]}"""
+
+# 통합 분석 설정 - 다섯 분석을 한 요청으로 묶고 분석 유형별 키를 가진 JSON으로 받음
+FUSED_RESULT_KEYS = {
+    "comprehensive": "analysis",
+    "quick_feedback": "feedback",
+    "child_development": "development_analysis",
+    "coaching_tips": "coaching_tips",
+    "sentiment_interpretation": "sentiment_interpretation"
+}
+FUSED_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "kindcoach_fused_analysis",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {analysis_type: {"type": "string"} for analysis_type in ANALYSIS_TYPES},
+            "required": list(ANALYSIS_TYPES),
+            "additionalProperties": False
+        }
+    }
+}
+# 통합 분석에서 각 템플릿의 데이터 자리에 넣을 참조 문구 (데이터는 공통 자료로 한 번만 전달)
+FUSED_DATA_REFERENCES = {
+    "transcript": "(공통 자료의 '대화 내용' 참조)",
+    "teacher_info": SESSION_STATS_REFERENCE,
+    "child_info": SESSION_STATS_REFERENCE,
+    "sentiment_analysis": "(공통 자료의 '감정 분석 결과' 참조)",
+    "sentiment_data": "(공통 자료의 '감정 분석 결과' 참조)",
+    "child_utterances": "(공통 자료의 '아동 발화' 참조)",
+    "situation": "(공통 자료의 '상황' 참조)",
+    "context": "(공통 자료의 '대화 맥락' 참조)"
+}
+FUSED_INSTRUCTION_HEADER = """아래 다섯 가지 작업을 모두 수행하세요. 각 작업의 결과는 마크다운 문자열로 작성해 JSON 객체의 해당 키에 담습니다.
+모든 작업은 맨 끝의 공통 자료를 바탕으로 합니다.
+"""
+
+# 전사본 전처리 설정
+TRANSCRIPT_TOKEN_BUDGET = 8000   # 이보다 길면 구간별로 요약
+TRANSCRIPT_KEEP_RATIO = 0.35     # 화자 구간이 없을 때 원문 그대로 유지할 앞/뒤 부분의 비율 (각각)
+TRANSCRIPT_CHUNK_TOKENS = 2000   # 요약 한 번에 넣을 구간 크기
+TRANSCRIPT_CHUNK_OVERLAP = 200   # 이전 구간 끝에서 반복해 넣을 맥락 크기
+TRANSCRIPT_CHUNK_SUMMARY_TOKENS = 300  # 구간 요약 하나의 최대 출력 토큰
+TRANSCRIPT_EXCERPT_TOKENS = 1500 # 요약과 함께 원문 그대로 넣을 주요 발화 분량
+TRANSCRIPT_SUMMARY_PROMPT = """
+다음은 교사-아동 대화의 일부입니다. 교사와 아동의 주요 발화, 질문과 응답, 감정 변화를 중심으로 흐름을 간결하게 요약해주세요.
+
+{chunk}
+"""
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_SENTENCE_END_RE = re.compile(r"(?<=[.?!])\s+")
+# 단독으로 쓰인 간투사만 제거 ("그"는 지시어로도 쓰이므로 유지)
+_FILLER_RE = re.compile(r"(?<!\S)(?:음+|어+|으음)[.,…~]*(?!\S)")
+
+# Batch API 설정 (실시간 호출 대비 50% 비용, 최대 24시간 처리)
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_POLL_INTERVAL = 30.0
+BATCH_TERMINAL_FAILURES = ("failed", "expired", "cancelled")
+
+# 호출마다 달라지는 결과 필드 (요약 리포트 프롬프트에서 제외)
+VOLATILE_RESULT_FIELDS = frozenset({
+    "processed_at",
+    "model_used",
+    "token_usage",
+    "processing_time_seconds"
+})
+
+# 감정 분석 항목의 필수 키 (모두 있으면 .get 없이 바로 접근)
+SENTIMENT_FIELDS = frozenset({"start_time", "sentiment", "confidence", "text"})
+
+# 포맷 문자열을 매번 해석하지 않도록 미리 바인딩한 줄 템플릿
+_SENTIMENT_LINE = '[{0:.1f}s] {1} (신뢰도: {2:.2f}) - "{3}"'.format
+_SPEAKER_INFO = """
+{0}:
+- 총 발화 시간: {1:.1f}초 ({2:.1f}%)
+- 총 단어 수: {3}개 ({4:.1f}%)
+- 발화 횟수: {5}회
+- 평균 신뢰도: {6:.2f}
+- 발화당 평균 단어 수: {7:.1f}개
+""".format
+
+
+def _strip_volatile_fields(data: Any) -> Any:
+    """중첩된 분석 결과에서 호출마다 달라지는 필드를 재귀적으로 제거한 사본을 반환합니다."""
+    if isinstance(data, dict):
+        return {
+            key: _strip_volatile_fields(value)
+            for key, value in data.items()
+            if key not in VOLATILE_RESULT_FIELDS
+        }
+    if isinstance(data, list):
+        return [_strip_volatile_fields(item) for item in data]
+    return data
+
+
+def _dump_stable_json(data: Any) -> str:
+    """
+    키를 정렬한 압축 JSON 문자열을 만듭니다 (가능하면 orjson 사용).
+    
+    모델 입력용이므로 들여쓰기 없이 구분자 뒤 공백도 생략해 직렬화 시간과 토큰을 줄입니다.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+@lru_cache(maxsize=128)
+def _prompt_cache_key(system: str) -> str:
+    """
+    같은 접두부를 쓰는 요청이 같은 캐시 서버로 라우팅되도록 prompt_cache_key를 만듭니다.
+    
+    역할 부분 앞까지(공통 접두부, 세션 통계 포함)의 sha256을 쓰므로,
+    분석 종류가 달라도 접두부가 같으면 같은 키가 됩니다.
+    """
+    prefix = system.split(SYSTEM_ROLE_HEADER, 1)[0]
+    return "kindcoach-" + hashlib.sha256(prefix.encode("utf-8")).hexdigest()[:32]
+
+
+@lru_cache(maxsize=128)
+def _render_speaker_info(role: str, stats_items: Tuple[Tuple[str, Any], ...]) -> str:
+    """화자 통계를 텍스트로 렌더링합니다 (같은 통계는 캐시된 결과 재사용)."""
+    stats = dict(stats_items)
+    return _SPEAKER_INFO(
+        role,
+        stats.get('total_time', 0),
+        stats.get('time_percentage', 0),
+        stats.get('total_words', 0),
+        stats.get('word_percentage', 0),
+        stats.get('utterances', 0),
+        stats.get('avg_confidence', 0),
+        stats.get('avg_words_per_utterance', 0)
+    )
+
+
+@lru_cache(maxsize=64)
+def _normalize_transcript(transcript: str) -> str:
+    """간투사를 제거하고 연속된 공백을 하나로 줄입니다."""
+    return _WHITESPACE_RE.sub(" ", _FILLER_RE.sub("", transcript)).strip()
+
+
+# 프로세스 전체에서 공유하는 연결 풀과 백그라운드 이벤트 루프
+# (AsyncOpenAI의 연결 풀은 이벤트 루프에 묶이므로 루프도 함께 공유)
+_shared_lock = threading.Lock()
+_shared_loop: Optional[asyncio.AbstractEventLoop] = None
+_prewarm_started = False
+
+
+@lru_cache(maxsize=1)
+def _shared_http_client() -> httpx.Client:
+    """동기 호출이 공유하는 HTTP 클라이언트를 반환합니다."""
+    return httpx.Client(limits=HTTP_POOL_LIMITS, timeout=HTTP_TIMEOUT, http2=HTTP2_ENABLED)
+
+
+@lru_cache(maxsize=1)
+def _shared_async_http_client() -> httpx.AsyncClient:
+    """
+    비동기 호출이 공유하는 HTTP 클라이언트를 반환합니다.
+    
+    openai[aiohttp]가 설치되어 있으면 aiohttp 전송 계층을 쓰고,
+    없으면 httpx 기본 전송 계층으로 대체합니다.
+    """
+    aiohttp_client_cls = getattr(openai, "DefaultAioHttpClient", None)
+    if aiohttp_client_cls is not None:
+        try:
+            client = aiohttp_client_cls(limits=AIOHTTP_POOL_LIMITS, timeout=HTTP_TIMEOUT)
+            logger.info("aiohttp 기반 비동기 HTTP 클라이언트 사용")
+            return client
+        except RuntimeError:  # aiohttp 추가 패키지가 설치되지 않음
+            pass
+    logger.info("httpx 기반 비동기 HTTP 클라이언트 사용 (HTTP/2: %s)", HTTP2_ENABLED)
+    return httpx.AsyncClient(limits=HTTP_POOL_LIMITS, timeout=HTTP_TIMEOUT, http2=HTTP2_ENABLED)
+
+
+def _shared_event_loop() -> asyncio.AbstractEventLoop:
+    """동기 호출의 코루틴을 실행할 백그라운드 이벤트 루프를 반환합니다 (처음 호출 시 시작)."""
+    global _shared_loop
+    with _shared_lock:
+        if _shared_loop is None:
+            _shared_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_shared_loop.run_forever,
+                name="AIAnalyzerLoop",
+                daemon=True
+            ).start()
+        return _shared_loop
+
+
+def close_shared_clients():
+    """
+    공유 연결 풀과 백그라운드 이벤트 루프를 정리합니다.
+    
+    모든 분석기(get_analyzer 싱글턴 포함)가 같은 풀을 쓰므로 프로세스 종료 시에만 호출합니다.
+    """
+    global _shared_loop, _prewarm_started
+    with _shared_lock:
+        loop, _shared_loop = _shared_loop, None
+    if _shared_http_client.cache_info().currsize:
+        _shared_http_client().close()
+    if _shared_async_http_client.cache_info().currsize:
+        aclient = _shared_async_http_client()
+        if loop is not None:
+            asyncio.run_coroutine_threadsafe(aclient.aclose(), loop).result()
+        else:
+            # 백그라운드 루프를 만든 적 없이 비동기 경로만 쓴 경우 - 새 루프에서 닫음
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                close_loop = asyncio.new_event_loop()
+                try:
+                    close_loop.run_until_complete(aclient.aclose())
+                finally:
+                    close_loop.close()
+            else:
+                logger.warning("실행 중인 이벤트 루프 안에서 호출되어 비동기 연결 풀 닫기를 건너뜁니다")
+    if loop is not None:
+        loop.call_soon_threadsafe(loop.stop)
+    with _shared_lock:
+        _shared_http_client.cache_clear()
+        _shared_async_http_client.cache_clear()
+        _prewarm_started = False
+    logger.info("공유 연결 풀 정리 완료")
+
+
+class SessionContext:
+    """
+    한 세션의 분석들이 공유하는 포맷 결과입니다.
+    
+    종합 분석과 감정 해석이 같은 화자 정보/감정 데이터를 쓰므로
+    세션마다 한 번만 포맷해 두고 프롬프트 구성에 재사용합니다.
+    화자 통계는 세션 안에서 바뀌지 않으므로 시스템 메시지 접두부에 넣어
+    같은 세션의 모든 분석이 프롬프트 캐시를 공유하게 합니다.
+    """
+    
+    __slots__ = ("teacher_info", "child_info", "sentiment_analysis", "_stable_prefix")
+    
+    def __init__(self, teacher_info: str, child_info: str, sentiment_analysis: str):
+        self.teacher_info = teacher_info
+        self.child_info = child_info
+        self.sentiment_analysis = sentiment_analysis
+        self._stable_prefix: Optional[str] = None
+    
+    def build_stable_prefix(self) -> str:
+        """공통 시스템 접두부 끝에 세션 통계를 붙인 접두부를 반환합니다 (세션마다 한 번 생성)."""
+        if self._stable_prefix is None:
+            self._stable_prefix = (
+                f"{SYSTEM_PREFIX}\n\n## 세션 통계 [SESSION STATS]\n"
+                f"{self.teacher_info.strip()}\n\n{self.child_info.strip()}"
+            )
+        return self._stable_prefix
+    
+    def system_message(self, prompt_id: str) -> str:
+        """세션 접두부 뒤에 분석별 역할을 붙인 시스템 메시지를 반환합니다."""
+        return f"{self.build_stable_prefix()}{SYSTEM_ROLE_HEADER}{SYSTEM_ROLES[prompt_id]}"
+
 
 class AIAnalyzer:
-    def __init__(self, api_key: str = None):
-        """OpenAI API 키로 초기화"""
+    def __init__(
+        self,
+        api_key: str = None,
+        max_requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE,
+        max_tokens_per_minute: float = DEFAULT_TOKENS_PER_MINUTE,
+        prewarm: bool = True
+    ):
+        """
+        OpenAI API 키로 초기화
+        
+        Args:
+            api_key: OpenAI API 키 (없으면 OPENAI_API_KEY 환경 변수 사용)
+            max_requests_per_minute: 분당 최대 요청 수 (RPM)
+            max_tokens_per_minute: 분당 최대 토큰 수 (TPM, 프롬프트 + max_tokens 기준)
+            prewarm: True이면 첫 분석 전에 백그라운드에서 API 연결(TCP/TLS)을 미리 맺음
+        """
         logger.info("AIAnalyzer 초기화 시작")
         
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
@@ -27,32 +497,1186 @@ class AIAnalyzer:
             logger.error("OPENAI_API_KEY가 설정되지 않았습니다.")
             raise ValueError("OPENAI_API_KEY가 설정되지 않았습니다.")
         
-        logger.info(f"OpenAI API 키 확인됨 (길이: {len(self.api_key)}자)")
+        logger.info("OpenAI API 키 확인됨 (길이: %s자)", len(self.api_key))
         
         try:
-            self.client = openai.OpenAI(api_key=self.api_key)
+            # 모든 분석기 인스턴스가 같은 연결 풀을 재사용
+            self._httpx = _shared_http_client()
+            self._ahttpx = _shared_async_http_client()
+            self.client = openai.OpenAI(api_key=self.api_key, http_client=self._httpx, max_retries=0)
+            self.aclient = openai.AsyncOpenAI(api_key=self.api_key, http_client=self._ahttpx, max_retries=0)
             self.model = "gpt-4o-mini"
-            logger.info(f"OpenAI 클라이언트 초기화 완료 (모델: {self.model})")
+            self._enc = self._load_encoder()
+            # 429 오류가 나기 전에 스스로 속도를 조절 (동기/비동기 호출이 같은 버킷을 공유)
+            self._request_bucket = TokenBucket(max_requests_per_minute, name="OpenAI RPM")
+            self._token_bucket = TokenBucket(max_tokens_per_minute, name="OpenAI TPM")
+            logger.info("OpenAI 클라이언트 초기화 완료 (모델: %s)", self.model)
         except Exception as e:
-            logger.error(f"OpenAI 클라이언트 초기화 실패: {str(e)}")
+            logger.error("OpenAI 클라이언트 초기화 실패: %s", e)
             raise
         
         try:
-            self.prompt_manager = PromptManager()
+            self.prompt_manager = get_prompt_manager()
             prompts = self.prompt_manager.get_all_prompts()
-            logger.info(f"PromptManager 초기화 완료 (프롬프트 {len(prompts)}개 로드됨)")
+            logger.info("PromptManager 초기화 완료 (프롬프트 %s개 로드됨)", len(prompts))
+            self._load_templates()
+            self._prompts_mtime = self._prompts_file_mtime()
+            self._prompts_checked_at = time.monotonic()
         except Exception as e:
-            logger.error(f"PromptManager 초기화 실패: {str(e)}")
+            logger.error("PromptManager 초기화 실패: %s", e)
             raise
         
+        # 동일 입력 재요청 시 API를 다시 호출하지 않도록 응답을 캐시 (LRU + TTL)
+        self._cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # 프롬프트별 최근 출력 토큰 수 (max_tokens 조정용)
+        self._completion_samples: Dict[str, deque] = {}
+        self._samples_lock = threading.Lock()
+        
+        if prewarm:
+            self._start_prewarm()
+        
         logger.info("AIAnalyzer 초기화 완료")
     
+    def _load_templates(self):
+        """
+        분석에 사용하는 템플릿을 미리 읽어 format 메서드를 바인딩해 둡니다.
+        
+        분석 호출마다 PromptManager를 조회하지 않고 바로 렌더링할 수 있습니다.
+        """
+        templates: Dict[str, Callable[..., str]] = {}
+        for prompt_id in PROMPT_IDS:
+            template = self.prompt_manager.get_prompt(prompt_id)
+            if template is None:
+                logger.warning("프롬프트를 찾을 수 없습니다: %s", prompt_id)
+                continue
+            templates[prompt_id] = template.format
+        # 동시에 실행 중인 분석이 빈 딕셔너리를 보지 않도록 한 번에 교체
+        self._templates = templates
+        self._fused_instructions = self._render_fused_instructions(templates)
+        self._prompts_revision = self.prompt_manager.revision
+    
+    @staticmethod
+    def _render_fused_instructions(templates: Dict[str, Callable[..., str]]) -> Optional[str]:
+        """
+        통합 분석용 지시문을 만듭니다 (템플릿이 바뀔 때만 다시 만듦).
+        
+        각 템플릿의 데이터 자리는 공통 자료 참조 문구로 채우므로, 지시문 부분은 호출마다 같아
+        프롬프트 캐시 접두부로 재사용됩니다. 템플릿이 하나라도 없거나 채울 수 없으면
+        None을 반환해 통합 분석만 사용하지 않습니다 (개별 분석은 그대로 동작).
+        """
+        if any(prompt_id not in templates for prompt_id in PROMPT_IDS):
+            return None
+        sections = [FUSED_INSTRUCTION_HEADER]
+        for analysis_type, prompt_id in zip(ANALYSIS_TYPES, PROMPT_IDS):
+            try:
+                instruction = templates[prompt_id](**FUSED_DATA_REFERENCES).strip()
+            except (KeyError, IndexError, ValueError) as e:
+                # 사용자가 편집한 템플릿의 자리 표시자가 맞지 않는 경우
+                logger.error("통합 분석 지시문 생성 실패 (%s 템플릿): %r - 통합 분석을 사용하지 않습니다", prompt_id, e)
+                return None
+            sections.append(f"# 작업: {analysis_type}\n{instruction}\n")
+        return "\n".join(sections)
+    
+    def _load_encoder(self) -> Any:
+        """모델 토크나이저를 로드합니다. 사용할 수 없으면 None을 반환합니다."""
+        if tiktoken is None:
+            logger.info("tiktoken 미설치 - 글자 수로 토큰 수를 추정합니다")
+            return None
+        try:
+            return tiktoken.encoding_for_model(self.model)
+        except Exception as e:  # 인코딩 파일 다운로드 실패 등
+            logger.warning("토크나이저 로드 실패, 글자 수로 토큰 수를 추정합니다: %s", e)
+            return None
+    
+    def _count_tokens(self, text: str) -> int:
+        """텍스트의 토큰 수를 셉니다 (토크나이저가 없으면 글자 수를 보수적 추정치로 사용)."""
+        if self._enc is None:
+            return len(text)
+        return len(self._enc.encode(text, disallowed_special=()))
+    
+    def _budget(self, prompt: str, target: int) -> int:
+        """프롬프트 길이를 고려해 컨텍스트 한도를 넘지 않는 max_tokens를 계산합니다."""
+        available = MODEL_CONTEXT_WINDOW - self._count_tokens(prompt) - TOKEN_SAFETY_MARGIN
+        return max(1, min(target, available, MODEL_MAX_OUTPUT_TOKENS))
+    
+    def _prompts_file_mtime(self) -> Optional[int]:
+        """프롬프트 파일의 수정 시각(ns)을 반환합니다."""
+        try:
+            return self.prompt_manager.prompts_file.stat().st_mtime_ns
+        except OSError:
+            return None
+    
+    def _claim_prompts_check(self) -> bool:
+        """확인 간격이 지났으면 이번 호출이 프롬프트 파일을 확인하도록 표시합니다."""
+        now = time.monotonic()
+        if now - self._prompts_checked_at < PROMPT_REFRESH_INTERVAL:
+            return False
+        self._prompts_checked_at = now
+        return True
+    
+    def _reload_templates_if_changed(self):
+        """프롬프트 파일이 바뀌었으면 다시 읽어 템플릿을 갱신합니다."""
+        mtime = self._prompts_file_mtime()
+        if mtime is None or mtime == self._prompts_mtime:
+            return
+        
+        self.prompt_manager.reload_prompts()
+        self._load_templates()
+        self._prompts_mtime = mtime
+        logger.info("프롬프트 파일 변경 감지 - 템플릿 다시 로드")
+    
+    def _refresh_templates(self):
+        """
+        프롬프트 에디터에서 수정한 내용이 반영되도록 템플릿을 갱신합니다.
+        
+        같은 프로세스의 편집은 공유 PromptManager의 revision으로 바로 반영하고,
+        다른 프로세스의 편집은 일정 간격마다 프롬프트 파일 변경 여부로 확인합니다.
+        """
+        if self.prompt_manager.revision != self._prompts_revision:
+            self._load_templates()
+        if self._claim_prompts_check():
+            self._reload_templates_if_changed()
+    
+    async def _a_refresh_templates(self):
+        """_refresh_templates의 비동기 버전입니다 (파일 I/O는 스레드에서 실행)."""
+        if self.prompt_manager.revision != self._prompts_revision:
+            self._load_templates()
+        if self._claim_prompts_check():
+            await asyncio.to_thread(self._reload_templates_if_changed)
+    
+    def _start_prewarm(self):
+        """
+        첫 분석 요청이 연결 수립(TCP/TLS) 시간을 기다리지 않도록
+        백그라운드 스레드에서 가벼운 요청으로 동기/비동기 연결 풀을 채웁니다 (프로세스당 한 번).
+        """
+        global _prewarm_started
+        with _shared_lock:
+            if _prewarm_started:
+                return
+            _prewarm_started = True
+        
+        def prewarm():
+            try:
+                # 동기/비동기 클라이언트는 연결 풀이 따로이므로 각각 한 번씩 호출하되,
+                # 분석 요청과 같은 RPM 한도 안에서 보냄
+                self._request_bucket.acquire()
+                self.client.models.list()
+                self._request_bucket.acquire()
+                self._run_sync(self.aclient.models.list())
+                logger.info("OpenAI API 연결 미리 수립 완료")
+            except Exception as e:  # 미리 연결하지 못해도 첫 요청에서 연결하면 되므로 무시
+                logger.debug("OpenAI API 연결 미리 수립 실패: %s", e)
+        
+        threading.Thread(target=prewarm, name="AIAnalyzerPrewarm", daemon=True).start()
+    
+    def close(self):
+        """
+        인스턴스 단위로 정리할 자원은 없습니다.
+        
+        연결 풀과 이벤트 루프는 다른 분석기와 공유하므로 여기서 닫지 않고,
+        프로세스 종료 시 close_shared_clients()로 정리합니다.
+        """
+    
+    def _cache_key(
+        self,
+        system: str,
+        user: str,
+        temperature: float,
+        max_tokens: int,
+        response_format: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
+        """
+        모델, 메시지, 온도, 실제 요청할 max_tokens, 응답 형식으로 응답 캐시 키를 만듭니다.
+        
+        max_tokens는 출력 길이 표본에 따라 바뀌므로 키에 포함해, 한도가 달라진 요청이
+        다른 한도로 받은 응답을 재사용하지 않게 합니다.
+        온도가 CACHEABLE_MAX_TEMPERATURE보다 높으면 캐시하지 않으므로 None을 반환합니다.
+        """
+        if temperature > CACHEABLE_MAX_TEMPERATURE:
+            return None
+        # 필드 경계가 섞여 다른 요청이 같은 키가 되지 않도록 구분자로 연결
+        raw = "\x1f".join((self.model, system, user, repr(temperature), str(max_tokens), str(response_format)))
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+    
+    def _cache_get(self, key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """캐시된 응답을 조회하고 최근 사용으로 표시합니다 (만료된 항목은 제거)."""
+        if key is None:
+            return None
+        with self._cache_lock:
+            item = self._cache.get(key)
+            if item is None:
+                return None
+            expires_at, entry = item
+            if expires_at <= time.monotonic():
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return entry
+    
+    def _cache_put(self, key: Optional[str], entry: Dict[str, Any]):
+        """
+        응답을 만료 시각과 함께 캐시에 저장하고 가장 오래된 항목부터 제거합니다.
+        
+        max_tokens에서 잘린 응답은 TTL 동안 재사용되지 않도록 저장하지 않습니다.
+        """
+        if key is None or entry.get("finish_reason") == "length":
+            return
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic() + RESPONSE_CACHE_TTL, entry)
+            self._cache.move_to_end(key)
+            while len(self._cache) > RESPONSE_CACHE_SIZE:
+                self._cache.popitem(last=False)
+    
+    def _request_tokens(self, kwargs: Dict[str, Any]) -> int:
+        """요청이 소비할 토큰 수를 추정합니다 (메시지 토큰 + max_tokens)."""
+        prompt_tokens = sum(self._count_tokens(message["content"]) for message in kwargs.get("messages", ()))
+        return prompt_tokens + kwargs.get("max_tokens", 0)
+    
+    @staticmethod
+    def _log_cache_key(system: str) -> str:
+        """prompt_cache_key를 만들고 접두부 안정성 확인용으로 기록합니다."""
+        key = _prompt_cache_key(system)
+        logger.debug("prompt_cache_key: %s", key)
+        return key
+    
+    @api_retry
+    def _chat(self, **kwargs) -> Any:
+        """속도 한도와 재시도 정책을 적용해 Chat Completions API를 호출합니다."""
+        self._request_bucket.acquire()
+        self._token_bucket.acquire(self._request_tokens(kwargs))
+        return self.client.chat.completions.create(model=self.model, **kwargs)
+    
+    @api_retry
+    async def _achat(self, **kwargs) -> Any:
+        """_chat의 비동기 버전입니다."""
+        await self._request_bucket.acquire_async()
+        await self._token_bucket.acquire_async(self._request_tokens(kwargs))
+        return await self.aclient.chat.completions.create(model=self.model, **kwargs)
+    
+    @staticmethod
+    def _cache_entry(response: Any) -> Dict[str, Any]:
+        """API 응답에서 캐시에 저장할 내용과 토큰 사용량을 추출합니다."""
+        return {
+            "content": response.choices[0].message.content,
+            "finish_reason": response.choices[0].finish_reason,
+            "usage": {
+                "prompt_tokens": response.usage.prompt_tokens,
+                "completion_tokens": response.usage.completion_tokens,
+                "total_tokens": response.usage.total_tokens
+            }
+        }
+    
+    def _cached_chat(
+        self,
+        system: str,
+        user: str,
+        temperature: float,
+        max_tokens: int,
+        response_format: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        캐시를 거쳐 Chat Completions API를 호출합니다.
+        
+        Returns:
+            Dict: {"content": 응답 본문, "usage": 토큰 사용량, "cached": 캐시 적중 여부}
+        """
+        max_tokens = self._budget(system + user, max_tokens)
+        key = self._cache_key(system, user, temperature, max_tokens, response_format)
+        entry = self._cache_get(key)
+        if entry is not None:
+            logger.info("응답 캐시 적중 - API 호출 생략")
+            return {
+                "content": entry["content"],
+                "usage": dict(entry["usage"]),
+                "finish_reason": entry.get("finish_reason"),
+                "cached": True
+            }
+        
+        response = self._chat(
+            messages=[
+                {"role": "system", "content": system},
+                {"role": "user", "content": user}
+            ],
+            temperature=temperature,
+            max_tokens=max_tokens,
+            extra_body={"prompt_cache_key": self._log_cache_key(system)},
+            **({"response_format": response_format} if response_format else {"stop": RESPONSE_STOP})
+        )
+        entry = self._cache_entry(response)
+        self._cache_put(key, entry)
+        return {
+            "content": entry["content"],
+            "usage": dict(entry["usage"]),
+            "finish_reason": entry["finish_reason"],
+            "cached": False
+        }
+    
+    async def _a_cached_chat(
+        self,
+        system: str,
+        user: str,
+        temperature: float,
+        max_tokens: int,
+        response_format: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """_cached_chat의 비동기 버전입니다."""
+        max_tokens = self._budget(system + user, max_tokens)
+        key = self._cache_key(system, user, temperature, max_tokens, response_format)
+        entry = self._cache_get(key)
+        if entry is not None:
+            logger.info("응답 캐시 적중 - API 호출 생략")
+            return {
+                "content": entry["content"],
+                "usage": dict(entry["usage"]),
+                "finish_reason": entry.get("finish_reason"),
+                "cached": True
+            }
+        
+        response = await self._achat(
+            messages=[
+                {"role": "system", "content": system},
+                {"role": "user", "content": user}
+            ],
+            temperature=temperature,
+            max_tokens=max_tokens,
+            extra_body={"prompt_cache_key": self._log_cache_key(system)},
+            **({"response_format": response_format} if response_format else {"stop": RESPONSE_STOP})
+        )
+        entry = self._cache_entry(response)
+        self._cache_put(key, entry)
+        return {
+            "content": entry["content"],
+            "usage": dict(entry["usage"]),
+            "finish_reason": entry["finish_reason"],
+            "cached": False
+        }
+    
+    def _run_sync(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """
+        코루틴을 전용 백그라운드 이벤트 루프에서 실행하고 결과를 기다립니다.
+        
+        AsyncOpenAI의 연결 풀은 생성된 이벤트 루프에 묶이므로, 호출마다
+        asyncio.run으로 새 루프를 만들지 않고 프로세스 공유 루프를 계속 사용합니다.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, _shared_event_loop()).result()
+    
+    def run_all_analyses(
+        self,
+        transcript: str,
+        speaker_segments: List[Dict[str, Any]],
+        teacher_child_info: Dict[str, Any],
+        sentiment_data: Optional[List[Dict[str, Any]]] = None,
+        situation: str = "일반적인 교사-아동 상호작용",
+        context: str = "교사-아동 상호작용",
+        include_summary: bool = False
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        다섯 가지 분석을 동시에 실행합니다 (동기 호출용).
+        
+        Returns:
+            Dict: 분석 유형별 결과 ('comprehensive', 'quick_feedback' 등)
+        """
+        return self._run_sync(self.a_run_all_analyses(
+            transcript, speaker_segments, teacher_child_info,
+            sentiment_data, situation, context, include_summary
+        ))
+    
+    async def a_run_all_analyses(
+        self,
+        transcript: str,
+        speaker_segments: List[Dict[str, Any]],
+        teacher_child_info: Dict[str, Any],
+        sentiment_data: Optional[List[Dict[str, Any]]] = None,
+        situation: str = "일반적인 교사-아동 상호작용",
+        context: str = "교사-아동 상호작용",
+        include_summary: bool = False
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        서로 독립적인 다섯 가지 분석을 asyncio.gather로 동시에 실행합니다.
+        
+        전체 소요 시간이 각 호출 시간의 합이 아니라 가장 느린 호출 시간에 가까워집니다.
+        
+        Args:
+            transcript: 전체 대화 전사본
+            speaker_segments: 화자별 발화 구간
+            teacher_child_info: 교사/아동 구분 정보
+            sentiment_data: 감정 분석 결과
+            situation: 코칭 팁에 사용할 상황 설명
+            context: 감정 해석에 사용할 대화 맥락
+            include_summary: True이면 성공한 결과들로 요약 리포트까지 생성 ('summary_report' 키)
+            
+        Returns:
+            Dict: 분석 유형별 결과 ('comprehensive', 'quick_feedback' 등)
+        """
+        logger.info("전체 분석 동시 실행 시작")
+        child_segments = self._select_child_segments(speaker_segments, teacher_child_info)
+        
+        # 전사본 전처리와 화자/감정 정보 포맷은 한 번만 하고 모든 분석에 공유
+        transcript = await self._a_prep_transcript(transcript, speaker_segments)
+        session = self._session_context(teacher_child_info, sentiment_data)
+        
+        results = await asyncio.gather(
+            self.a_analyze_conversation(
+                transcript, speaker_segments, teacher_child_info, sentiment_data, session=session
+            ),
+            self.a_get_quick_feedback(transcript, session=session),
+            self.a_analyze_child_development(transcript, child_segments, session=session),
+            self.a_get_coaching_tips(transcript, situation, session=session),
+            self.a_interpret_sentiment(sentiment_data or [], context, session=session)
+        )
+        
+        logger.info("전체 분석 동시 실행 완료")
+        all_results = dict(zip(ANALYSIS_TYPES, results))
+        
+        # 요약 리포트는 다른 분석 결과에 의존하므로 마지막에 실행
+        if include_summary:
+            all_results["summary_report"] = await self._a_summary_result({
+                analysis_type: result
+                for analysis_type, result in all_results.items()
+                if result.get("success")
+            })
+        
+        return all_results
+    
+    def analyze_all_fused(
+        self,
+        transcript: str,
+        speaker_segments: List[Dict[str, Any]],
+        teacher_child_info: Dict[str, Any],
+        sentiment_data: Optional[List[Dict[str, Any]]] = None,
+        situation: str = "일반적인 교사-아동 상호작용",
+        context: str = "교사-아동 상호작용"
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        다섯 가지 분석을 하나의 요청으로 실행합니다 (동기 호출용).
+        
+        Returns:
+            Dict: run_all_analyses와 같은 형식의 분석 유형별 결과
+        """
+        return self._run_sync(self.a_analyze_all_fused(
+            transcript, speaker_segments, teacher_child_info, sentiment_data, situation, context
+        ))
+    
+    async def a_analyze_all_fused(
+        self,
+        transcript: str,
+        speaker_segments: List[Dict[str, Any]],
+        teacher_child_info: Dict[str, Any],
+        sentiment_data: Optional[List[Dict[str, Any]]] = None,
+        situation: str = "일반적인 교사-아동 상호작용",
+        context: str = "교사-아동 상호작용"
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        다섯 가지 분석 지시문과 공통 자료를 한 프롬프트로 묶어 한 번만 호출합니다.
+        
+        전사본을 다섯 번 보내지 않으므로 프롬프트 토큰과 왕복 시간이 줄어듭니다.
+        응답은 분석 유형별 키를 가진 JSON 스키마로 받아 run_all_analyses와 같은 형식으로 나눕니다.
+        
+        Returns:
+            Dict: 분석 유형별 결과 ('comprehensive', 'quick_feedback' 등)
+        """
+        logger.info("통합 분석 시작")
+        
+        try:
+            await self._a_refresh_templates()
+            child_segments = self._select_child_segments(speaker_segments, teacher_child_info)
+            transcript = await self._a_prep_transcript(transcript, speaker_segments)
+            session = self._session_context(teacher_child_info, sentiment_data)
+            prompt = self._build_fused_prompt(transcript, child_segments, session, situation, context)
+            params = GENERATION_PARAMS["fused_analysis"]
+            
+            start_time = time.perf_counter()
+            response = await self._a_cached_chat(
+                session.system_message("fused_analysis"),
+                prompt,
+                temperature=params["temperature"],
+                max_tokens=params["max_tokens"],
+                response_format=FUSED_RESPONSE_FORMAT
+            )
+            processing_time = time.perf_counter() - start_time
+            
+            sections = self._parse_json_output(response["content"])
+            if sections is None:
+                raise ValueError("통합 분석 응답을 JSON으로 파싱할 수 없습니다.")
+        except Exception as e:
+            error = self._prompt_error(e, "analysis", "통합 분석")["error"]
+            return {
+                analysis_type: {"success": False, "error": error, result_key: None}
+                for analysis_type, result_key in FUSED_RESULT_KEYS.items()
+            }
+        
+        usage = response["usage"]
+        log_api_call(
+            service="OpenAI",
+            endpoint="chat/completions",
+            duration=processing_time,
+            status="success",
+            model=self.model,
+            analysis_type="fused_analysis",
+            prompt_tokens=usage["prompt_tokens"],
+            completion_tokens=usage["completion_tokens"],
+            total_tokens=usage["total_tokens"]
+        )
+        
+        extras = {
+            "comprehensive": {"analysis_type": "comprehensive"},
+            "quick_feedback": {"feedback_type": "quick"},
+            "child_development": {"child_utterance_count": len(child_segments)},
+            "coaching_tips": {"situation": situation},
+            "sentiment_interpretation": {}
+        }
+        processed_at = datetime.now().isoformat()
+        results: Dict[str, Dict[str, Any]] = {}
+        for analysis_type, result_key in FUSED_RESULT_KEYS.items():
+            content = sections.get(analysis_type)
+            if not isinstance(content, str) or not content.strip():
+                results[analysis_type] = {
+                    "success": False,
+                    "error": f"통합 분석 응답에 '{analysis_type}' 결과가 없습니다.",
+                    result_key: None
+                }
+                continue
+            results[analysis_type] = {
+                "success": True,
+                result_key: content,
+                **extras[analysis_type],
+                "processed_at": processed_at,
+                "model_used": self.model,
+                "prompt_version": PROMPT_VERSION,
+                "processing_time_seconds": processing_time,
+                # 다섯 결과가 한 요청을 공유하므로 사용량은 요청 전체 기준
+                "token_usage": dict(usage),
+                "fused": True
+            }
+        
+        logger.info("통합 분석 완료 (처리 시간: %.2f초, 총 %s토큰)", processing_time, usage["total_tokens"])
+        return results
+    
+    def _build_fused_prompt(
+        self,
+        transcript: str,
+        child_segments: List[Dict[str, Any]],
+        session: SessionContext,
+        situation: str,
+        context: str
+    ) -> str:
+        """
+        통합 분석 프롬프트를 구성합니다 (고정 지시문이 앞, 공통 자료가 뒤).
+        
+        교사/아동 정보는 시스템 메시지의 세션 통계로 전달하므로 공통 자료에서 뺍니다.
+        """
+        if self._fused_instructions is None:
+            raise ValueError("통합 분석에 필요한 프롬프트를 찾을 수 없습니다.")
+        
+        return f"""{self._fused_instructions}
+# 공통 자료
+
+## 대화 내용
+{transcript}
+
+## 아동 발화
+{self._format_child_utterances(child_segments)}
+
+## 감정 분석 결과
+{session.sentiment_analysis}
+
+## 상황
+{situation}
+
+## 대화 맥락
+{context}
+"""
+    
+    async def _a_prep_transcript(
+        self,
+        transcript: str,
+        speaker_segments: Optional[List[Dict[str, Any]]] = None
+    ) -> str:
+        """
+        프롬프트 토큰을 줄이기 위해 전사본을 전처리합니다.
+        
+        공백과 간투사를 정리하고, 예산보다 길면 구간별로 나눠 병렬로 요약합니다.
+        화자 구간이 있으면 구간 경계에서 나눈 요약에 인식 신뢰도가 높은 발화 원문을 덧붙이고,
+        없으면 앞/뒤는 원문 그대로 두고 중간 부분만 요약합니다.
+        
+        요약은 API를 추가로 호출하므로 공개 분석 메서드의 입구에서 한 번만 실행하고,
+        프롬프트 구성 함수 안에서는 부르지 않습니다.
+        """
+        text = _normalize_transcript(transcript)
+        tokens = self._count_tokens(text)
+        if tokens <= TRANSCRIPT_TOKEN_BUDGET:
+            return text
+        
+        if speaker_segments:
+            logger.info("전사본이 예산을 초과하여 화자 구간 단위로 요약 (%s토큰, 구간 %s개)", tokens, len(speaker_segments))
+            units = [
+                f"화자 {seg.get('speaker', '?')}: {_normalize_transcript(seg['text'])}"
+                for seg in speaker_segments
+                if seg.get("text")
+            ]
+            summary = await self._a_chunk_summarize(units)
+            excerpts = self._key_excerpts(speaker_segments)
+            return f"[구간별 대화 요약]\n{summary}\n\n[주요 발화 원문]\n{excerpts}"
+        
+        # 앞/뒤 각각 예산의 일정 비율만큼을 글자 수로 환산해 원문 유지
+        keep = int(len(text) * TRANSCRIPT_TOKEN_BUDGET * TRANSCRIPT_KEEP_RATIO / tokens)
+        head, middle, tail = text[:keep], text[keep:-keep], text[-keep:]
+        logger.info("전사본이 예산을 초과하여 중간 부분 요약 (%s토큰 -> 중간 %s자 요약)", tokens, len(middle))
+        
+        summary = await self._a_chunk_summarize(_SENTENCE_END_RE.split(middle))
+        return f"{head}\n\n[중략 - 중간 대화 요약]\n{summary}\n\n{tail}"
+    
+    def _prep_transcript(
+        self,
+        transcript: str,
+        speaker_segments: Optional[List[Dict[str, Any]]] = None
+    ) -> str:
+        """_a_prep_transcript의 동기 버전입니다."""
+        return self._run_sync(self._a_prep_transcript(transcript, speaker_segments))
+    
+    async def _a_chunk_summarize(
+        self,
+        units: List[str],
+        chunk_tokens: int = TRANSCRIPT_CHUNK_TOKENS,
+        overlap: int = TRANSCRIPT_CHUNK_OVERLAP
+    ) -> str:
+        """
+        발화/문장 목록을 토큰 크기별 구간으로 묶어 동시에 요약하고 순서대로 이어 붙입니다.
+        
+        모든 구간이 같은 시스템 메시지를 쓰므로 프롬프트 캐시 접두부를 공유합니다.
+        """
+        chunks = self._split_chunks(units, chunk_tokens, overlap)
+        params = GENERATION_PARAMS["transcript_summary"]
+        # 분석 요청과 별개로 구간 수만큼 API를 더 호출하므로 비용이 드러나도록 기록
+        logger.info("전사본 요약을 위해 구간마다 API를 추가 호출 (최대 %s회, 캐시 적중 시 생략)", len(chunks))
+        
+        async def summarize(chunk: str) -> Optional[Dict[str, Any]]:
+            try:
+                return await self._a_cached_chat(
+                    SYSTEM_MESSAGES["transcript_summary"],
+                    TRANSCRIPT_SUMMARY_PROMPT.format(chunk=chunk),
+                    temperature=params["temperature"],
+                    max_tokens=TRANSCRIPT_CHUNK_SUMMARY_TOKENS
+                )
+            except openai.APIError as e:
+                logger.warning("전사본 구간 요약 실패, 해당 구간을 생략합니다: %s", e)
+                return None
+        
+        start_time = time.perf_counter()
+        responses = await asyncio.gather(*(summarize(chunk) for chunk in chunks))
+        called = [r for r in responses if r is not None and not r["cached"]]
+        if called:
+            log_api_call(
+                service="OpenAI",
+                endpoint="chat/completions",
+                duration=time.perf_counter() - start_time,
+                status="success",
+                model=self.model,
+                analysis_type="transcript_summary",
+                request_count=len(called),
+                prompt_tokens=sum(r["usage"]["prompt_tokens"] for r in called),
+                completion_tokens=sum(r["usage"]["completion_tokens"] for r in called),
+                total_tokens=sum(r["usage"]["total_tokens"] for r in called)
+            )
+        logger.info("전사본 구간 요약 완료 (구간 %s개, API 호출 %s회)", len(chunks), len(called))
+        return "\n".join(r["content"] if r is not None else "(구간 생략)" for r in responses)
+    
+    def _split_chunks(self, units: List[str], chunk_tokens: int, overlap: int) -> List[str]:
+        """
+        발화/문장 경계를 지키며 chunk_tokens 이하의 구간으로 묶습니다.
+        
+        구간 사이의 맥락이 끊기지 않도록 이전 구간 끝의 overlap 토큰만큼을 다음 구간 앞에 반복합니다.
+        """
+        chunks: List[str] = []
+        current: List[Tuple[str, int]] = []
+        size = 0
+        
+        for unit in units:
+            tokens = self._count_tokens(unit)
+            if tokens > chunk_tokens:
+                # 경계 없이 너무 긴 단위는 글자 수로 환산해 잘라서 처리
+                step = max(1, len(unit) * chunk_tokens // tokens)
+                pieces = [unit[i:i + step] for i in range(0, len(unit), step)]
+            else:
+                pieces = [unit]
+            
+            for piece in pieces:
+                piece_tokens = tokens if len(pieces) == 1 else self._count_tokens(piece)
+                if current and size + piece_tokens > chunk_tokens:
+                    chunks.append("\n".join(text for text, _ in current))
+                    kept: List[Tuple[str, int]] = []
+                    kept_size = 0
+                    for item in reversed(current):
+                        if kept_size + item[1] > overlap:
+                            break
+                        kept.append(item)
+                        kept_size += item[1]
+                    current, size = kept[::-1], kept_size
+                current.append((piece, piece_tokens))
+                size += piece_tokens
+        
+        if current:
+            chunks.append("\n".join(text for text, _ in current))
+        return chunks
+    
+    def _key_excerpts(
+        self,
+        speaker_segments: List[Dict[str, Any]],
+        budget: int = TRANSCRIPT_EXCERPT_TOKENS
+    ) -> str:
+        """인식 신뢰도가 높은 발화를 토큰 예산만큼 골라 시간 순서대로 원문 그대로 반환합니다."""
+        ranked = sorted(
+            (seg for seg in speaker_segments if seg.get("text")),
+            key=lambda seg: seg.get("confidence", 0),
+            reverse=True
+        )
+        
+        chosen: List[Dict[str, Any]] = []
+        used = 0
+        for seg in ranked:
+            tokens = self._count_tokens(seg["text"])
+            if used + tokens > budget:
+                continue
+            chosen.append(seg)
+            used += tokens
+        
+        chosen.sort(key=lambda seg: seg.get("start_time", 0))
+        return "\n".join(
+            f"[{seg.get('start_time', 0):.1f}s] 화자 {seg.get('speaker', '?')}: {seg['text']}"
+            for seg in chosen
+        )
+    
+    def _select_child_segments(
+        self,
+        speaker_segments: List[Dict[str, Any]],
+        teacher_child_info: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """아동 화자의 발화 구간을 고릅니다. 찾지 못하면 전체 구간을 사용합니다."""
+        child_speaker = teacher_child_info.get("child")
+        child_segments = [seg for seg in speaker_segments if seg.get("speaker") == child_speaker]
+        if not child_segments:
+            logger.info("아동 구간을 찾을 수 없어 전체 구간으로 발달 분석을 진행합니다")
+            return speaker_segments
+        return child_segments
+    
+    async def a_analyze_conversation(
+        self,
+        transcript: str,
+        speaker_segments: List[Dict[str, Any]],
+        teacher_child_info: Dict[str, Any],
+        sentiment_data: Optional[List[Dict[str, Any]]] = None,
+        session: Optional[SessionContext] = None
+    ) -> Dict[str, Any]:
+        """
+        analyze_conversation의 비동기 버전입니다.
+        
+        session을 넘기는 호출부(a_run_all_analyses)는 전처리한 전사본을 넘기므로 다시 전처리하지 않습니다.
+        """
+        if session is None:
+            transcript = await self._a_prep_transcript(transcript, speaker_segments)
+        return await self._a_run_prompt(
+            "conversation_analysis",
+            lambda: self._build_conversation_prompt(transcript, teacher_child_info, sentiment_data, session),
+            result_key="analysis",
+            label="종합 분석",
+            extra={"analysis_type": "comprehensive"},
+            session=session
+        )
+    
+    async def a_get_quick_feedback(
+        self,
+        transcript: str,
+        session: Optional[SessionContext] = None
+    ) -> Dict[str, Any]:
+        """get_quick_feedback의 비동기 버전입니다 (session이 있으면 전처리 생략)."""
+        if session is None:
+            transcript = await self._a_prep_transcript(transcript)
+        return await self._a_run_prompt(
+            "quick_feedback",
+            lambda: self._build_quick_feedback_prompt(transcript),
+            result_key="feedback",
+            label="빠른 피드백",
+            extra={"feedback_type": "quick"},
+            session=session
+        )
+    
+    async def a_analyze_child_development(
+        self,
+        transcript: str,
+        child_segments: List[Dict[str, Any]],
+        session: Optional[SessionContext] = None
+    ) -> Dict[str, Any]:
+        """analyze_child_development의 비동기 버전입니다 (session이 있으면 전처리 생략)."""
+        if session is None:
+            transcript = await self._a_prep_transcript(transcript)
+        return await self._a_run_prompt(
+            "child_development",
+            lambda: self._build_child_development_prompt(transcript, child_segments),
+            result_key="development_analysis",
+            label="발달 분석",
+            extra={"child_utterance_count": len(child_segments)},
+            session=session
+        )
+    
+    async def a_get_coaching_tips(
+        self,
+        transcript: str,
+        situation: str = "일반적인 교사-아동 상호작용",
+        session: Optional[SessionContext] = None
+    ) -> Dict[str, Any]:
+        """get_coaching_tips의 비동기 버전입니다 (session이 있으면 전처리 생략)."""
+        if session is None:
+            transcript = await self._a_prep_transcript(transcript)
+        return await self._a_run_prompt(
+            "coaching_tips",
+            lambda: self._build_coaching_tips_prompt(transcript, situation),
+            result_key="coaching_tips",
+            label="코칭 팁",
+            extra={"situation": situation},
+            session=session
+        )
+    
+    async def a_interpret_sentiment(
+        self,
+        sentiment_data: List[Dict[str, Any]],
+        context: str,
+        session: Optional[SessionContext] = None
+    ) -> Dict[str, Any]:
+        """interpret_sentiment의 비동기 버전입니다."""
+        return await self._a_run_prompt(
+            "sentiment_interpretation",
+            lambda: self._build_sentiment_prompt(sentiment_data, context, session),
+            result_key="sentiment_interpretation",
+            label="감정 해석",
+            session=session
+        )
+    
+    def _run_prompt(
+        self,
+        prompt_id: str,
+        build_prompt: Callable[[], str],
+        result_key: str,
+        label: str,
+        extra: Optional[Dict[str, Any]] = None,
+        structured: bool = False,
+        json_key: Optional[str] = None,
+        session: Optional[SessionContext] = None
+    ) -> Dict[str, Any]:
+        """
+        프롬프트를 구성하고 호출한 뒤 공통 형식의 결과를 반환합니다.
+        
+        모든 동기 분석 메서드가 이 경로를 거치므로 템플릿 갱신, 응답 캐시,
+        재시도, 토큰 예산이 한 곳에서 적용됩니다.
+        
+        Args:
+            prompt_id: 프롬프트 ID (시스템 메시지/생성 파라미터 조회용)
+            build_prompt: 사용자 프롬프트를 만드는 함수
+            result_key: 결과 본문을 담을 키
+            label: 로그/오류 메시지에 사용할 분석 이름
+            extra: 결과에 추가할 필드
+            structured: True이면 JSON 모드로 호출
+            json_key: 구조화 모드에서 파싱 결과를 담을 키
+            session: 세션 통계를 시스템 메시지에 넣을 세션 컨텍스트
+        """
+        logger.info("%s 분석 시작", label)
+        
+        try:
+            self._refresh_templates()
+            prompt = build_prompt()
+            system, params, response_format = self._generation_settings(prompt_id, structured, session)
+            
+            start_time = time.perf_counter()
+            response = self._cached_chat(
+                system,
+                prompt,
+                temperature=params["temperature"],
+                max_tokens=params["max_tokens"],
+                response_format=response_format
+            )
+            processing_time = time.perf_counter() - start_time
+            if not structured and not response["cached"]:
+                self._record_completion(prompt_id, response, params["max_tokens"])
+            
+            result = self._prompt_result(
+                prompt_id, response, processing_time, result_key, extra,
+                json_key if structured else None
+            )
+            logger.info("%s 분석 완료 (처리 시간: %.2f초)", label, processing_time)
+            return result
+            
+        except Exception as e:
+            return self._prompt_error(e, result_key, label)
+    
+    async def _a_run_prompt(
+        self,
+        prompt_id: str,
+        build_prompt: Callable[[], str],
+        result_key: str,
+        label: str,
+        extra: Optional[Dict[str, Any]] = None,
+        structured: bool = False,
+        json_key: Optional[str] = None,
+        session: Optional[SessionContext] = None
+    ) -> Dict[str, Any]:
+        """_run_prompt의 비동기 버전입니다 (AsyncOpenAI 사용)."""
+        logger.info("%s 비동기 분석 시작", label)
+        
+        try:
+            await self._a_refresh_templates()
+            prompt = build_prompt()
+            system, params, response_format = self._generation_settings(prompt_id, structured, session)
+            
+            start_time = time.perf_counter()
+            response = await self._a_cached_chat(
+                system,
+                prompt,
+                temperature=params["temperature"],
+                max_tokens=params["max_tokens"],
+                response_format=response_format
+            )
+            processing_time = time.perf_counter() - start_time
+            if not structured and not response["cached"]:
+                self._record_completion(prompt_id, response, params["max_tokens"])
+            
+            result = self._prompt_result(
+                prompt_id, response, processing_time, result_key, extra,
+                json_key if structured else None
+            )
+            logger.info("%s 비동기 분석 완료 (처리 시간: %.2f초)", label, processing_time)
+            return result
+            
+        except Exception as e:
+            return self._prompt_error(e, result_key, label)
+    
+    def _prompt_result(
+        self,
+        prompt_id: str,
+        response: Dict[str, Any],
+        processing_time: float,
+        result_key: str,
+        extra: Optional[Dict[str, Any]],
+        json_key: Optional[str]
+    ) -> Dict[str, Any]:
+        """API 호출을 기록하고 공통 형식의 성공 결과를 만듭니다."""
+        usage = response["usage"]
+        log_api_call(
+            service="OpenAI",
+            endpoint="chat/completions",
+            duration=processing_time,
+            status="success",
+            model=self.model,
+            analysis_type=prompt_id,
+            prompt_tokens=usage["prompt_tokens"],
+            completion_tokens=usage["completion_tokens"],
+            total_tokens=usage["total_tokens"]
+        )
+        
+        result = {
+            "success": True,
+            result_key: response["content"],
+            **(extra or {}),
+            "processed_at": datetime.now().isoformat(),
+            "model_used": self.model,
+            "prompt_version": PROMPT_VERSION,
+            "processing_time_seconds": processing_time,
+            "token_usage": usage
+        }
+        if json_key:
+            result[json_key] = self._parse_json_output(response["content"])
+        return result
+    
+    @staticmethod
+    def _prompt_error(error: Exception, result_key: str, label: str) -> Dict[str, Any]:
+        """예외를 기록하고 공통 형식의 실패 결과를 만듭니다."""
+        if isinstance(error, openai.APIError):
+            message = f"OpenAI API 호출 실패 ({label}): {str(error)}"
+            logger.error(message)
+        else:
+            message = f"{label} 중 오류 발생: {str(error)}"
+            logger.error(message)
+            logger.exception("상세 오류 정보:")
+        return {
+            "success": False,
+            "error": message,
+            result_key: None
+        }
+    
+    def _generation_settings(
+        self,
+        prompt_id: str,
+        structured: bool = False,
+        session: Optional[SessionContext] = None
+    ) -> Tuple[str, Dict[str, Any], Optional[Dict[str, Any]]]:
+        """
+        시스템 메시지, 생성 파라미터, 응답 형식을 반환합니다.
+        
+        session이 있으면 세션 통계가 들어간 시스템 메시지를 씁니다.
+        구조화 모드에서는 JSON 스키마 안내를 시스템 메시지 뒤에 붙여
+        고정된 접두부에 두고, 낮은 온도와 작은 토큰 상한을 사용합니다.
+        """
+        system = session.system_message(prompt_id) if session is not None else SYSTEM_MESSAGES[prompt_id]
+        if not structured:
+            params = GENERATION_PARAMS[prompt_id]
+            return (
+                system,
+                {"temperature": params["temperature"], "max_tokens": self._adaptive_max_tokens(prompt_id)},
+                None
+            )
+        system += STRUCTURED_OUTPUT_INSTRUCTIONS[prompt_id]
+        return system, STRUCTURED_GENERATION_PARAMS, JSON_RESPONSE_FORMAT
+    
+    def _adaptive_max_tokens(self, prompt_id: str) -> int:
+        """
+        최근 응답의 출력 토큰 p99에 10% 여유를 더한 max_tokens를 반환합니다.
+        
+        표본이 부족하면 설정값을 쓰고, 설정값보다 커지지는 않습니다.
+        """
+        configured = GENERATION_PARAMS[prompt_id]["max_tokens"]
+        with self._samples_lock:
+            samples = self._completion_samples.get(prompt_id)
+            if samples is None or len(samples) < COMPLETION_MIN_SAMPLES:
+                return configured
+            ordered = sorted(samples)
+        p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+        return min(configured, max(1, math.ceil(p99 * COMPLETION_HEADROOM)))
+    
+    def _record_completion(self, prompt_id: str, response: Dict[str, Any], max_tokens: int):
+        """
+        실제 출력 토큰 수를 표본에 기록합니다.
+        
+        max_tokens에서 잘린 응답은 실제 길이를 알 수 없으므로, 경고를 남기고
+        표본을 비워 다음 호출부터 설정값으로 돌아가게 합니다.
+        """
+        if response.get("finish_reason") == "length":
+            logger.warning("%s 응답이 max_tokens(%d)에 도달해 잘렸습니다 - 출력 길이 표본 초기화", prompt_id, max_tokens)
+            with self._samples_lock:
+                self._completion_samples.pop(prompt_id, None)
+            return
+        if not response["usage"]["completion_tokens"]:
+            # 사용량 청크 없이 끝난 스트림은 0으로 기록되므로 p99를 끌어내리지 않게 제외
+            return
+        with self._samples_lock:
+            samples = self._completion_samples.get(prompt_id)
+            if samples is None:
+                samples = self._completion_samples[prompt_id] = deque(maxlen=COMPLETION_SAMPLE_SIZE)
+            samples.append(response["usage"]["completion_tokens"])
+    
+    @staticmethod
+    def _parse_json_output(content: str) -> Optional[Dict[str, Any]]:
+        """JSON 모드 응답을 파싱합니다. 실패하면 None을 반환합니다."""
+        try:
+            return json.loads(content)
+        except (TypeError, ValueError) as e:
+            logger.warning("JSON 응답 파싱 실패: %s", e)
+            return None
+    
+    def _build_conversation_prompt(
+        self,
+        transcript: str,
+        teacher_child_info: Dict[str, Any],
+        sentiment_data: Optional[List[Dict[str, Any]]],
+        session: Optional[SessionContext] = None
+    ) -> str:
+        """
+        종합 분석 프롬프트를 구성합니다.
+        
+        session이 있으면 포맷 결과를 재사용하고, 교사/아동 정보는 시스템 메시지의
+        세션 통계로 전달되므로 프롬프트에는 참조 문구만 넣습니다.
+        """
+        if session is None:
+            session = self._session_context(teacher_child_info, sentiment_data)
+            teacher_info, child_info = session.teacher_info, session.child_info
+        else:
+            teacher_info = child_info = SESSION_STATS_REFERENCE
+        
+        render_prompt = self._templates.get("conversation_analysis")
+        if render_prompt is None:
+            logger.error("종합 분석 프롬프트를 찾을 수 없습니다.")
+            raise ValueError("종합 분석 프롬프트를 찾을 수 없습니다.")
+        
+        logger.info("프롬프트 구성 중...")
+        prompt = render_prompt(
+            transcript=transcript,
+            teacher_info=teacher_info,
+            child_info=child_info,
+            sentiment_analysis=session.sentiment_analysis
+        )
+        logger.info("최종 프롬프트 길이: %s자", len(prompt))
+        return prompt
+    
+    def _build_quick_feedback_prompt(self, transcript: str) -> str:
+        """빠른 피드백 프롬프트를 구성합니다."""
+        render_prompt = self._templates.get("quick_feedback")
+        if render_prompt is None:
+            logger.error("빠른 피드백 프롬프트를 찾을 수 없습니다.")
+            raise ValueError("빠른 피드백 프롬프트를 찾을 수 없습니다.")
+        
+        prompt = render_prompt(transcript=transcript)
+        logger.info("빠른 피드백 프롬프트 길이: %s자", len(prompt))
+        return prompt
+    
+    def _build_child_development_prompt(self, transcript: str, child_segments: List[Dict[str, Any]]) -> str:
+        """아동 발달 분석 프롬프트를 구성합니다."""
+        child_utterances = self._format_child_utterances(child_segments)
+        
+        render_prompt = self._templates.get("child_development")
+        if render_prompt is None:
+            raise ValueError("아동 발달 분석 프롬프트를 찾을 수 없습니다.")
+        
+        return render_prompt(
+            transcript=transcript,
+            child_utterances=child_utterances
+        )
+    
+    @staticmethod
+    def _format_child_utterances(child_segments: List[Dict[str, Any]]) -> str:
+        """아동 발화만 시간과 함께 한 줄씩 나열합니다."""
+        return "\n".join(
+            f"[{seg['start_time']:.1f}s] {seg['text']}"
+            for seg in child_segments
+        )
+    
+    def _build_coaching_tips_prompt(self, transcript: str, situation: str) -> str:
+        """코칭 팁 프롬프트를 구성합니다."""
+        render_prompt = self._templates.get("coaching_tips")
+        if render_prompt is None:
+            raise ValueError("코칭 팁 프롬프트를 찾을 수 없습니다.")
+        
+        return render_prompt(
+            situation=situation,
+            transcript=transcript
+        )
+    
+    def _build_sentiment_prompt(
+        self,
+        sentiment_data: List[Dict[str, Any]],
+        context: str,
+        session: Optional[SessionContext] = None
+    ) -> str:
+        """감정 해석 프롬프트를 구성합니다 (session이 있으면 포맷 결과 재사용)."""
+        if session is not None:
+            sentiment_formatted = session.sentiment_analysis
+        else:
+            sentiment_formatted = self._format_sentiment_data(sentiment_data)
+        
+        render_prompt = self._templates.get("sentiment_interpretation")
+        if render_prompt is None:
+            raise ValueError("감정 해석 프롬프트를 찾을 수 없습니다.")
+        
+        return render_prompt(
+            sentiment_data=sentiment_formatted,
+            context=context
+        )
+    
     def analyze_conversation(
         self, 
         transcript: str, 
         speaker_segments: List[Dict[str, Any]],
         teacher_child_info: Dict[str, Any],
-        sentiment_data: Optional[List[Dict[str, Any]]] = None
+        sentiment_data: Optional[List[Dict[str, Any]]] = None,
+        structured: bool = False
     ) -> Dict[str, Any]:
         """
         교사-아동 대화를 종합적으로 분석합니다.
@@ -62,156 +1686,434 @@ class AIAnalyzer:
             speaker_segments: 화자별 발화 구간
             teacher_child_info: 교사/아동 구분 정보
             sentiment_data: 감정 분석 결과
+            structured: True이면 JSON 형식으로 받아 'analysis_json'에 파싱 결과를 담음
+            
+        Returns:
+            Dict: 분석 결과와 코칭 피드백
+        """
+        logger.info("전사본 길이: %s자", len(transcript))
+        logger.info("화자 구간 수: %s개", len(speaker_segments))
+        logger.info("교사-아동 정보: %s", teacher_child_info.get('is_teacher_child', False))
+        
+        transcript = self._prep_transcript(transcript, speaker_segments)
+        return self._run_prompt(
+            "conversation_analysis",
+            lambda: self._build_conversation_prompt(transcript, teacher_child_info, sentiment_data),
+            result_key="analysis",
+            label="종합 분석",
+            extra={"analysis_type": "comprehensive"},
+            structured=structured,
+            json_key="analysis_json"
+        )
+    
+    def get_quick_feedback(self, transcript: str) -> Dict[str, Any]:
+        """
+        빠른 피드백을 제공합니다.
+        
+        Args:
+            transcript: 대화 전사본
+            
+        Returns:
+            Dict: 간단한 피드백 결과
+        """
+        logger.info("전사본 길이: %s자", len(transcript))
+        
+        transcript = self._prep_transcript(transcript)
+        return self._run_prompt(
+            "quick_feedback",
+            lambda: self._build_quick_feedback_prompt(transcript),
+            result_key="feedback",
+            label="빠른 피드백",
+            extra={"feedback_type": "quick"}
+        )
+    
+    def _stream_prompt(
+        self,
+        prompt_id: str,
+        build_prompt: Callable[[], str],
+        result_key: str,
+        label: str,
+        extra: Optional[Dict[str, Any]] = None,
+        result: Optional[Dict[str, Any]] = None
+    ) -> Iterator[str]:
+        """
+        프롬프트 하나를 스트리밍으로 실행합니다 (공통 처리).
+        
+        Args:
+            prompt_id: 프롬프트/생성 파라미터 ID
+            build_prompt: 사용자 프롬프트를 만드는 함수
+            result_key: 결과 dict에서 응답 텍스트를 담을 키
+            label: 로그/오류 메시지에 쓰는 분석 이름
+            extra: 성공 결과에 추가할 항목
+            result: 전달하면 스트림 종료 후 _run_prompt와 같은 형식의 결과로 채워짐
             
-        Returns:
-            Dict: 분석 결과와 코칭 피드백
+        Yields:
+            str: 도착한 응답 텍스트 조각
         """
-        logger.info("종합 대화 분석 시작")
-        logger.info(f"전사본 길이: {len(transcript)}자")
-        logger.info(f"화자 구간 수: {len(speaker_segments)}개")
-        logger.info(f"교사-아동 정보: {teacher_child_info.get('is_teacher_child', False)}")
+        logger.info("%s 스트리밍 시작", label)
+        start_time = time.perf_counter()
         
         try:
-            # 교사와 아동 정보 준비
-            logger.info("화자 정보 포맷팅 중...")
-            teacher_info = self._format_speaker_info(
-                teacher_child_info.get("teacher_stats", {}), 
-                "교사"
-            )
-            child_info = self._format_speaker_info(
-                teacher_child_info.get("child_stats", {}), 
-                "아동"
-            )
-            logger.info(f"교사 정보 길이: {len(teacher_info)}자")
-            logger.info(f"아동 정보 길이: {len(child_info)}자")
-            
-            # 감정 분석 정보 포맷
-            sentiment_analysis = self._format_sentiment_data(sentiment_data)
-            logger.info(f"감정 분석 데이터: {len(sentiment_analysis)}자")
-            
-            # 프롬프트 구성
-            logger.info("프롬프트 템플릿 로드 중...")
-            prompt_template = self.prompt_manager.get_prompt("conversation_analysis")
-            if not prompt_template:
-                logger.error("종합 분석 프롬프트를 찾을 수 없습니다.")
-                raise ValueError("종합 분석 프롬프트를 찾을 수 없습니다.")
-            
-            logger.info("프롬프트 구성 중...")
-            prompt = prompt_template.format(
-                transcript=transcript,
-                teacher_info=teacher_info,
-                child_info=child_info,
-                sentiment_analysis=sentiment_analysis
-            )
-            logger.info(f"최종 프롬프트 길이: {len(prompt)}자")
-            
-            # GPT-4o-mini 분석 요청
-            logger.info("OpenAI API 호출 시작...")
-            start_time = datetime.now()
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "당신은 유아교육과 아동 심리학 분야의 전문가입니다. 교사들에게 따뜻하고 실용적인 코칭을 제공합니다."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=2000
-            )
-            
-            end_time = datetime.now()
-            processing_time = (end_time - start_time).total_seconds()
+            self._refresh_templates()
+            prompt = build_prompt()
+            system, params, _ = self._generation_settings(prompt_id)
+            max_tokens = self._budget(system + prompt, params["max_tokens"])
+            key = self._cache_key(system, prompt, params["temperature"], max_tokens)
             
-            # API 호출 로그
-            log_api_call(
-                service="OpenAI",
-                endpoint="chat/completions",
-                duration=processing_time,
-                status="success",
-                model=self.model,
-                prompt_tokens=response.usage.prompt_tokens,
-                completion_tokens=response.usage.completion_tokens,
-                total_tokens=response.usage.total_tokens
-            )
+            entry = self._cache_get(key)
+            if entry is not None:
+                logger.info("응답 캐시 적중 - API 호출 생략")
+                yield entry["content"]
+            else:
+                stream = self._chat(
+                    messages=[
+                        {"role": "system", "content": system},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=params["temperature"],
+                    max_tokens=max_tokens,
+                    extra_body={"prompt_cache_key": self._log_cache_key(system)},
+                    stop=RESPONSE_STOP,
+                    stream=True,
+                    stream_options={"include_usage": True}
+                )
+                
+                parts = []
+                usage = None
+                finish_reason = None
+                for chunk in stream:
+                    if chunk.usage is not None:
+                        usage = chunk.usage
+                    if chunk.choices:
+                        choice = chunk.choices[0]
+                        if choice.finish_reason:
+                            finish_reason = choice.finish_reason
+                        if choice.delta.content:
+                            parts.append(choice.delta.content)
+                            yield choice.delta.content
+                
+                entry = self._stream_cache_entry(parts, usage, finish_reason)
+                self._cache_put(key, entry)
+                self._record_completion(prompt_id, entry, params["max_tokens"])
             
-            logger.info(f"OpenAI API 응답 완료 (처리 시간: {processing_time:.2f}초)")
-            logger.info(f"토큰 사용량 - 프롬프트: {response.usage.prompt_tokens}, 완성: {response.usage.completion_tokens}, 총합: {response.usage.total_tokens}")
+            processing_time = time.perf_counter() - start_time
+            if result is not None:
+                result.update(self._prompt_result(
+                    prompt_id, {"content": entry["content"], "usage": dict(entry["usage"])},
+                    processing_time, result_key, extra, None
+                ))
+            logger.info("%s 스트리밍 완료 (처리 시간: %.2f초)", label, processing_time)
             
-            analysis_result = response.choices[0].message.content
-            logger.info(f"분석 결과 길이: {len(analysis_result)}자")
+        except Exception as e:
+            error = self._prompt_error(e, result_key, label)
+            if result is not None:
+                result.update(error)
+    
+    async def _a_stream_prompt(
+        self,
+        prompt_id: str,
+        build_prompt: Callable[[], str],
+        result_key: str,
+        label: str,
+        extra: Optional[Dict[str, Any]] = None,
+        result: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """_stream_prompt의 비동기 버전입니다 (AsyncOpenAI 사용)."""
+        logger.info("%s 비동기 스트리밍 시작", label)
+        start_time = time.perf_counter()
+        
+        try:
+            await self._a_refresh_templates()
+            prompt = build_prompt()
+            system, params, _ = self._generation_settings(prompt_id)
+            max_tokens = self._budget(system + prompt, params["max_tokens"])
+            key = self._cache_key(system, prompt, params["temperature"], max_tokens)
             
-            result = {
-                "success": True,
-                "analysis": analysis_result,
-                "analysis_type": "comprehensive",
-                "processed_at": datetime.now().isoformat(),
-                "model_used": self.model,
-                "processing_time_seconds": processing_time,
-                "token_usage": {
-                    "prompt_tokens": response.usage.prompt_tokens,
-                    "completion_tokens": response.usage.completion_tokens,
-                    "total_tokens": response.usage.total_tokens
-                }
-            }
+            entry = self._cache_get(key)
+            if entry is not None:
+                logger.info("응답 캐시 적중 - API 호출 생략")
+                yield entry["content"]
+            else:
+                stream = await self._achat(
+                    messages=[
+                        {"role": "system", "content": system},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=params["temperature"],
+                    max_tokens=max_tokens,
+                    extra_body={"prompt_cache_key": self._log_cache_key(system)},
+                    stop=RESPONSE_STOP,
+                    stream=True,
+                    stream_options={"include_usage": True}
+                )
+                
+                parts = []
+                usage = None
+                finish_reason = None
+                async for chunk in stream:
+                    if chunk.usage is not None:
+                        usage = chunk.usage
+                    if chunk.choices:
+                        choice = chunk.choices[0]
+                        if choice.finish_reason:
+                            finish_reason = choice.finish_reason
+                        if choice.delta.content:
+                            parts.append(choice.delta.content)
+                            yield choice.delta.content
+                
+                entry = self._stream_cache_entry(parts, usage, finish_reason)
+                self._cache_put(key, entry)
+                self._record_completion(prompt_id, entry, params["max_tokens"])
             
-            logger.info("종합 대화 분석 완료")
-            return result
+            processing_time = time.perf_counter() - start_time
+            if result is not None:
+                result.update(self._prompt_result(
+                    prompt_id, {"content": entry["content"], "usage": dict(entry["usage"])},
+                    processing_time, result_key, extra, None
+                ))
+            logger.info("%s 비동기 스트리밍 완료 (처리 시간: %.2f초)", label, processing_time)
             
-        except openai.APIError as e:
-            logger.error(f"OpenAI API 호출 실패 (종합 분석): {str(e)}")
-            return {
-                "success": False,
-                "error": f"OpenAI API 호출 실패 (종합 분석): {str(e)}",
-                "analysis": None
-            }
         except Exception as e:
-            logger.error(f"AI 분석 중 오류 발생: {str(e)}")
-            logger.exception("상세 오류 정보:")
-            return {
-                "success": False,
-                "error": f"AI 분석 중 오류 발생: {str(e)}",
-                "analysis": None
-            }
+            error = self._prompt_error(e, result_key, label)
+            if result is not None:
+                result.update(error)
     
-    def get_quick_feedback(self, transcript: str) -> Dict[str, Any]:
+    def stream_quick_feedback(
+        self,
+        transcript: str,
+        result: Optional[Dict[str, Any]] = None
+    ) -> Iterator[str]:
         """
-        빠른 피드백을 제공합니다.
+        빠른 피드백을 스트리밍으로 생성합니다 (st.write_stream 등에서 사용).
         
         Args:
             transcript: 대화 전사본
+            result: 전달하면 스트림 종료 후 get_quick_feedback과 같은 형식의 결과로 채워짐
+            
+        Yields:
+            str: 도착한 응답 텍스트 조각
+        """
+        transcript = self._prep_transcript(transcript)
+        return self._stream_prompt(
+            "quick_feedback",
+            lambda: self._build_quick_feedback_prompt(transcript),
+            result_key="feedback",
+            label="빠른 피드백",
+            extra={"feedback_type": "quick"},
+            result=result
+        )
+    
+    async def a_get_quick_feedback_stream(
+        self,
+        transcript: str,
+        result: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """stream_quick_feedback의 비동기 버전입니다."""
+        prepared = await self._a_prep_transcript(transcript)
+        async for delta in self._a_stream_prompt(
+            "quick_feedback",
+            lambda: self._build_quick_feedback_prompt(prepared),
+            result_key="feedback",
+            label="빠른 피드백",
+            extra={"feedback_type": "quick"},
+            result=result
+        ):
+            yield delta
+    
+    def stream_conversation_analysis(
+        self,
+        transcript: str,
+        teacher_child_info: Dict[str, Any],
+        sentiment_data: Optional[List[Dict[str, Any]]] = None,
+        result: Optional[Dict[str, Any]] = None,
+        speaker_segments: Optional[List[Dict[str, Any]]] = None
+    ) -> Iterator[str]:
+        """
+        종합 분석을 스트리밍으로 생성합니다.
+        
+        Args:
+            transcript: 전체 대화 전사본
+            teacher_child_info: 교사/아동 구분 정보
+            sentiment_data: 감정 분석 결과
+            result: 전달하면 스트림 종료 후 analyze_conversation과 같은 형식의 결과로 채워짐
+            speaker_segments: 화자별 발화 구간 (있으면 analyze_conversation과 같은 방식으로 전처리)
+            
+        Yields:
+            str: 도착한 응답 텍스트 조각
+        """
+        transcript = self._prep_transcript(transcript, speaker_segments)
+        return self._stream_prompt(
+            "conversation_analysis",
+            lambda: self._build_conversation_prompt(transcript, teacher_child_info, sentiment_data),
+            result_key="analysis",
+            label="종합 분석",
+            extra={"analysis_type": "comprehensive"},
+            result=result
+        )
+    
+    async def a_analyze_conversation_stream(
+        self,
+        transcript: str,
+        teacher_child_info: Dict[str, Any],
+        sentiment_data: Optional[List[Dict[str, Any]]] = None,
+        result: Optional[Dict[str, Any]] = None,
+        speaker_segments: Optional[List[Dict[str, Any]]] = None
+    ) -> AsyncIterator[str]:
+        """stream_conversation_analysis의 비동기 버전입니다."""
+        prepared = await self._a_prep_transcript(transcript, speaker_segments)
+        async for delta in self._a_stream_prompt(
+            "conversation_analysis",
+            lambda: self._build_conversation_prompt(prepared, teacher_child_info, sentiment_data),
+            result_key="analysis",
+            label="종합 분석",
+            extra={"analysis_type": "comprehensive"},
+            result=result
+        ):
+            yield delta
+    
+    def stream_coaching_tips(
+        self,
+        transcript: str,
+        situation: str = "일반적인 교사-아동 상호작용",
+        result: Optional[Dict[str, Any]] = None
+    ) -> Iterator[str]:
+        """
+        코칭 팁을 스트리밍으로 생성합니다.
+        
+        Args:
+            transcript: 대화 내용
+            situation: 상황 설명
+            result: 전달하면 스트림 종료 후 get_coaching_tips와 같은 형식의 결과로 채워짐
             
+        Yields:
+            str: 도착한 응답 텍스트 조각
+        """
+        transcript = self._prep_transcript(transcript)
+        return self._stream_prompt(
+            "coaching_tips",
+            lambda: self._build_coaching_tips_prompt(transcript, situation),
+            result_key="coaching_tips",
+            label="코칭 팁",
+            extra={"situation": situation},
+            result=result
+        )
+    
+    async def a_get_coaching_tips_stream(
+        self,
+        transcript: str,
+        situation: str = "일반적인 교사-아동 상호작용",
+        result: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """stream_coaching_tips의 비동기 버전입니다."""
+        prepared = await self._a_prep_transcript(transcript)
+        async for delta in self._a_stream_prompt(
+            "coaching_tips",
+            lambda: self._build_coaching_tips_prompt(prepared, situation),
+            result_key="coaching_tips",
+            label="코칭 팁",
+            extra={"situation": situation},
+            result=result
+        ):
+            yield delta
+    
+    def get_quick_feedback_many(self, transcripts: List[str]) -> List[Dict[str, Any]]:
+        """
+        여러 전사본의 빠른 피드백을 묶음 요청으로 생성합니다 (동기 호출용).
+        
         Returns:
-            Dict: 간단한 피드백 결과
+            List[Dict]: 입력 순서와 같은 순서의 get_quick_feedback 형식 결과
+        """
+        return self._run_sync(self.a_get_quick_feedback_many(transcripts))
+    
+    async def a_get_quick_feedback_many(self, transcripts: List[str]) -> List[Dict[str, Any]]:
+        """
+        여러 전사본을 몇 개씩 하나의 JSON 요청으로 묶어 빠른 피드백을 생성합니다.
+        
+        묶음들은 동시에 실행하며, 너무 긴 전사본이나 응답에서 누락되거나 형식이 잘못된 항목은
+        개별 요청(a_get_quick_feedback)으로 처리합니다.
+        """
+        logger.info("빠른 피드백 묶음 생성 시작 (전사본 %s개)", len(transcripts))
+        await self._a_refresh_templates()
+        
+        groups = self._group_transcripts(transcripts)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(transcripts)
+        
+        group_results = await asyncio.gather(
+            *(self._a_quick_feedback_group(transcripts, indices) for indices in groups)
+        )
+        for mapping in group_results:
+            for index, result in mapping.items():
+                results[index] = result
+        
+        missing = [index for index, result in enumerate(results) if result is None]
+        if missing:
+            logger.info("묶음에서 처리되지 않은 전사본 %s개를 개별 요청으로 처리", len(missing))
+            fallback = await asyncio.gather(
+                *(self.a_get_quick_feedback(transcripts[index]) for index in missing)
+            )
+            for index, result in zip(missing, fallback):
+                results[index] = result
+        
+        logger.info("빠른 피드백 묶음 생성 완료 (묶음 요청 %s개, 개별 요청 %s개)", len(groups), len(missing))
+        return results
+    
+    def _group_transcripts(self, transcripts: List[str]) -> List[List[int]]:
+        """전사본 인덱스를 토큰 예산과 최대 개수에 맞춰 묶습니다 (2개 이상인 묶음만)."""
+        groups: List[List[int]] = []
+        current: List[int] = []
+        size = 0
+        
+        for index, transcript in enumerate(transcripts):
+            tokens = self._count_tokens(transcript)
+            if tokens > QUICK_FEEDBACK_GROUP_TOKEN_BUDGET:
+                continue  # 개별 요청으로 처리
+            if current and (size + tokens > QUICK_FEEDBACK_GROUP_TOKEN_BUDGET
+                            or len(current) >= QUICK_FEEDBACK_GROUP_MAX_ITEMS):
+                groups.append(current)
+                current, size = [], 0
+            current.append(index)
+            size += tokens
+        
+        if current:
+            groups.append(current)
+        # 하나뿐인 묶음은 일반 프롬프트로 개별 처리하는 편이 나음
+        return [group for group in groups if len(group) > 1]
+    
+    async def _a_quick_feedback_group(
+        self,
+        transcripts: List[str],
+        indices: List[int]
+    ) -> Dict[int, Dict[str, Any]]:
         """
-        logger.info("빠른 피드백 분석 시작")
-        logger.info(f"전사본 길이: {len(transcript)}자")
+        전사본 묶음 하나를 단일 요청으로 처리하고 원래 인덱스별 결과를 반환합니다.
         
+        프롬프트는 quick_feedback 템플릿에 번호 붙인 대화들을 넣어 만들고, 결과는
+        get_quick_feedback과 같은 형식입니다 (token_usage는 묶음 요청 전체의 사용량).
+        실패하거나 형식이 맞지 않는 항목은 결과에서 빠지므로 호출부가 개별 요청으로 처리합니다.
+        """
         try:
-            prompt_template = self.prompt_manager.get_prompt("quick_feedback")
-            if not prompt_template:
-                logger.error("빠른 피드백 프롬프트를 찾을 수 없습니다.")
+            render_prompt = self._templates.get("quick_feedback")
+            if render_prompt is None:
                 raise ValueError("빠른 피드백 프롬프트를 찾을 수 없습니다.")
             
-            prompt = prompt_template.format(transcript=transcript)
-            logger.info(f"빠른 피드백 프롬프트 길이: {len(prompt)}자")
-            
-            logger.info("OpenAI API 호출 시작 (빠른 피드백)...")
-            start_time = datetime.now()
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "유아교육 전문가로서 교사들에게 격려적이고 실용적인 피드백을 제공합니다."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.6,
-                max_tokens=800
+            start_time = time.perf_counter()
+            # 묶음 대상은 요약 예산보다 짧으므로 전처리는 공백/간투사 정리만 함 (추가 API 호출 없음)
+            prepared = [await self._a_prep_transcript(transcripts[index]) for index in indices]
+            user = render_prompt(transcript="\n\n".join(
+                f"## 대화 {number}\n{transcript}"
+                for number, transcript in enumerate(prepared, 1)
+            ))
+            params = GENERATION_PARAMS["quick_feedback"]
+            response = await self._a_cached_chat(
+                SYSTEM_MESSAGES["quick_feedback"] + QUICK_FEEDBACK_GROUP_INSTRUCTION,
+                user,
+                temperature=params["temperature"],
+                max_tokens=params["max_tokens"] * len(indices),
+                response_format=JSON_RESPONSE_FORMAT
             )
+            processing_time = time.perf_counter() - start_time
             
-            end_time = datetime.now()
-            processing_time = (end_time - start_time).total_seconds()
-            
-            # API 호출 로그
+            usage = response["usage"]
             log_api_call(
                 service="OpenAI",
                 endpoint="chat/completions",
@@ -219,53 +2121,61 @@ class AIAnalyzer:
                 status="success",
                 model=self.model,
                 analysis_type="quick_feedback",
-                prompt_tokens=response.usage.prompt_tokens,
-                completion_tokens=response.usage.completion_tokens,
-                total_tokens=response.usage.total_tokens
+                group_size=len(indices),
+                prompt_tokens=usage["prompt_tokens"],
+                completion_tokens=usage["completion_tokens"],
+                total_tokens=usage["total_tokens"]
             )
             
-            logger.info(f"빠른 피드백 API 응답 완료 (처리 시간: {processing_time:.2f}초)")
-            logger.info(f"토큰 사용량: {response.usage.total_tokens}개")
-            
-            feedback = response.choices[0].message.content
-            logger.info(f"피드백 결과 길이: {len(feedback)}자")
-            
-            result = {
+            parsed = self._parse_json_output(response["content"])
+            items = parsed.get("feedback") if isinstance(parsed, dict) else None
+            if not isinstance(items, list):
+                logger.warning("빠른 피드백 묶음 응답 형식이 올바르지 않아 개별 요청으로 처리합니다")
+                return {}
+        except Exception as e:
+            logger.warning("빠른 피드백 묶음 요청 실패, 개별 요청으로 처리합니다: %s", e)
+            return {}
+        
+        results: Dict[int, Dict[str, Any]] = {}
+        processed_at = datetime.now().isoformat()
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            number, feedback = item.get("index"), item.get("feedback")
+            if (not isinstance(number, int) or not 1 <= number <= len(indices)
+                    or not isinstance(feedback, str) or not feedback.strip()):
+                continue
+            results[indices[number - 1]] = {
                 "success": True,
                 "feedback": feedback,
                 "feedback_type": "quick",
-                "processed_at": datetime.now().isoformat(),
+                "processed_at": processed_at,
+                "model_used": self.model,
+                "prompt_version": PROMPT_VERSION,
                 "processing_time_seconds": processing_time,
-                "token_usage": {
-                    "prompt_tokens": response.usage.prompt_tokens,
-                    "completion_tokens": response.usage.completion_tokens,
-                    "total_tokens": response.usage.total_tokens
-                }
-            }
-            
-            logger.info("빠른 피드백 분석 완료")
-            return result
-            
-        except openai.APIError as e:
-            logger.error(f"OpenAI API 호출 실패 (빠른 피드백): {str(e)}")
-            return {
-                "success": False,
-                "error": f"OpenAI API 호출 실패 (빠른 피드백): {str(e)}",
-                "feedback": None
+                "token_usage": dict(usage)
             }
-        except Exception as e:
-            logger.error(f"빠른 피드백 생성 중 오류 발생: {str(e)}")
-            logger.exception("상세 오류 정보:")
-            return {
-                "success": False,
-                "error": f"빠른 피드백 생성 중 오류 발생: {str(e)}",
-                "feedback": None
+        return results
+    
+    @staticmethod
+    def _stream_cache_entry(parts: List[str], usage: Any, finish_reason: Optional[str] = None) -> Dict[str, Any]:
+        """스트리밍 조각과 마지막 청크의 사용량으로 캐시 항목을 만듭니다."""
+        return {
+            "content": "".join(parts),
+            "finish_reason": finish_reason,
+            "usage": {
+                "prompt_tokens": usage.prompt_tokens if usage else 0,
+                "completion_tokens": usage.completion_tokens if usage else 0,
+                "total_tokens": usage.total_tokens if usage else 0
             }
+        }
     
     def analyze_child_development(
         self, 
         transcript: str, 
-        child_segments: List[Dict[str, Any]]
+        child_segments: List[Dict[str, Any]],
+        mode: str = "realtime",
+        structured: bool = False
     ) -> Dict[str, Any]:
         """
         아동 발달 관점에서 분석합니다.
@@ -273,57 +2183,41 @@ class AIAnalyzer:
         Args:
             transcript: 전체 대화
             child_segments: 아동 발화 구간들
+            mode: "batch"이면 Batch API에 제출하고 배치 핸들을 반환
+                (구간 요약은 실시간 호출이므로 batch 모드에서는 하지 않음 -
+                 전사본이 TRANSCRIPT_TOKEN_BUDGET 이하여야 하고, 넘으면 실패 결과를 반환)
+            structured: True이면 JSON 형식으로 받아 'development_json'에 파싱 결과를 담음
             
         Returns:
-            Dict: 발달 분석 결과
+            Dict: 발달 분석 결과 (batch 모드에서는 batch_id/custom_id)
         """
-        try:
-            # 아동 발화만 추출
-            child_utterances = "\n".join([
-                f"[{seg['start_time']:.1f}s] {seg['text']}" 
-                for seg in child_segments
-            ])
-            
-            prompt_template = self.prompt_manager.get_prompt("child_development")
-            if not prompt_template:
-                raise ValueError("아동 발달 분석 프롬프트를 찾을 수 없습니다.")
-            
-            prompt = prompt_template.format(
-                transcript=transcript,
-                child_utterances=child_utterances
-            )
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "아동 발달 전문가로서 과학적이고 체계적인 발달 분석을 제공합니다."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.5,
-                max_tokens=1500
+        if mode == "batch":
+            transcript = _normalize_transcript(transcript)
+            tokens = self._count_tokens(transcript)
+            if tokens > TRANSCRIPT_TOKEN_BUDGET:
+                message = (
+                    f"Batch 모드는 전사본을 요약하지 않으므로 {TRANSCRIPT_TOKEN_BUDGET}토큰 이하만 제출할 수 있습니다 "
+                    f"(현재 {tokens}토큰)"
+                )
+                logger.error(message)
+                return {"success": False, "error": message, "development_analysis": None}
+            return self._submit_prompt_batch(
+                "child_development",
+                lambda: self._build_child_development_prompt(transcript, child_segments),
+                result_key="development_analysis",
+                label="발달 분석"
             )
-            
-            development_analysis = response.choices[0].message.content
-            
-            return {
-                "success": True,
-                "development_analysis": development_analysis,
-                "child_utterance_count": len(child_segments),
-                "processed_at": datetime.now().isoformat()
-            }
-            
-        except openai.APIError as e:
-            return {
-                "success": False,
-                "error": f"OpenAI API 호출 실패 (발달 분석): {str(e)}",
-                "development_analysis": None
-            }
-        except Exception as e:
-            return {
-                "success": False,
-                "error": f"발달 분석 중 오류 발생: {str(e)}",
-                "development_analysis": None
-            }
+        
+        transcript = self._prep_transcript(transcript)
+        return self._run_prompt(
+            "child_development",
+            lambda: self._build_child_development_prompt(transcript, child_segments),
+            result_key="development_analysis",
+            label="발달 분석",
+            extra={"child_utterance_count": len(child_segments)},
+            structured=structured,
+            json_key="development_json"
+        )
     
     def get_coaching_tips(self, transcript: str, situation: str = "일반적인 교사-아동 상호작용") -> Dict[str, Any]:
         """
@@ -336,52 +2230,20 @@ class AIAnalyzer:
         Returns:
             Dict: 코칭 팁 결과
         """
-        try:
-            prompt_template = self.prompt_manager.get_prompt("coaching_tips")
-            if not prompt_template:
-                raise ValueError("코칭 팁 프롬프트를 찾을 수 없습니다.")
-            
-            prompt = prompt_template.format(
-                situation=situation,
-                transcript=transcript
-            )
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "교사 코칭 전문가로서 실용적이고 적용 가능한 조언을 제공합니다."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=1200
-            )
-            
-            coaching_tips = response.choices[0].message.content
-            
-            return {
-                "success": True,
-                "coaching_tips": coaching_tips,
-                "situation": situation,
-                "processed_at": datetime.now().isoformat()
-            }
-            
-        except openai.APIError as e:
-            return {
-                "success": False,
-                "error": f"OpenAI API 호출 실패 (코칭 팁): {str(e)}",
-                "coaching_tips": None
-            }
-        except Exception as e:
-            return {
-                "success": False,
-                "error": f"코칭 팁 생성 중 오류 발생: {str(e)}",
-                "coaching_tips": None
-            }
+        transcript = self._prep_transcript(transcript)
+        return self._run_prompt(
+            "coaching_tips",
+            lambda: self._build_coaching_tips_prompt(transcript, situation),
+            result_key="coaching_tips",
+            label="코칭 팁",
+            extra={"situation": situation}
+        )
     
     def interpret_sentiment(
         self, 
         sentiment_data: List[Dict[str, Any]], 
-        context: str
+        context: str,
+        mode: str = "realtime"
     ) -> Dict[str, Any]:
         """
         감정 분석 결과를 교육적 관점에서 해석합니다.
@@ -389,91 +2251,126 @@ class AIAnalyzer:
         Args:
             sentiment_data: 감정 분석 데이터
             context: 대화 맥락
+            mode: "batch"이면 Batch API에 제출하고 배치 핸들을 반환
             
         Returns:
-            Dict: 감정 해석 결과
+            Dict: 감정 해석 결과 (batch 모드에서는 batch_id/custom_id)
         """
-        try:
-            sentiment_formatted = self._format_sentiment_data(sentiment_data)
-            
-            prompt_template = self.prompt_manager.get_prompt("sentiment_interpretation")
-            if not prompt_template:
-                raise ValueError("감정 해석 프롬프트를 찾을 수 없습니다.")
-            
-            prompt = prompt_template.format(
-                sentiment_data=sentiment_formatted,
-                context=context
-            )
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "감정과 소통 전문가로서 교사의 감정 인식과 대응 능력 향상을 돕습니다."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.6,
-                max_tokens=1000
+        if mode == "batch":
+            return self._submit_prompt_batch(
+                "sentiment_interpretation",
+                lambda: self._build_sentiment_prompt(sentiment_data, context),
+                result_key="sentiment_interpretation",
+                label="감정 해석"
             )
-            
-            sentiment_interpretation = response.choices[0].message.content
-            
-            return {
-                "success": True,
-                "sentiment_interpretation": sentiment_interpretation,
-                "processed_at": datetime.now().isoformat()
-            }
-            
-        except openai.APIError as e:
-            return {
-                "success": False,
-                "error": f"OpenAI API 호출 실패 (감정 해석): {str(e)}",
-                "sentiment_interpretation": None
-            }
-        except Exception as e:
-            return {
-                "success": False,
-                "error": f"감정 해석 중 오류 발생: {str(e)}",
-                "sentiment_interpretation": None
-            }
+        
+        return self._run_prompt(
+            "sentiment_interpretation",
+            lambda: self._build_sentiment_prompt(sentiment_data, context),
+            result_key="sentiment_interpretation",
+            label="감정 해석"
+        )
+    
+    def _session_context(
+        self,
+        teacher_child_info: Dict[str, Any],
+        sentiment_data: Optional[List[Dict[str, Any]]]
+    ) -> SessionContext:
+        """화자 정보와 감정 데이터를 한 번 포맷해 SessionContext로 묶습니다."""
+        session = SessionContext(
+            teacher_info=self._format_speaker_info(teacher_child_info.get("teacher_stats", {}), "교사"),
+            child_info=self._format_speaker_info(teacher_child_info.get("child_stats", {}), "아동"),
+            sentiment_analysis=self._format_sentiment_data(sentiment_data)
+        )
+        logger.info(
+            "세션 정보 포맷 완료 (교사 %d자, 아동 %d자, 감정 %d자)",
+            len(session.teacher_info), len(session.child_info), len(session.sentiment_analysis)
+        )
+        return session
     
     def _format_speaker_info(self, stats: Dict[str, Any], role: str) -> str:
         """화자 정보를 텍스트로 포맷합니다."""
         if not stats:
             return f"{role}: 정보 없음"
         
-        return f"""
-{role}:
-- 총 발화 시간: {stats.get('total_time', 0):.1f}초 ({stats.get('time_percentage', 0):.1f}%)
-- 총 단어 수: {stats.get('total_words', 0)}개 ({stats.get('word_percentage', 0):.1f}%)
-- 발화 횟수: {stats.get('utterances', 0)}회
-- 평균 신뢰도: {stats.get('avg_confidence', 0):.2f}
-- 발화당 평균 단어 수: {stats.get('avg_words_per_utterance', 0):.1f}개
-"""
+        stats_items = tuple(sorted(stats.items()))
+        try:
+            return _render_speaker_info(role, stats_items)
+        except TypeError:
+            # 해시할 수 없는 값이 섞여 있으면 캐시 없이 포맷
+            return _render_speaker_info.__wrapped__(role, stats_items)
     
     def _format_sentiment_data(self, sentiment_data: Optional[List[Dict[str, Any]]]) -> str:
         """감정 분석 데이터를 텍스트로 포맷합니다."""
         if not sentiment_data:
             return "감정 분석 데이터 없음"
         
-        formatted = []
-        for item in sentiment_data:
-            formatted.append(
-                f"[{item.get('start_time', 0):.1f}s] "
-                f"{item.get('sentiment', 'unknown')} "
-                f"(신뢰도: {item.get('confidence', 0):.2f}) "
-                f"- \"{item.get('text', '')}\""
+        if all(item.keys() >= SENTIMENT_FIELDS for item in sentiment_data):
+            return "\n".join(
+                _SENTIMENT_LINE(item["start_time"], item["sentiment"], item["confidence"], item["text"])
+                for item in sentiment_data
+            )
+        else:
+            # 키가 빠진 항목이 있으면 기본값으로 채움 (호출부의 데이터는 수정하지 않음)
+            return "\n".join(
+                _SENTIMENT_LINE(
+                    item.get("start_time", 0),
+                    item.get("sentiment", "unknown"),
+                    item.get("confidence", 0),
+                    item.get("text", "")
+                )
+                for item in sentiment_data
+            )
+    
+    def generate_summary_report(
+        self,
+        analysis_results: Dict[str, Any],
+        mode: str = "realtime"
+    ) -> Union[str, Dict[str, Any]]:
+        """
+        분석 결과들을 종합한 요약 리포트를 생성합니다.
+        
+        mode가 "batch"이면 Batch API에 제출하고, 다른 분석의 batch 모드와 같은 형식의
+        dict(success, batch_id, custom_id 또는 error)를 반환합니다.
+        """
+        if mode == "batch":
+            return self._submit_prompt_batch(
+                "summary_report",
+                lambda: self._build_summary_prompt(analysis_results),
+                result_key="summary_report",
+                label="요약 리포트 생성"
             )
         
-        return "\n".join(formatted)
+        result = self._run_prompt(
+            "summary_report",
+            lambda: self._build_summary_prompt(analysis_results),
+            result_key="summary_report",
+            label="요약 리포트 생성"
+        )
+        return result["summary_report"] if result["success"] else result["error"]
     
-    def generate_summary_report(self, analysis_results: Dict[str, Any]) -> str:
-        """분석 결과들을 종합한 요약 리포트를 생성합니다."""
-        try:
-            summary_prompt = f"""
-다음 분석 결과들을 바탕으로 교사를 위한 종합 요약 리포트를 작성해주세요:
-
-## 분석 결과들
-{json.dumps(analysis_results, ensure_ascii=False, indent=2)}
+    async def a_generate_summary_report(self, analysis_results: Dict[str, Any]) -> str:
+        """generate_summary_report의 비동기 버전입니다."""
+        result = await self._a_summary_result(analysis_results)
+        return result["summary_report"] if result["success"] else result["error"]
+    
+    async def _a_summary_result(self, analysis_results: Dict[str, Any]) -> Dict[str, Any]:
+        """요약 리포트를 생성해 공통 형식의 결과로 반환합니다."""
+        return await self._a_run_prompt(
+            "summary_report",
+            lambda: self._build_summary_prompt(analysis_results),
+            result_key="summary_report",
+            label="요약 리포트 생성"
+        )
+    
+    def _build_summary_prompt(self, analysis_results: Dict[str, Any]) -> str:
+        """요약 리포트 프롬프트를 구성합니다."""
+        # 같은 분석 결과면 항상 같은 문자열이 되도록 변동 필드 제거 + 키 정렬
+        stable_results = _dump_stable_json(_strip_volatile_fields(analysis_results))
+        
+        # 고정된 요구사항을 앞에, 분석 결과 JSON을 맨 뒤에 배치 (프롬프트 캐시 적중)
+        return f"""
+아래 분석 결과들을 바탕으로 교사를 위한 종합 요약 리포트를 작성해주세요.
 
 ## 요약 리포트 요구사항
 1. 핵심 인사이트 3가지
@@ -482,19 +2379,187 @@ class AIAnalyzer:
 4. 격려 메시지
 
 간결하고 실용적으로 작성해주세요.
+
+## 분석 결과들
+{stable_results}
 """
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "교육 컨설턴트로서 분석 결과를 실행 가능한 리포트로 정리합니다."},
-                    {"role": "user", "content": summary_prompt}
+    
+    def _batch_job(self, prompt_id: str, prompt: str) -> Dict[str, Any]:
+        """Batch API에 제출할 단일 요청을 만듭니다."""
+        params = GENERATION_PARAMS[prompt_id]
+        return {
+            "custom_id": f"{prompt_id}-{uuid.uuid4().hex}",
+            "body": {
+                "model": self.model,
+                "messages": [
+                    {"role": "system", "content": SYSTEM_MESSAGES[prompt_id]},
+                    {"role": "user", "content": prompt}
                 ],
-                temperature=0.6,
-                max_tokens=800
-            )
+                "temperature": params["temperature"],
+                "max_tokens": params["max_tokens"],
+                "stop": RESPONSE_STOP,
+                "prompt_cache_key": _prompt_cache_key(SYSTEM_MESSAGES[prompt_id])
+            }
+        }
+    
+    def _submit_prompt_batch(
+        self,
+        prompt_id: str,
+        build_prompt: Callable[[], str],
+        result_key: str,
+        label: str
+    ) -> Dict[str, Any]:
+        """분석 하나를 Batch API에 제출하고 결과 형식의 배치 핸들을 반환합니다."""
+        try:
+            job = self._batch_job(prompt_id, build_prompt())
+            batch_id = self.submit_batch([job])
+            return {
+                "success": True,
+                "mode": "batch",
+                "batch_id": batch_id,
+                "custom_id": job["custom_id"],
+                result_key: None,
+                "processed_at": datetime.now().isoformat()
+            }
+        except openai.APIError as e:
+            logger.error("Batch 제출 실패 (%s): %s", label, e)
+            return {
+                "success": False,
+                "error": f"OpenAI Batch 제출 실패 ({label}): {str(e)}",
+                result_key: None
+            }
+        except Exception as e:
+            logger.error("%s Batch 제출 중 오류 발생: %s", label, e)
+            return {
+                "success": False,
+                "error": f"{label} Batch 제출 중 오류 발생: {str(e)}",
+                result_key: None
+            }
+    
+    def submit_batch(self, jobs: List[Dict[str, Any]]) -> str:
+        """
+        여러 Chat Completions 요청을 OpenAI Batch API에 한 번에 제출합니다.
+        
+        Args:
+            jobs: {"custom_id": 요청 ID, "body": Chat Completions 요청 본문} 목록
             
-            return response.choices[0].message.content
+        Returns:
+            str: batch_id
+        """
+        buffer = io.BytesIO()
+        for job in jobs:
+            line = {
+                "custom_id": job["custom_id"],
+                "method": "POST",
+                "url": BATCH_ENDPOINT,
+                "body": job["body"]
+            }
+            if orjson is not None:
+                buffer.write(orjson.dumps(line))
+            else:
+                buffer.write(json.dumps(line, ensure_ascii=False).encode("utf-8"))
+            buffer.write(b"\n")
+        buffer.seek(0)
+        
+        batch_file = self.client.files.create(
+            file=("kindcoach_batch.jsonl", buffer),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window=BATCH_COMPLETION_WINDOW
+        )
+        
+        logger.info("Batch 제출 완료 (batch_id: %s, 요청 %s개)", batch.id, len(jobs))
+        return batch.id
+    
+    def poll_batch(
+        self,
+        batch_id: str,
+        interval: float = BATCH_POLL_INTERVAL,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        배치가 끝날 때까지 기다린 뒤 custom_id별 결과를 반환합니다.
+        
+        Args:
+            batch_id: submit_batch가 반환한 ID
+            interval: 상태 확인 간격 (초)
+            timeout: 최대 대기 시간 (초, None이면 무제한)
             
-        except Exception as e:
-            return f"요약 리포트 생성 중 오류 발생: {str(e)}"
\ No newline at end of file
+        Returns:
+            Dict: custom_id -> {"success", "content", "usage"} 또는 {"success": False, "error"}
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        
+        while True:
+            batch = self.client.batches.retrieve(batch_id)
+            if batch.status == "completed":
+                break
+            if batch.status in BATCH_TERMINAL_FAILURES:
+                raise RuntimeError(f"Batch 처리 실패 (batch_id: {batch_id}, 상태: {batch.status})")
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Batch 대기 시간 초과 (batch_id: {batch_id}, 상태: {batch.status})")
+            time.sleep(interval)
+        
+        return self._read_batch_results(batch)
+    
+    def collect_batch_results(self, batch_id: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        배치 상태를 한 번만 확인하고, 끝났으면 custom_id별 결과를 반환합니다.
+        
+        야간 리포트처럼 주기적으로 호출하는 작업에서 대기 없이 사용합니다.
+        
+        Args:
+            batch_id: submit_batch가 반환한 ID
+            
+        Returns:
+            Dict: poll_batch와 같은 형식의 결과, 아직 처리 중이면 None
+        """
+        batch = self.client.batches.retrieve(batch_id)
+        if batch.status in BATCH_TERMINAL_FAILURES:
+            raise RuntimeError(f"Batch 처리 실패 (batch_id: {batch_id}, 상태: {batch.status})")
+        if batch.status != "completed":
+            logger.debug("Batch 처리 중 (batch_id: %s, 상태: %s)", batch_id, batch.status)
+            return None
+        return self._read_batch_results(batch)
+    
+    def _read_batch_results(self, batch: Any) -> Dict[str, Dict[str, Any]]:
+        """완료된 배치의 출력/오류 파일을 내려받아 custom_id별로 파싱합니다."""
+        # 출력 파일과 오류 파일은 같은 줄 형식을 사용
+        results: Dict[str, Dict[str, Any]] = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            for line in self.client.files.content(file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                item = json.loads(line)
+                response = item.get("response") or {}
+                body = response.get("body") or {}
+                if response.get("status_code") == 200:
+                    results[item["custom_id"]] = {
+                        "success": True,
+                        "content": body["choices"][0]["message"]["content"],
+                        "usage": body.get("usage", {})
+                    }
+                else:
+                    results[item["custom_id"]] = {
+                        "success": False,
+                        "error": str(body.get("error") or item.get("error"))
+                    }
+        
+        logger.info("Batch 결과 수집 완료 (batch_id: %s, 결과 %s개)", batch.id, len(results))
+        return results
+
+
+@lru_cache(maxsize=1)
+def get_analyzer(api_key: str = None) -> AIAnalyzer:
+    """
+    프로세스 전체에서 공유하는 AIAnalyzer를 반환합니다.
+    
+    연결 풀과 로드된 프롬프트를 요청/재실행마다 버리지 않도록,
+    호출부에서는 AIAnalyzer()를 직접 만들지 말고 이 함수를 사용합니다.
+    """
+    return AIAnalyzer(api_key)
@@ -3,23 +3,213 @@
 모든 분석 유형의 결과를 저장, 로드, 관리하는 클래스
 """
 
+import heapq
 import json
 import os
-from datetime import datetime
+import re
+import tempfile
+import threading
+import time
+from datetime import date, datetime, time as dt_time
 from typing import Dict, List, Optional, Any
 from pathlib import Path
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import glob
 import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from src.logging_config import get_logger
 
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json으로 직렬화
+    orjson = None
+
 # 로거 설정
 logger = get_logger(__name__)
 
+# 분석 목록 요약 캐시 최대 항목 수
+SUMMARY_CACHE_SIZE = 512
+
+# 분석 목록 조회 시 요약 파일을 병렬로 읽을 최대 스레드 수
+SUMMARY_WORKERS = 8
+
+# 전체 분석 문서 캐시 최대 항목 수 (문서가 크므로 최근 것만 유지)
+DOC_CACHE_SIZE = 32
+
+# 목록 표시에 필요한 필드만 담은 요약 파일 접미사 ({conversation_id}.meta.json)
+META_SUFFIX = ".meta.json"
+
+# 검색용 역색인 파일 이름 (.json이 아니므로 분석 목록에는 잡히지 않음)
+INDEX_FILENAME = "_index.orjson"
+_TOKEN_RE = re.compile(r"[^\W_]+")
+
+
+def _tokenize(text: str) -> List[str]:
+    """
+    검색 색인용으로 소문자 단어 토큰(문자/숫자 연속, 밑줄 제외)을 추출합니다.
+    
+    검색창에 입력하는 키워드는 대부분 한 단어이므로, 전체가 문자/숫자이면 정규식 없이 바로 반환합니다.
+    """
+    text = text.lower()
+    if text.isalnum():
+        return [text]
+    return _TOKEN_RE.findall(text)
+
+
+# 분석 유형의 고정 순서와 완료 상태 비트 (analysis_status_bits의 i번째 비트 = i번째 분석 완료 여부)
+_ANALYSIS_ORDER = ("comprehensive", "quick_feedback", "child_development", "coaching_tips", "sentiment_interpretation")
+_STATUS_BIT = {analysis_type: 1 << i for i, analysis_type in enumerate(_ANALYSIS_ORDER)}
+
+
+def _status_bits(data: Dict[str, Any]) -> int:
+    """
+    분석 데이터(또는 요약)의 완료 상태 비트를 반환합니다.
+    
+    이전 버전에서 저장된 analysis_status 딕셔너리도 비트로 바꿔 읽습니다.
+    """
+    bits = data.get("analysis_status_bits")
+    if bits is not None:
+        return bits
+    status = data.get("analysis_status") or {}
+    return sum(bit for analysis_type, bit in _STATUS_BIT.items() if status.get(analysis_type))
+
+
+def _status_dict(bits: int) -> Dict[str, bool]:
+    """완료 상태 비트를 분석 유형별 완료 여부 딕셔너리로 펼칩니다."""
+    return {analysis_type: bool(bits & bit) for analysis_type, bit in _STATUS_BIT.items()}
+
+
+def _created_at_ns(summary: Dict[str, Any]) -> int:
+    """
+    정렬용 생성 시각(ns)을 반환합니다.
+    
+    저장 시 기록한 created_at_ns가 없으면(이전 버전에서 저장된 분석) ISO 문자열에서 계산합니다.
+    """
+    created_at_ns = summary.get("created_at_ns")
+    if created_at_ns is not None:
+        return created_at_ns
+    try:
+        return int(datetime.fromisoformat(summary.get("created_at") or "").timestamp() * 1_000_000_000)
+    except ValueError:
+        return 0
+
+
+def _recording_fields(summary: Dict[str, Any]) -> Dict[str, Optional[int]]:
+    """
+    녹음 시(hour)와 요일(월=0)을 반환합니다.
+    
+    저장 시 미리 계산해 둔 값이 있으면 그대로 쓰고, 없으면(이전 버전에서 저장된 분석)
+    메타데이터의 recording_time/recording_date에서 한 번 계산합니다.
+    대시보드는 이 값을 그대로 집계하므로 읽을 때마다 시각 문자열을 파싱하지 않습니다.
+    """
+    if "recording_hour" in summary:
+        return {"recording_hour": summary["recording_hour"], "recording_weekday": summary.get("recording_weekday")}
+    
+    metadata = summary.get("metadata") or {}
+    hour = weekday = None
+    try:
+        hour = dt_time.fromisoformat(metadata.get("recording_time") or "").hour
+    except ValueError:
+        pass
+    try:
+        weekday = date.fromisoformat(metadata.get("recording_date") or "").weekday()
+    except ValueError:
+        pass
+    return {"recording_hour": hour, "recording_weekday": weekday}
+
+
+def _sort_key(summary: Dict[str, Any]) -> int:
+    """분석 목록 정렬 키 (생성 시각 ns)."""
+    return summary["created_at_ns"]
+
+
+def _search_blob(summary: Dict[str, Any]) -> str:
+    """
+    검색 대상 필드(전사 미리보기, 사용자명, 아동 이름, 설명)를 소문자로 이어 붙입니다.
+    
+    필드 사이는 줄바꿈으로 구분해 키워드가 두 필드에 걸쳐 일치하지 않게 합니다.
+    """
+    metadata = summary.get("metadata") or {}
+    return "\n".join(filter(None, (
+        summary.get("transcript_preview"),
+        summary.get("username"),
+        metadata.get("child_name"),
+        metadata.get("description")
+    ))).lower()
+
+
+def _dump_json(data: Any) -> bytes:
+    """분석 데이터를 들여쓰기된 UTF-8 JSON 바이트로 직렬화합니다 (가능하면 orjson 사용)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _write_atomic(file_path: "os.PathLike | str", payload: bytes):
+    """
+    임시 파일에 쓴 뒤 os.replace로 교체해, 중간에 실패해도 기존 파일이 깨지지 않게 합니다.
+    
+    임시 파일 이름은 매번 고유하므로 같은 파일을 동시에 저장해도 서로의 임시 파일을 덮어쓰지 않습니다.
+    """
+    file_path = os.fspath(file_path)
+    directory, name = os.path.split(file_path)
+    with tempfile.NamedTemporaryFile('wb', dir=directory or None, prefix=f"{name}.",
+                                     suffix=".tmp", delete=False) as f:
+        tmp_path = f.name
+        try:
+            f.write(payload)
+        except BaseException:
+            f.close()
+            os.unlink(tmp_path)
+            raise
+    try:
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _meta_path(file_path: "os.PathLike | str") -> str:
+    """분석 파일 경로에 대응하는 요약 파일 경로를 반환합니다."""
+    return os.fspath(file_path)[:-len(".json")] + META_SUFFIX
+
+
+def _prefetch_files(paths: List[str]):
+    """
+    곧 읽을 파일들을 미리 페이지 캐시에 올리도록 커널에 알립니다 (POSIX_FADV_WILLNEED).
+    
+    posix_fadvise가 없는 플랫폼(macOS, Windows)에서는 아무것도 하지 않습니다.
+    """
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def _load_json(file_path: "os.PathLike | str") -> Any:
+    """JSON 파일을 바이트로 읽어 역직렬화합니다 (가능하면 orjson 사용)."""
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class AnalysisManager:
     """분석 결과를 종합적으로 관리하는 클래스"""
     
+    # 이 프로세스에서 이미 만들어 둔 디렉터리 (인스턴스 간 공유, 저장마다 mkdir 호출 방지)
+    _ensured_dirs: set = set()
+    _ensured_dirs_lock = threading.Lock()
+    
     def __init__(self, results_dir: str = "data/analysis_results"):
         """
         분석 관리자 초기화
@@ -30,12 +220,12 @@ class AnalysisManager:
         logger.info("AnalysisManager 초기화 시작")
         
         self.results_dir = Path(results_dir)
-        self.results_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(self.results_dir)
         logger.info(f"결과 디렉터리 설정: {self.results_dir}")
         
         # 공통 디렉터리 (하위 호환성)
         self.shared_dir = self.results_dir / "shared"
-        self.shared_dir.mkdir(exist_ok=True)
+        self._ensure_dir(self.shared_dir)
         logger.info(f"공통 디렉터리 설정: {self.shared_dir}")
         
         # 지원하는 분석 유형
@@ -43,33 +233,71 @@ class AnalysisManager:
             "comprehensive": {
                 "name": "종합 분석",
                 "description": "교사-아동 대화의 전면적인 분석과 상세한 코칭 피드백",
-                "icon": "📊"
+                "icon": "📊",
+                "field": "analysis"  # 분석 결과에서 본문이 담긴 키
             },
             "quick_feedback": {
                 "name": "빠른 피드백",
                 "description": "즉석에서 핵심적인 피드백을 간단하게 제공",
-                "icon": "⚡"
+                "icon": "⚡",
+                "field": "feedback"
             },
             "child_development": {
                 "name": "아동 발달 분석",
                 "description": "발달 심리학 관점에서 아동의 현재 상태를 전문적으로 분석",
-                "icon": "👶"
+                "icon": "👶",
+                "field": "development_analysis"
             },
             "coaching_tips": {
                 "name": "상황별 코칭 팁",
                 "description": "구체적인 교사 코칭 가이드와 실무 팁 제공",
-                "icon": "💡"
+                "icon": "💡",
+                "field": "coaching_tips"
             },
             "sentiment_interpretation": {
                 "name": "감정 해석",
                 "description": "감정 분석 결과를 교육적 관점에서 해석하고 활용 방안 제시",
-                "icon": "😊"
+                "icon": "😊",
+                "field": "sentiment_interpretation"
             }
         }
         
         logger.info(f"분석 유형 {len(self.analysis_types)}개 설정 완료")
+        
+        # 텍스트 보고서용 (유형, 아이콘, 이름, 본문 키) 표: 보고서 작성 시 유형별 분기 없이 순회
+        self._report_dispatch = tuple(
+            (analysis_type, info["icon"], info["name"], info["field"])
+            for analysis_type, info in self.analysis_types.items()
+        )
+        
+        # 인스턴스는 Streamlit 세션(스레드) 간에 공유되므로 캐시와 색인 갱신은 이 잠금 안에서 함
+        self._lock = threading.RLock()
+        
+        # 파일 경로 -> (mtime_ns, size, 요약) 캐시: 바뀌지 않은 파일은 다시 파싱하지 않음
+        self._summary_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        
+        # 파일 경로 -> (mtime_ns, size, 분석 데이터) 캐시: 연속 업데이트 시 다시 파싱하지 않음
+        self._doc_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        # 아직 디스크에 쓰지 않은 분석 데이터 (flush=False로 업데이트된 대화)
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        
+        # 검색 역색인: 토큰 -> 분석 파일(결과 디렉터리 기준 상대 경로) 집합
+        self._index_path = self.results_dir / INDEX_FILENAME
+        self._token_index: Optional[Dict[str, set]] = None
+        self._doc_tokens: Dict[str, List[str]] = {}
+        self._load_token_index()
+        
         logger.info("AnalysisManager 초기화 완료")
     
+    def _ensure_dir(self, directory: Path):
+        """디렉터리가 없으면 만듭니다. 프로세스마다 디렉터리당 한 번만 파일 시스템을 확인합니다."""
+        key = os.fspath(directory)
+        if key in self._ensured_dirs:
+            return
+        directory.mkdir(parents=True, exist_ok=True)
+        with self._ensured_dirs_lock:
+            self._ensured_dirs.add(key)
+    
     def create_new_analysis(self, conversation_id: str, transcription_data: Dict[str, Any], 
                           teacher_child_analysis: Dict[str, Any], 
                           metadata: Optional[Dict[str, Any]] = None,
@@ -88,9 +316,11 @@ class AnalysisManager:
         logger.info(f"새 분석 세션 생성 시작: {conversation_id}")
         logger.info(f"사용자: {username}")
         
+        created_at_ns = time.time_ns()
         analysis_data = {
             "conversation_id": conversation_id,
-            "created_at": datetime.now().isoformat(),
+            "created_at": datetime.fromtimestamp(created_at_ns / 1_000_000_000).isoformat(),
+            "created_at_ns": created_at_ns,
             "last_updated": datetime.now().isoformat(),
             "username": username,
             "metadata": metadata or {},
@@ -104,14 +334,8 @@ class AnalysisManager:
                 "coaching_tips": None,
                 "sentiment_interpretation": None
             },
-            "analysis_status": {
-                # 각 분석의 완료 상태
-                "comprehensive": False,
-                "quick_feedback": False,
-                "child_development": False,
-                "coaching_tips": False,
-                "sentiment_interpretation": False
-            }
+            # 각 분석의 완료 상태 (_ANALYSIS_ORDER 순서의 비트)
+            "analysis_status_bits": 0
         }
         
         # 초기 데이터 저장
@@ -124,7 +348,8 @@ class AnalysisManager:
             return None
     
     def update_analysis_result(self, conversation_id: str, analysis_type: str, 
-                             result: Dict[str, Any], username: str = None) -> bool:
+                             result: Dict[str, Any], username: str = None,
+                             flush: bool = True) -> bool:
         """
         특정 분석 유형의 결과를 업데이트합니다.
         
@@ -133,6 +358,7 @@ class AnalysisManager:
             analysis_type: 분석 유형 ('comprehensive', 'quick_feedback' 등)
             result: 분석 결과
             username: 사용자명 (선택사항)
+            flush: False이면 메모리에만 반영하고 flush_analysis 호출 시 한 번에 저장
             
         Returns:
             bool: 업데이트 성공 여부
@@ -146,13 +372,25 @@ class AnalysisManager:
                 logger.error(f"분석 데이터를 찾을 수 없음: {conversation_id}")
                 return False
             
+            # 캐시된 문서를 직접 고치면 저장이 실패하거나 미뤄졌을 때도 이후 로드에
+            # 저장되지 않은 결과가 보이므로, 바꿀 두 단계(최상위, analyses)만 복사해서 수정
+            analysis_data = {**analysis_data, "analyses": dict(analysis_data["analyses"])}
+            
             # 분석 결과 업데이트
             analysis_data["analyses"][analysis_type] = result
-            analysis_data["analysis_status"][analysis_type] = result.get("success", False)
+            if result.get("success", False):
+                analysis_data["analysis_status_bits"] |= _STATUS_BIT[analysis_type]
+            else:
+                analysis_data["analysis_status_bits"] &= ~_STATUS_BIT[analysis_type]
             analysis_data["last_updated"] = datetime.now().isoformat()
             
             logger.info(f"분석 결과 업데이트 완료: {analysis_type} - 성공: {result.get('success', False)}")
             
+            if not flush:
+                self._pending[conversation_id] = analysis_data
+                return True
+            self._pending.pop(conversation_id, None)
+            
             # 저장
             success = self._save_analysis_data(conversation_id, analysis_data)
             if success:
@@ -167,10 +405,28 @@ class AnalysisManager:
             logger.exception("상세 오류 정보:")
             return False
     
+    def flush_analysis(self, conversation_id: str) -> bool:
+        """
+        flush=False로 모아 둔 분석 업데이트를 디스크에 저장합니다.
+        
+        Args:
+            conversation_id: 대화 ID
+            
+        Returns:
+            bool: 저장 성공 여부 (저장할 내용이 없으면 True)
+        """
+        analysis_data = self._pending.pop(conversation_id, None)
+        if analysis_data is None:
+            return True
+        return self._save_analysis_data(conversation_id, analysis_data)
+    
     def load_analysis(self, conversation_id: str, username: str = None) -> Optional[Dict[str, Any]]:
         """
         저장된 분석 데이터를 로드합니다.
         
+        아직 저장하지 않은 업데이트가 있으면 그 데이터를, 파일이 마지막으로 읽은 뒤
+        바뀌지 않았으면 캐시된 데이터를 반환합니다.
+        
         Args:
             conversation_id: 대화 ID
             username: 사용자명 (선택사항)
@@ -178,38 +434,58 @@ class AnalysisManager:
         Returns:
             Optional[Dict]: 분석 데이터 (없으면 None)
         """
-        # 사용자별 디렉터리에서 먼저 찾기
+        pending = self._pending.get(conversation_id)
+        if pending is not None:
+            return pending
+        
+        # 사용자별 디렉터리에서 먼저 찾고, 없으면 기본 디렉터리에서 찾기 (하위 호환성)
+        # exists()로 미리 확인하지 않고 바로 열어 보고 없으면 다음 후보로 넘어감
+        candidates = []
         if username:
-            user_file_path = self.results_dir / username / f"{conversation_id}.json"
-            logger.info(f"사용자별 파일 경로 확인: {user_file_path}")
-            if user_file_path.exists():
-                try:
-                    with open(user_file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        logger.info(f"사용자별 분석 데이터 로드 성공: {conversation_id}")
-                        return data
-                except Exception as e:
-                    logger.error(f"사용자별 분석 데이터 로드 실패: {e}")
-            else:
-                logger.warning(f"사용자별 파일이 존재하지 않음: {user_file_path}")
+            candidates.append(("사용자별", self.results_dir / username / f"{conversation_id}.json"))
+        candidates.append(("기본", self.results_dir / f"{conversation_id}.json"))
         
-        # 기본 디렉터리에서 찾기 (하위 호환성)
-        default_file_path = self.results_dir / f"{conversation_id}.json"
-        logger.info(f"기본 파일 경로 확인: {default_file_path}")
-        if default_file_path.exists():
+        for location, file_path in candidates:
             try:
-                with open(default_file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    logger.info(f"기본 분석 데이터 로드 성공: {conversation_id}")
-                    return data
+                data = self._read_document(file_path)
+            except FileNotFoundError:
+                logger.warning("%s 파일이 존재하지 않음: %s", location, file_path)
+                continue
             except Exception as e:
-                logger.error(f"기본 분석 데이터 로드 실패: {e}")
-        else:
-            logger.warning(f"기본 파일이 존재하지 않음: {default_file_path}")
+                logger.error("%s 분석 데이터 로드 실패: %s", location, e)
+                continue
+            logger.info("%s 분석 데이터 로드 성공: %s", location, conversation_id)
+            return data
         
         logger.error(f"분석 데이터를 찾을 수 없음: {conversation_id}")
         return None
     
+    def _read_document(self, file_path: Path) -> Dict[str, Any]:
+        """분석 파일을 읽습니다. (mtime_ns, size)가 캐시와 같으면 다시 파싱하지 않습니다."""
+        key = str(file_path)
+        st = os.stat(key)
+        with self._lock:
+            cached = self._doc_cache.get(key)
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                self._doc_cache.move_to_end(key)
+                return cached[2]
+        
+        data = _load_json(key)
+        if "analysis_status" in data:
+            # 이전 형식: 상태 딕셔너리를 비트로 바꿔 두면 다음 저장 때 새 형식으로 기록됨
+            data["analysis_status_bits"] = _status_bits(data)
+            del data["analysis_status"]
+        self._cache_document(key, st, data)
+        return data
+    
+    def _cache_document(self, key: str, st: os.stat_result, data: Dict[str, Any]):
+        """분석 문서를 파일 상태와 함께 캐시합니다."""
+        with self._lock:
+            self._doc_cache[key] = (st.st_mtime_ns, st.st_size, data)
+            self._doc_cache.move_to_end(key)
+            if len(self._doc_cache) > DOC_CACHE_SIZE:
+                self._doc_cache.popitem(last=False)
+    
     def get_analysis_result(self, conversation_id: str, analysis_type: str, username: str = None) -> Optional[Dict[str, Any]]:
         """
         특정 분석 유형의 결과를 가져옵니다.
@@ -244,7 +520,7 @@ class AnalysisManager:
         if not analysis_data:
             return False
         
-        return analysis_data.get("analysis_status", {}).get(analysis_type, False)
+        return bool(_status_bits(analysis_data) & _STATUS_BIT.get(analysis_type, 0))
     
     def get_analysis_status(self, conversation_id: str) -> Dict[str, bool]:
         """
@@ -260,14 +536,15 @@ class AnalysisManager:
         if not analysis_data:
             return {analysis_type: False for analysis_type in self.analysis_types.keys()}
         
-        return analysis_data.get("analysis_status", {})
+        return _status_dict(_status_bits(analysis_data))
     
-    def get_all_analyses(self, username: str = None) -> List[Dict[str, Any]]:
+    def get_all_analyses(self, username: str = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         모든 저장된 분석 목록을 가져옵니다.
         
         Args:
             username: 특정 사용자의 분석만 가져올 경우 사용자명
+            limit: 최신 분석 몇 개만 필요할 때 개수 (전체를 정렬하지 않고 상위만 고름)
         
         Returns:
             List[Dict]: 분석 목록 (최신순)
@@ -275,54 +552,148 @@ class AnalysisManager:
         analyses = []
         
         try:
-            if username:
-                # 특정 사용자의 분석만 가져오기
-                user_dir = self.results_dir / username
-                if user_dir.exists():
-                    json_files = list(user_dir.glob("*.json"))
+            # 캐시에 없는 파일만 모아 두었다가 한꺼번에 읽음
+            misses = []
+            for file_path, entry in self._iter_result_files(username):
+                try:
+                    st = entry.stat()
+                except OSError as e:
+                    logger.warning("파일 읽기 오류 %s: %s", file_path, e)
+                    continue
+                summary = self._cached_summary(file_path, st)
+                if summary is not None:
+                    analyses.append(summary)
                 else:
-                    json_files = []
+                    misses.append((file_path, st))
+            
+            # 파일 읽기/파싱은 스레드 풀에서 병렬로 하고, 캐시 갱신은 이 스레드에서만 함
+            if len(misses) > 1:
+                # 파싱하는 동안 커널이 나머지 파일을 미리 읽도록 별도 스레드에서 readahead 요청
+                if hasattr(os, "posix_fadvise"):
+                    threading.Thread(
+                        target=_prefetch_files,
+                        args=([file_path for file_path, _ in misses],),
+                        name="analysis-prefetch",
+                        daemon=True
+                    ).start()
+                with ThreadPoolExecutor(max_workers=min(SUMMARY_WORKERS, len(misses))) as executor:
+                    loaded = list(executor.map(self._load_summary, [file_path for file_path, _ in misses]))
             else:
-                # 모든 분석 가져오기 (사용자별 디렉터리와 기본 디렉터리 모두)
-                json_files = list(self.results_dir.glob("*.json"))
-                
-                # 사용자별 디렉터리도 검색
-                for user_dir in self.results_dir.iterdir():
-                    if user_dir.is_dir() and user_dir.name != "shared":
-                        json_files.extend(list(user_dir.glob("*.json")))
+                loaded = [self._load_summary(file_path) for file_path, _ in misses]
             
-            for file_path in json_files:
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        
-                        # 요약 정보 생성
-                        summary = {
-                            "conversation_id": data.get("conversation_id"),
-                            "created_at": data.get("created_at"),
-                            "last_updated": data.get("last_updated"),
-                            "username": data.get("username"),
-                            "metadata": data.get("metadata", {}),
-                            "transcript_preview": self._get_transcript_preview(data),
-                            "completed_analyses": sum(1 for status in data.get("analysis_status", {}).values() if status),
-                            "total_analyses": len(self.analysis_types),
-                            "analysis_status": data.get("analysis_status", {}),
-                            "file_path": str(file_path)
-                        }
-                        analyses.append(summary)
-                        
-                except Exception as e:
-                    print(f"파일 읽기 오류 {file_path}: {e}")
-                    continue
+            for (file_path, st), summary in zip(misses, loaded):
+                if summary is not None:
+                    self._store_summary(file_path, st, summary)
+                    analyses.append(summary)
             
-            # 최신순 정렬
-            analyses.sort(key=lambda x: x.get("created_at", ""), reverse=True)
+            # 최신순 정렬 (문자열 대신 정수 생성 시각 비교)
+            if limit is not None:
+                return heapq.nlargest(limit, analyses, key=_sort_key)
+            analyses.sort(key=_sort_key, reverse=True)
             
         except Exception as e:
-            print(f"분석 목록 조회 실패: {e}")
+            logger.exception("분석 목록 조회 실패: %s", e)
         
         return analyses
     
+    def _iter_result_files(self, username: str = None):
+        """
+        분석 결과마다 요약을 읽을 파일을 (경로 문자열, DirEntry)로 순회합니다.
+        
+        요약 파일(.meta.json)이 있으면 그것을, 없으면(이전 버전에서 저장된 분석) 전체 JSON을 돌려줍니다.
+        os.scandir로 디렉터리마다 한 번만 읽고, 파일/디렉터리 판별은 DirEntry 캐시를 사용합니다.
+        username이 없으면 기본 디렉터리와 사용자별 디렉터리("shared" 제외)를 모두 순회합니다.
+        """
+        root = os.fspath(self.results_dir)
+        if username:
+            # 특정 사용자의 분석만 가져오기
+            directories = [os.path.join(root, username)]
+        else:
+            # 모든 분석 가져오기 (사용자별 디렉터리와 기본 디렉터리 모두)
+            directories = [root]
+        
+        while directories:
+            directory = directories.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = {entry.name: entry for entry in it}
+                for name, entry in entries.items():
+                    if name.endswith(META_SUFFIX):
+                        continue
+                    if name.endswith(".json") and entry.is_file(follow_symlinks=False):
+                        meta_entry = entries.get(name[:-len(".json")] + META_SUFFIX)
+                        if meta_entry is not None:
+                            yield meta_entry.path, meta_entry
+                        else:
+                            yield entry.path, entry
+                    elif (not username and directory == root
+                          and name != "shared" and entry.is_dir(follow_symlinks=False)):
+                        directories.append(entry.path)
+            except FileNotFoundError:
+                continue
+    
+    def _get_summary(self, file_path: str, st: os.stat_result) -> Dict[str, Any]:
+        """
+        분석의 요약 정보를 반환합니다.
+        
+        file_path는 요약 파일(.meta.json) 또는 전체 분석 파일입니다.
+        파일의 (mtime_ns, size)가 캐시된 값과 같으면 다시 읽지 않고 캐시된 요약을 재사용합니다.
+        """
+        summary = self._cached_summary(file_path, st)
+        if summary is None:
+            summary = self._build_summary(file_path)
+            self._store_summary(file_path, st, summary)
+        return summary
+    
+    def _cached_summary(self, file_path: str, st: os.stat_result) -> Optional[Dict[str, Any]]:
+        """파일 상태가 그대로인 캐시된 요약을 반환합니다. 없거나 바뀌었으면 None을 반환합니다."""
+        with self._lock:
+            cached = self._summary_cache.get(file_path)
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                self._summary_cache.move_to_end(file_path)
+                return cached[2]
+        return None
+    
+    def _build_summary(self, file_path: str) -> Dict[str, Any]:
+        """파일을 읽어 요약 정보를 만듭니다 (캐시를 건드리지 않으므로 작업 스레드에서 호출 가능)."""
+        data = _load_json(file_path)
+        if file_path.endswith(META_SUFFIX):
+            meta = data
+            analysis_path = file_path[:-len(META_SUFFIX)] + ".json"
+        else:
+            meta = self._build_meta(data)
+            analysis_path = file_path
+        status_bits = _status_bits(meta)
+        
+        # 요약 정보 생성
+        summary = {
+            **meta,
+            "analysis_status": _status_dict(status_bits),
+            "completed_analyses": bin(status_bits).count("1"),
+            "total_analyses": len(self.analysis_types),
+            "file_path": analysis_path,
+            "created_at_ns": _created_at_ns(meta),
+            **_recording_fields(meta)
+        }
+        summary["_search_blob"] = _search_blob(summary)
+        return summary
+    
+    def _load_summary(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """_build_summary와 같지만 읽기 오류는 기록하고 None을 반환합니다."""
+        try:
+            return self._build_summary(file_path)
+        except Exception as e:
+            logger.warning("파일 읽기 오류 %s: %s", file_path, e)
+            return None
+    
+    def _store_summary(self, file_path: str, st: os.stat_result, summary: Dict[str, Any]):
+        """요약을 파일 상태와 함께 캐시합니다."""
+        with self._lock:
+            self._summary_cache[file_path] = (st.st_mtime_ns, st.st_size, summary)
+            self._summary_cache.move_to_end(file_path)
+            if len(self._summary_cache) > SUMMARY_CACHE_SIZE:
+                self._summary_cache.popitem(last=False)
+    
     def delete_analysis(self, conversation_id: str, username: str = None) -> bool:
         """
         분석 데이터를 삭제합니다.
@@ -337,33 +708,33 @@ class AnalysisManager:
         try:
             deleted = False
             deleted_files = []
+            self._pending.pop(conversation_id, None)
             
-            # 사용자별 디렉터리에서 삭제 시도
+            # 사용자별 디렉터리와 기본 디렉터리(하위 호환성)에서 삭제 시도
+            candidates = []
             if username:
-                user_file_path = self.results_dir / username / f"{conversation_id}.json"
-                if user_file_path.exists():
-                    user_file_path.unlink()
-                    deleted_files.append(str(user_file_path))
-                    deleted = True
+                candidates.append(self.results_dir / username / f"{conversation_id}.json")
+            candidates.append(self.results_dir / f"{conversation_id}.json")
             
-            # 기본 디렉터리에서도 삭제 시도 (하위 호환성)
-            default_file_path = self.results_dir / f"{conversation_id}.json"
-            if default_file_path.exists():
-                default_file_path.unlink()
-                deleted_files.append(str(default_file_path))
+            for file_path in candidates:
+                try:
+                    file_path.unlink()
+                except FileNotFoundError:
+                    continue
+                self._forget_file(file_path)
+                self._update_token_index(file_path, None)
+                deleted_files.append(str(file_path))
                 deleted = True
             
             if deleted:
-                print(f"✅ 분석 삭제 성공: {conversation_id} (삭제된 파일: {len(deleted_files)}개)")
+                logger.info("분석 삭제 성공: %s (삭제된 파일: %d개)", conversation_id, len(deleted_files))
             else:
-                print(f"⚠️ 삭제할 파일 없음: {conversation_id}")
+                logger.warning("삭제할 파일 없음: %s", conversation_id)
             
             return deleted
             
         except Exception as e:
-            print(f"❌ 분석 삭제 실패: {e}")
-            import traceback
-            print(f"상세 오류: {traceback.format_exc()}")
+            logger.exception("분석 삭제 실패: %s", e)
             return False
     
     def search_analyses(self, keyword: str) -> List[Dict[str, Any]]:
@@ -376,29 +747,147 @@ class AnalysisManager:
         Returns:
             List[Dict]: 검색 결과
         """
-        all_analyses = self.get_all_analyses()
-        
         if not keyword:
-            return all_analyses
+            return self.get_all_analyses()
         
         keyword_lower = keyword.lower()
-        filtered_analyses = []
-        
-        for analysis in all_analyses:
-            # 전사 미리보기, 사용자명, 메타데이터에서 키워드 검색
-            preview = analysis.get("transcript_preview", "").lower()
-            username = analysis.get("username", "").lower()
-            metadata = analysis.get("metadata", {})
-            child_name = metadata.get("child_name", "").lower()
-            description = metadata.get("description", "").lower()
+        all_analyses = self._indexed_candidates(keyword_lower)
+        if all_analyses is None:
+            # 색인이 없거나 단어가 없는 키워드는 전체 목록을 훑고, 그 결과로 색인을 다시 만듦
+            all_analyses = self.get_all_analyses()
+            if self._token_index is None:
+                self._rebuild_token_index(all_analyses)
+        
+        # 전사 미리보기, 사용자명, 메타데이터에서 키워드 검색 (요약에 미리 만들어 둔 소문자 검색 문자열 사용)
+        return [analysis for analysis in all_analyses if keyword_lower in analysis["_search_blob"]]
+    
+    def _build_meta(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """분석 데이터에서 목록 표시에 필요한 필드만 뽑아 요약 파일 내용을 만듭니다."""
+        return {
+            "conversation_id": data.get("conversation_id"),
+            "created_at": data.get("created_at"),
+            "created_at_ns": _created_at_ns(data),
+            "last_updated": data.get("last_updated"),
+            "username": data.get("username"),
+            "metadata": data.get("metadata", {}),
+            "transcript_preview": self._get_transcript_preview(data),
+            "analysis_status_bits": _status_bits(data),
+            **_recording_fields(data)
+        }
+    
+    def _indexed_candidates(self, keyword_lower: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        역색인으로 키워드 후보 분석의 요약만 읽어 반환합니다 (최신순).
+        
+        키워드의 각 토큰을 부분 문자열로 포함하는 색인 토큰의 문서를 모은 뒤 교집합을 구하므로,
+        기존의 부분 문자열 검색 결과를 빠뜨리지 않는 후보 집합이 됩니다.
+        색인을 쓸 수 없으면 None을 반환합니다.
+        """
+        query_tokens = set(_tokenize(keyword_lower))
+        with self._lock:
+            if self._token_index is None or not query_tokens:
+                return None
             
-            if (keyword_lower in preview or 
-                keyword_lower in username or
-                keyword_lower in child_name or
-                keyword_lower in description):
-                filtered_analyses.append(analysis)
+            candidates: Optional[set] = None
+            for query_token in query_tokens:
+                matched = set()
+                for token, docs in self._token_index.items():
+                    if query_token in token:
+                        matched |= docs
+                candidates = matched if candidates is None else candidates & matched
+                if not candidates:
+                    return []
         
-        return filtered_analyses
+        analyses = []
+        for rel_path in candidates:
+            file_path = os.path.join(self.results_dir, rel_path)
+            try:
+                try:
+                    meta_path = _meta_path(file_path)
+                    analyses.append(self._get_summary(meta_path, os.stat(meta_path)))
+                except FileNotFoundError:
+                    analyses.append(self._get_summary(file_path, os.stat(file_path)))
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                logger.error(f"파일 읽기 오류 {file_path}: {e}")
+        
+        analyses.sort(key=_sort_key, reverse=True)
+        return analyses
+    
+    def _search_tokens(self, summary: Dict[str, Any]) -> List[str]:
+        """요약 정보의 검색 대상 필드(전사 미리보기, 사용자명, 아동 이름, 설명)에서 토큰을 추출합니다."""
+        return sorted(set(_tokenize(summary.get("_search_blob") or _search_blob(summary))))
+    
+    def _load_token_index(self):
+        """디스크의 역색인을 읽습니다. 없거나 손상되었으면 색인 없이 시작합니다."""
+        try:
+            stored = _load_json(self._index_path)
+            self._doc_tokens = {rel_path: list(tokens) for rel_path, tokens in stored["docs"].items()}
+        except FileNotFoundError:
+            logger.info("검색 색인 없음 - 첫 검색 시 생성합니다")
+            return
+        except Exception as e:
+            logger.warning(f"검색 색인 로드 실패, 첫 검색 시 다시 생성합니다: {e}")
+            return
+        
+        self._token_index = {}
+        for rel_path, tokens in self._doc_tokens.items():
+            for token in tokens:
+                self._token_index.setdefault(token, set()).add(rel_path)
+        logger.info(f"검색 색인 로드 완료: 문서 {len(self._doc_tokens)}개, 토큰 {len(self._token_index)}개")
+    
+    def _save_token_index(self):
+        """
+        역색인을 디스크에 원자적으로 저장합니다.
+        
+        토큰 -> 문서 맵은 로드할 때 문서별 토큰에서 다시 만들므로 문서별 토큰만 저장합니다.
+        """
+        try:
+            _write_atomic(self._index_path, _dump_json({"docs": self._doc_tokens}))
+        except Exception as e:
+            logger.error(f"검색 색인 저장 실패: {e}")
+    
+    def _rebuild_token_index(self, analyses: List[Dict[str, Any]]):
+        """분석 목록 요약으로 역색인을 새로 만듭니다."""
+        with self._lock:
+            self._token_index = {}
+            self._doc_tokens = {}
+            for summary in analyses:
+                rel_path = os.path.relpath(summary["file_path"], self.results_dir)
+                self._doc_tokens[rel_path] = self._search_tokens(summary)
+                for token in self._doc_tokens[rel_path]:
+                    self._token_index.setdefault(token, set()).add(rel_path)
+            self._save_token_index()
+            logger.info(f"검색 색인 생성 완료: 문서 {len(self._doc_tokens)}개")
+    
+    def _update_token_index(self, file_path: Path, summary: Optional[Dict[str, Any]]):
+        """
+        한 분석 파일의 색인을 갱신합니다 (summary가 None이면 색인에서 제거).
+        
+        이전 토큰과 새 토큰의 차이만 반영합니다. 색인이 아직 없으면 아무것도 하지 않습니다.
+        """
+        with self._lock:
+            if self._token_index is None:
+                return
+            
+            rel_path = os.path.relpath(file_path, self.results_dir)
+            old_tokens = set(self._doc_tokens.pop(rel_path, ()))
+            new_tokens = set(self._search_tokens(summary)) if summary is not None else set()
+            if summary is not None:
+                self._doc_tokens[rel_path] = sorted(new_tokens)
+            if old_tokens == new_tokens and summary is not None:
+                return
+            
+            for token in old_tokens - new_tokens:
+                docs = self._token_index.get(token)
+                if docs is not None:
+                    docs.discard(rel_path)
+                    if not docs:
+                        del self._token_index[token]
+            for token in new_tokens - old_tokens:
+                self._token_index.setdefault(token, set()).add(rel_path)
+            self._save_token_index()
     
     def _save_analysis_data(self, conversation_id: str, data: Dict[str, Any]) -> bool:
         """분석 데이터를 파일에 저장합니다."""
@@ -408,7 +897,7 @@ class AnalysisManager:
         username = data.get('username')
         if username:
             user_dir = self.results_dir / username
-            user_dir.mkdir(exist_ok=True)
+            self._ensure_dir(user_dir)
             file_path = user_dir / f"{conversation_id}.json"
             logger.info(f"사용자별 디렉터리 사용: {user_dir}")
         else:
@@ -417,8 +906,21 @@ class AnalysisManager:
             logger.info(f"기본 디렉터리 사용: {self.results_dir}")
         
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            # 전체 분석 파일과 목록용 요약 파일을 각각 원자적으로 교체
+            meta = self._build_meta(data)
+            payload = _dump_json(data)
+            try:
+                _write_atomic(file_path, payload)
+            except FileNotFoundError:
+                # 프로세스 실행 중에 디렉터리가 지워진 경우: 다시 만들고 한 번 더 시도
+                self._ensured_dirs.discard(os.fspath(file_path.parent))
+                self._ensure_dir(file_path.parent)
+                _write_atomic(file_path, payload)
+            _write_atomic(_meta_path(file_path), _dump_json(meta))
+            self._summary_cache.pop(str(file_path), None)
+            self._summary_cache.pop(_meta_path(file_path), None)
+            self._cache_document(str(file_path), os.stat(file_path), data)
+            self._update_token_index(file_path, meta)
             logger.info(f"분석 데이터 저장 완료: {file_path}")
             return True
         except Exception as e:
@@ -426,6 +928,14 @@ class AnalysisManager:
             logger.exception("상세 오류 정보:")
             return False
     
+    def _forget_file(self, file_path: Path):
+        """삭제된 분석 파일의 요약 파일과 캐시 항목을 정리합니다."""
+        meta_path = _meta_path(file_path)
+        Path(meta_path).unlink(missing_ok=True)
+        self._summary_cache.pop(str(file_path), None)
+        self._summary_cache.pop(meta_path, None)
+        self._doc_cache.pop(str(file_path), None)
+    
     def _get_transcript_preview(self, data: Dict[str, Any], max_length: int = 100) -> str:
         """전사본의 미리보기 텍스트를 생성합니다."""
         transcript = data.get("transcription", {}).get("transcript", "")
@@ -457,8 +967,8 @@ class AnalysisManager:
         try:
             if format_type == "json":
                 export_path = self.results_dir / f"{conversation_id}_export.json"
-                with open(export_path, 'w', encoding='utf-8') as f:
-                    json.dump(analysis_data, f, ensure_ascii=False, indent=2)
+                with open(export_path, 'wb') as f:
+                    f.write(_dump_json(analysis_data))
                 return str(export_path)
             
             elif format_type == "txt":
@@ -468,40 +978,30 @@ class AnalysisManager:
                 return str(export_path)
             
         except Exception as e:
-            print(f"분석 내보내기 실패: {e}")
+            logger.exception("분석 내보내기 실패: %s", e)
         
         return None
     
     def _write_text_report(self, file, data: Dict[str, Any]):
-        """텍스트 형식으로 분석 보고서를 작성합니다."""
-        file.write(f"KindCoach 분석 보고서\n")
-        file.write(f"=" * 50 + "\n\n")
-        file.write(f"대화 ID: {data.get('conversation_id', 'N/A')}\n")
-        file.write(f"분석 일시: {data.get('created_at', 'N/A')}\n")
-        file.write(f"최종 수정: {data.get('last_updated', 'N/A')}\n\n")
+        """텍스트 형식으로 분석 보고서를 작성합니다 (내용을 모아 한 번에 씀)."""
+        parts = [
+            "KindCoach 분석 보고서\n",
+            "=" * 50 + "\n\n",
+            f"대화 ID: {data.get('conversation_id', 'N/A')}\n",
+            f"분석 일시: {data.get('created_at', 'N/A')}\n",
+            f"최종 수정: {data.get('last_updated', 'N/A')}\n\n"
+        ]
         
         # 전사본
         transcript = data.get("transcription", {}).get("transcript", "")
         if transcript:
-            file.write("📝 대화 전사\n")
-            file.write("-" * 20 + "\n")
-            file.write(transcript + "\n\n")
+            parts += ("📝 대화 전사\n", "-" * 20 + "\n", transcript, "\n\n")
         
         # 각 분석 결과
         analyses = data.get("analyses", {})
-        for analysis_type, result in analyses.items():
+        for analysis_type, icon, name, field in self._report_dispatch:
+            result = analyses.get(analysis_type)
             if result and result.get("success"):
-                analysis_info = self.analysis_types.get(analysis_type, {})
-                file.write(f"{analysis_info.get('icon', '📋')} {analysis_info.get('name', analysis_type)}\n")
-                file.write("-" * 30 + "\n")
-                
-                if analysis_type == "comprehensive":
-                    file.write(result.get("analysis", "") + "\n\n")
-                elif analysis_type == "quick_feedback":
-                    file.write(result.get("feedback", "") + "\n\n")
-                elif analysis_type == "child_development":
-                    file.write(result.get("development_analysis", "") + "\n\n")
-                elif analysis_type == "coaching_tips":
-                    file.write(result.get("coaching_tips", "") + "\n\n")
-                elif analysis_type == "sentiment_interpretation":
-                    file.write(result.get("interpretation", "") + "\n\n")
\ No newline at end of file
+                parts += (f"{icon} {name}\n", "-" * 30 + "\n", result.get(field, ""), "\n\n")
+        
+        file.write("".join(parts))
\ No newline at end of file
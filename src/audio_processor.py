@@ -4,45 +4,158 @@ AssemblyAI 기반 오디오 처리 모듈
 """
 
 import os
-import assemblyai as aai
-from typing import Dict, List, Any, Optional
+import asyncio
+import contextlib
+import hashlib
+import io
+import json
+import httpx
+import numpy as np
+from typing import TYPE_CHECKING, BinaryIO, Dict, List, Any, Optional, Tuple, Union
 import requests
+import shutil
+import subprocess
 import tempfile
+from mutagen import File as MutagenFile
 from datetime import datetime
+import logging
+from email.utils import parsedate_to_datetime
+from tenacity import (
+    retry,
+    wait_random_exponential,
+    stop_after_attempt,
+    retry_if_exception,
+    before_sleep_log
+)
 import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from src.logging_config import get_logger, log_performance, log_api_call
+from src.rate_limiter import TokenBucket
+
+# assemblyai SDK는 import 비용이 커서(수백 ms) 응답 파싱 시점에 불러옴 (로그인 화면 콜드 스타트 단축)
+if TYPE_CHECKING:
+    from assemblyai.types import TranscriptResponse
+
+try:
+    import blake3
+except ImportError:  # 선택 의존성: 없으면 표준 라이브러리의 BLAKE2b 사용
+    blake3 = None
 
 # 로거 설정
 logger = get_logger(__name__)
 
+# 업로드 파일을 임시 파일로 복사할 때의 버퍼 크기 (긴 오디오 분할 시에만 사용)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# AssemblyAI REST API 설정 (업로드 → 전사 요청 → 상태 폴링)
+ASSEMBLYAI_BASE_URL = "https://api.assemblyai.com/v2"
+UPLOAD_STREAM_CHUNK = 5 << 20  # 업로드 스트림 청크 크기 (5MiB)
+POLL_INITIAL_DELAY = 1.0  # 첫 폴링까지 대기 시간 (초)
+POLL_BACKOFF = 1.5  # 폴링 간격 증가 배수
+POLL_MAX_DELAY = 10.0  # 폴링 간격 상한 (초)
+HTTP_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+# 전사 요청 설정 (POST /v2/transcript 본문)
+TRANSCRIPTION_CONFIG = {
+    "language_code": "ko",  # 한국어 설정
+    "speaker_labels": True,  # 화자 분리 활성화
+    # 한국어에서 지원되지 않는 기능들 제거
+    # "auto_highlights": True,  # 중요 구간 자동 감지 (한국어 미지원)
+    # "sentiment_analysis": True,  # 감정 분석 (한국어 미지원)
+    # "entity_detection": True,  # 개체명 인식 (한국어 미지원)
+}
+
+# AssemblyAI 요청 한도 (5분당 20,000건 → 분당 4,000건)
+ASSEMBLYAI_REQUESTS_PER_MINUTE = 4000
+RETRY_AFTER_MAX = 60.0  # Retry-After 헤더를 따를 때의 대기 상한 (초)
+
+# 긴 녹음 분할 전사 설정 (화자 라벨이 조각마다 따로 붙으므로 기본은 꺼 둠)
+LONG_AUDIO_SECONDS = 10 * 60  # 이보다 긴 오디오만 분할
+CHUNK_SECONDS = 120  # 조각 길이 (초)
+MAX_CONCURRENT_TRANSCRIPTS = 8  # 동시에 진행할 전사 작업 수
+
+# 같은 오디오를 다시 올렸을 때 재전사하지 않도록 내용 해시로 전사 결과를 보관하는 디렉터리
+TRANSCRIPT_CACHE_DIR = "data/transcript_cache"
+TRANSCRIPT_CACHE_MAX_FILES = 200  # 이보다 많으면 오래 쓰지 않은 결과부터 삭제
+HASH_READ_SIZE = 1 << 20  # 해시 계산 시 한 번에 읽을 바이트 수
+
+
+# 업로드/전사 요청/폴링 모두 같은 버킷을 거침 (API 키별 AudioProcessor나 스크립트에서 만든
+# 인스턴스가 여럿이어도 프로세스 전체가 한도를 공유하도록 모듈 수준에 둠)
+_request_bucket = TokenBucket(ASSEMBLYAI_REQUESTS_PER_MINUTE, name="AssemblyAI RPM")
+
+_backoff_wait = wait_random_exponential(min=1, max=30)
+
+
+def _is_retryable(error: BaseException) -> bool:
+    """429/5xx 응답과 연결 오류만 재시도합니다 (그 밖의 4xx는 즉시 전파)."""
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 시간으로 바꿉니다. 없거나 해석할 수 없으면 None."""
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        seconds = (retry_at - datetime.now(retry_at.tzinfo)).total_seconds()
+    return min(max(seconds, 0.0), RETRY_AFTER_MAX)
+
+
+def _wait_retry_after(retry_state) -> float:
+    """429 응답에 Retry-After가 있으면 그만큼, 없으면 지터가 있는 지수 백오프로 기다립니다."""
+    error = retry_state.outcome.exception()
+    if isinstance(error, httpx.HTTPStatusError):
+        seconds = _retry_after_seconds(error.response)
+        if seconds is not None:
+            return seconds
+    return _backoff_wait(retry_state)
+
+
+assemblyai_retry = retry(
+    wait=_wait_retry_after,
+    stop=stop_after_attempt(5),
+    retry=retry_if_exception(_is_retryable),
+    before_sleep=before_sleep_log(logger, logging.WARNING),
+    reraise=True
+)
+
 
 class AudioProcessor:
-    def __init__(self, api_key: str = None):
-        """AssemblyAI API 키로 초기화"""
+    def __init__(self, api_key: str = None, cache_dir: str = TRANSCRIPT_CACHE_DIR, chunk_long_audio: bool = False):
+        """
+        AssemblyAI API 키로 초기화
+        
+        Args:
+            api_key: AssemblyAI API 키 (없으면 ASSEMBLYAI_API_KEY 환경 변수)
+            cache_dir: 전사 결과 캐시 디렉터리
+            chunk_long_audio: 긴 녹음을 CHUNK_SECONDS 단위로 나눠 동시에 전사할지 여부.
+                조각마다 화자 분리가 따로 이루어져 조각 사이의 화자 라벨이 일치한다는
+                보장이 없으므로, 화자 구분이 중요한 교사-아동 분석에서는 끄고 사용합니다.
+        """
         logger.info("AudioProcessor 초기화 시작")
         
+        self.cache_dir = cache_dir
+        self.chunk_long_audio = chunk_long_audio
+        
         self.api_key = api_key or os.getenv("ASSEMBLYAI_API_KEY")
         if not self.api_key:
             logger.error("ASSEMBLYAI_API_KEY가 설정되지 않았습니다.")
             raise ValueError("ASSEMBLYAI_API_KEY가 설정되지 않았습니다.")
         
-        logger.info(f"AssemblyAI API 키 확인됨 (길이: {len(self.api_key)}자)")
+        logger.info("AssemblyAI API 키 확인됨 (길이: %d자)", len(self.api_key))
         
-        try:
-            aai.settings.api_key = self.api_key
-            self.config = aai.TranscriptionConfig(
-                language_code="ko",  # 한국어 설정
-                speaker_labels=True,  # 화자 분리 활성화
-                # 한국어에서 지원되지 않는 기능들 제거
-                # auto_highlights=True,  # 중요 구간 자동 감지 (한국어 미지원)
-                # sentiment_analysis=True,  # 감정 분석 (한국어 미지원)
-                # entity_detection=True,  # 개체명 인식 (한국어 미지원)
-            )
-            logger.info("AssemblyAI 설정 완료 (한국어, 화자분리 활성화)")
-        except Exception as e:
-            logger.error(f"AssemblyAI 설정 실패: {str(e)}")
-            raise
+        self._transcript_request = dict(TRANSCRIPTION_CONFIG)
+        logger.info("AssemblyAI 설정 완료 (한국어, 화자분리 활성화)")
         
         logger.info("AudioProcessor 초기화 완료")
     
@@ -51,29 +164,51 @@ class AudioProcessor:
         오디오 파일을 전사하고 화자를 구분합니다.
         
         Args:
-            audio_file: 업로드된 오디오 파일 (Streamlit UploadedFile)
+            audio_file: 업로드된 오디오 파일 (Streamlit UploadedFile),
+                디스크의 파일 경로 문자열 또는 open()으로 연 파일
             
         Returns:
             Dict: 전사 결과와 화자 정보
         """
         logger.info("오디오 전사 시작")
-        logger.info(f"파일명: {audio_file.name}, 크기: {audio_file.size} bytes")
         
+        tmp_file_path = None
         try:
-            # 임시 파일로 저장
-            logger.info("임시 파일 생성 중...")
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp_file:
-                tmp_file.write(audio_file.read())
-                tmp_file_path = tmp_file.name
+            # 이미 디스크에 있는 파일이면 복사 없이 그 경로를 그대로 업로드
+            audio_path = self._local_path(audio_file)
+            file_size = os.path.getsize(audio_path) if audio_path is not None else audio_file.size
+            logger.info("파일명: %s, 크기: %s bytes", audio_path or audio_file.name, file_size)
+            
+            # 같은 내용의 오디오를 전에 전사했다면 업로드 없이 저장된 결과를 반환
+            cache_path = self._cache_path(audio_file, audio_path)
+            cached = self._load_cached_result(cache_path)
+            if cached is not None:
+                logger.info("캐시된 전사 결과 사용: %s", cache_path)
+                return cached
             
-            logger.info(f"임시 파일 생성 완료: {tmp_file_path}")
+            if audio_path is not None:
+                logger.info("디스크의 원본 파일을 직접 업로드: %s", audio_path)
+                source = audio_path
+            elif self.chunk_long_audio:
+                # ffmpeg 분할에는 파일 경로가 필요하므로 이때만 임시 파일로 저장
+                # (전체를 메모리에 올리지 않고 1MiB 단위로 복사)
+                logger.info("임시 파일 생성 중...")
+                audio_file.seek(0)
+                with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp_file:
+                    tmp_file_path = source = tmp_file.name
+                    shutil.copyfileobj(audio_file, tmp_file, length=UPLOAD_CHUNK_SIZE)
+                
+                logger.info("임시 파일 생성 완료: %s", tmp_file_path)
+            else:
+                # 업로드 객체(파일 유사 객체)를 임시 파일 없이 그대로 스트리밍
+                logger.info("업로드 파일을 임시 파일 없이 바로 업로드")
+                source = audio_file
             
             # AssemblyAI로 전사 시작
             logger.info("AssemblyAI 전사 시작...")
             start_time = datetime.now()
             
-            transcriber = aai.Transcriber()
-            transcript = transcriber.transcribe(tmp_file_path, config=self.config)
+            transcript = self._transcribe_file(source)
             
             end_time = datetime.now()
             processing_time = (end_time - start_time).total_seconds()
@@ -84,31 +219,27 @@ class AudioProcessor:
                 endpoint="transcript",
                 duration=processing_time,
                 status="success",
-                file_size=audio_file.size,
+                file_size=file_size,
                 audio_duration=transcript.audio_duration,
                 confidence=transcript.confidence
             )
             
-            logger.info(f"AssemblyAI 전사 완료 (처리 시간: {processing_time:.2f}초)")
+            logger.info("AssemblyAI 전사 완료 (처리 시간: %.2f초)", processing_time)
             
-            # 임시 파일 정리
-            os.unlink(tmp_file_path)
-            logger.info("임시 파일 정리 완료")
-            
-            if transcript.status == aai.TranscriptStatus.error:
-                logger.error(f"전사 실패: {transcript.error}")
+            if transcript.status == "error":
+                logger.error("전사 실패: %s", transcript.error)
                 return {
                     "success": False,
                     "error": f"전사 실패: {transcript.error}",
                     "transcript": None
                 }
             
-            logger.info(f"전사 성공 - 신뢰도: {transcript.confidence:.2f}, 오디오 길이: {transcript.audio_duration}초")
+            logger.info("전사 성공 - 신뢰도: %.2f, 오디오 길이: %s초", transcript.confidence, transcript.audio_duration)
             
             # 화자 구간 추출
             logger.info("화자 구간 추출 중...")
             speaker_segments = self._extract_speaker_segments(transcript)
-            logger.info(f"화자 구간 {len(speaker_segments)}개 추출 완료")
+            logger.info("화자 구간 %d개 추출 완료", len(speaker_segments))
             
             # 결과 정리
             result = {
@@ -124,17 +255,300 @@ class AudioProcessor:
                 "processing_time_seconds": processing_time
             }
             
-            logger.info(f"전사 결과 정리 완료 - 전사본 길이: {len(transcript.text)}자")
+            logger.info("전사 결과 정리 완료 - 전사본 길이: %d자", len(transcript.text))
+            self._store_cached_result(cache_path, result)
             return result
             
         except Exception as e:
-            logger.error(f"오디오 처리 중 오류 발생: {str(e)}")
+            logger.error("오디오 처리 중 오류 발생: %s", e)
             logger.exception("상세 오류 정보:")
             return {
                 "success": False,
                 "error": f"오디오 처리 중 오류 발생: {str(e)}",
                 "transcript": None
             }
+        finally:
+            # 임시 파일 정리 (전사 실패 시에도). 이미 지워진 경우의 오류가
+            # 원래 예외나 반환값을 가리지 않도록 FileNotFoundError는 무시
+            if tmp_file_path is not None:
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(tmp_file_path)
+                logger.info("임시 파일 정리 완료")
+    
+    def _cache_path(self, audio_file, audio_path: Optional[str]) -> str:
+        """
+        오디오 내용과 전사 설정의 해시(BLAKE3, 없으면 BLAKE2b)로 전사 결과 캐시 파일 경로를 만듭니다.
+        
+        언어/화자 분리 등 설정이 바뀌면 키도 바뀌어 이전 설정의 결과를 돌려주지 않습니다.
+        """
+        hasher = blake3.blake3() if blake3 is not None else hashlib.blake2b(digest_size=32)
+        config = dict(TRANSCRIPTION_CONFIG, chunk_long_audio=self.chunk_long_audio)
+        hasher.update(json.dumps(config, sort_keys=True).encode("utf-8"))
+
+        if audio_path is not None:
+            with open(audio_path, "rb") as f:
+                for block in iter(lambda: f.read(HASH_READ_SIZE), b""):
+                    hasher.update(block)
+        else:
+            audio_file.seek(0)
+            for block in iter(lambda: audio_file.read(HASH_READ_SIZE), b""):
+                hasher.update(block)
+            audio_file.seek(0)
+        return os.path.join(self.cache_dir, f"{hasher.hexdigest()}.json")
+    
+    @staticmethod
+    def _load_cached_result(cache_path: str) -> Optional[Dict[str, Any]]:
+        """캐시된 전사 결과를 읽습니다. 없거나 읽을 수 없으면 None을 반환합니다."""
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                result = json.load(f)
+            # 최근에 쓴 결과가 정리 대상에서 밀려나도록 수정 시각 갱신
+            os.utime(cache_path)
+            return result
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("전사 결과 캐시 읽기 실패 (무시하고 다시 전사): %s", e)
+            return None
+    
+    def _store_cached_result(self, cache_path: str, result: Dict[str, Any]):
+        """성공한 전사 결과를 캐시에 원자적으로 저장합니다 (실패해도 전사 결과에는 영향 없음)."""
+        tmp_path = None
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # 동시에 같은 결과를 저장해도 임시 파일이 겹치지 않도록 고유한 이름 사용
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=self.cache_dir, suffix=".tmp", delete=False
+            ) as f:
+                tmp_path = f.name
+                json.dump(result, f, ensure_ascii=False)
+            os.replace(tmp_path, cache_path)
+            tmp_path = None
+            self._evict_cached_results()
+        except OSError as e:
+            logger.warning("전사 결과 캐시 저장 실패: %s", e)
+        finally:
+            if tmp_path is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_path)
+    
+    def _evict_cached_results(self):
+        """캐시 파일이 TRANSCRIPT_CACHE_MAX_FILES개를 넘으면 가장 오래 쓰지 않은 것부터 지웁니다."""
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".json"):
+                    with contextlib.suppress(FileNotFoundError):
+                        entries.append((entry.stat().st_mtime, entry.path))
+        
+        excess = len(entries) - TRANSCRIPT_CACHE_MAX_FILES
+        if excess <= 0:
+            return
+        entries.sort()
+        for _, path in entries[:excess]:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(path)
+        logger.info("오래된 전사 결과 캐시 %d개 삭제", excess)
+    
+    @staticmethod
+    def _local_path(audio_file) -> Optional[str]:
+        """
+        호출부가 디스크의 파일을 직접 넘겼으면 그 경로를 반환합니다.
+        
+        경로 문자열과 open()으로 연 실제 파일 객체만 인정합니다. Streamlit UploadedFile의
+        name은 클라이언트가 보낸 값이므로 경로처럼 보여도 절대 믿지 않습니다
+        (믿으면 서버의 임의 파일을 읽어 업로드하게 됨).
+        """
+        if isinstance(audio_file, str):
+            return audio_file
+        raw = audio_file.raw if isinstance(audio_file, io.BufferedReader) else audio_file
+        if isinstance(raw, io.FileIO) and isinstance(raw.name, str):
+            return raw.name
+        return None
+    
+    def _transcribe_file(self, source: Union[str, BinaryIO]) -> "TranscriptResponse":
+        """
+        _transcribe_async의 동기 래퍼입니다 (Streamlit 스크립트 스레드에서 호출).
+        
+        chunk_long_audio가 켜져 있고 디스크의 오디오가 LONG_AUDIO_SECONDS보다 길면
+        조각으로 나눠 동시에 전사한 뒤 하나의 결과로 합칩니다.
+        """
+        chunk_dir = (
+            self._split_long_audio(source)
+            if self.chunk_long_audio and isinstance(source, str) else None
+        )
+        if chunk_dir is None:
+            return asyncio.run(self._transcribe_async(source))
+        
+        try:
+            chunk_paths = sorted(os.path.join(chunk_dir, name) for name in os.listdir(chunk_dir))
+            logger.info("긴 오디오를 %d개 조각으로 나눠 전사", len(chunk_paths))
+            transcripts = asyncio.run(self.transcribe_many(chunk_paths))
+            return self._merge_transcripts(transcripts, [self._audio_duration(p) or 0.0 for p in chunk_paths])
+        finally:
+            shutil.rmtree(chunk_dir, ignore_errors=True)
+    
+    async def transcribe_many(self, paths: List[str]) -> List["TranscriptResponse"]:
+        """여러 파일을 최대 MAX_CONCURRENT_TRANSCRIPTS개씩 동시에 전사합니다 (결과는 입력 순서)."""
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_TRANSCRIPTS)
+        
+        async def transcribe(path: str) -> "TranscriptResponse":
+            async with semaphore:
+                return await self._transcribe_async(path)
+        
+        return await asyncio.gather(*(transcribe(path) for path in paths))
+    
+    @staticmethod
+    def _audio_duration(path: str) -> Optional[float]:
+        """mutagen으로 오디오 길이(초)를 읽습니다. 알 수 없으면 None을 반환합니다."""
+        try:
+            audio = MutagenFile(path)
+        except Exception as e:
+            logger.warning("오디오 길이 확인 실패: %s", e)
+            return None
+        if audio is None or audio.info is None:
+            return None
+        return audio.info.length
+    
+    def _split_long_audio(self, path: str) -> Optional[str]:
+        """
+        긴 오디오를 ffmpeg segment muxer로 CHUNK_SECONDS 단위로 자릅니다 (재인코딩 없음).
+        
+        Returns:
+            Optional[str]: 조각 파일이 담긴 임시 디렉터리 (분할하지 않으면 None)
+        """
+        duration = self._audio_duration(path)
+        if duration is None or duration <= LONG_AUDIO_SECONDS:
+            return None
+        if shutil.which("ffmpeg") is None:
+            logger.warning("ffmpeg을 찾을 수 없어 긴 오디오를 나누지 않고 전사합니다.")
+            return None
+        
+        chunk_dir = tempfile.mkdtemp(prefix="kindcoach_chunks_")
+        suffix = os.path.splitext(path)[1] or ".wav"
+        command = [
+            "ffmpeg", "-hide_banner", "-loglevel", "error", "-i", path,
+            "-f", "segment", "-segment_time", str(CHUNK_SECONDS), "-reset_timestamps", "1",
+            "-c", "copy", os.path.join(chunk_dir, f"chunk%03d{suffix}")
+        ]
+        try:
+            subprocess.run(command, check=True, capture_output=True)
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.warning("오디오 분할 실패 - 나누지 않고 전사합니다: %s", e)
+            shutil.rmtree(chunk_dir, ignore_errors=True)
+            return None
+        return chunk_dir
+    
+    @staticmethod
+    def _merge_transcripts(transcripts: List["TranscriptResponse"], durations: List[float]) -> "TranscriptResponse":
+        """
+        조각별 전사 결과를 하나로 합칩니다.
+        
+        조각 k의 발화/단어 타임스탬프는 앞선 조각들의 길이만큼 밀어서 원본 기준으로 맞춥니다.
+        실패한 조각이 있으면 그 조각의 결과(status=error)를 그대로 반환합니다.
+        """
+        for transcript in transcripts:
+            if transcript.status == "error":
+                return transcript
+        
+        utterances = []
+        offset_ms = 0
+        for transcript, duration in zip(transcripts, durations):
+            for utterance in transcript.utterances or []:
+                words = [
+                    word.copy(update={"start": word.start + offset_ms, "end": word.end + offset_ms})
+                    for word in utterance.words
+                ]
+                utterances.append(utterance.copy(update={
+                    "start": utterance.start + offset_ms,
+                    "end": utterance.end + offset_ms,
+                    "words": words
+                }))
+            offset_ms += int(duration * 1000)
+        
+        # 전체 신뢰도는 조각 길이로 가중 평균
+        total_duration = sum(durations)
+        confidence = (
+            sum((t.confidence or 0.0) * d for t, d in zip(transcripts, durations)) / total_duration
+            if total_duration > 0 else transcripts[0].confidence
+        )
+        return transcripts[0].copy(update={
+            "text": " ".join(t.text for t in transcripts if t.text),
+            "utterances": utterances,
+            "words": None,
+            "confidence": confidence,
+            "audio_duration": sum(t.audio_duration or 0 for t in transcripts)
+        })
+    
+    async def _transcribe_async(self, source: Union[str, BinaryIO]) -> "TranscriptResponse":
+        """
+        AssemblyAI REST API로 파일을 업로드하고 전사가 끝날 때까지 비동기로 폴링합니다.
+        
+        대기 중에는 asyncio.sleep으로 양보하므로 여러 파일을 asyncio.gather로
+        동시에 전사할 수 있습니다.
+        
+        Args:
+            source: 전사할 오디오 파일 경로 또는 바이너리 파일 객체
+            
+        Returns:
+            TranscriptResponse: SDK와 같은 형태의 전사 결과 (status가 completed 또는 error)
+        """
+        headers = {"authorization": self.api_key}
+        async with httpx.AsyncClient(base_url=ASSEMBLYAI_BASE_URL, headers=headers, timeout=HTTP_TIMEOUT) as client:
+            # 1. 업로드 (파일 전체를 메모리에 올리지 않고 5MiB 단위로 스트리밍)
+            response = await self._request(client, "POST", "/upload", upload=source)
+            audio_url = response.json()["upload_url"]
+            logger.info("오디오 업로드 완료")
+            
+            # 2. 전사 요청
+            response = await self._request(
+                client, "POST", "/transcript", json={**self._transcript_request, "audio_url": audio_url}
+            )
+            transcript_id = response.json()["id"]
+            logger.info("전사 요청 완료 (ID: %s)", transcript_id)
+            
+            # 3. 완료될 때까지 지수 백오프로 폴링
+            delay = POLL_INITIAL_DELAY
+            while True:
+                await asyncio.sleep(delay)
+                response = await self._request(client, "GET", f"/transcript/{transcript_id}")
+                data = response.json()
+                if data["status"] in ("completed", "error"):
+                    from assemblyai.types import TranscriptResponse
+                    return TranscriptResponse.parse_obj(data)
+                logger.debug("전사 진행 중 (상태: %s, 다음 확인까지 %.1f초)", data["status"], delay)
+                delay = min(delay * POLL_BACKOFF, POLL_MAX_DELAY)
+    
+    @assemblyai_retry
+    async def _request(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        url: str,
+        json: Optional[Dict[str, Any]] = None,
+        upload: Optional[Union[str, BinaryIO]] = None
+    ) -> httpx.Response:
+        """
+        속도 한도와 재시도 정책을 적용해 AssemblyAI API를 호출합니다.
+        
+        업로드 본문(경로 또는 파일 객체)은 재시도마다 처음부터 다시 스트리밍합니다.
+        """
+        await _request_bucket.acquire_async()
+        content = self._stream_file(upload) if upload is not None else None
+        response = await client.request(method, url, json=json, content=content)
+        response.raise_for_status()
+        return response
+    
+    @staticmethod
+    async def _stream_file(source: Union[str, BinaryIO]):
+        """파일(경로 또는 파일 객체)을 처음부터 UPLOAD_STREAM_CHUNK 단위로 읽어 내보내는 비동기 제너레이터입니다."""
+        with open(source, "rb") if isinstance(source, str) else contextlib.nullcontext(source) as f:
+            f.seek(0)
+            while True:
+                chunk = await asyncio.to_thread(f.read, UPLOAD_STREAM_CHUNK)
+                if not chunk:
+                    break
+                yield chunk
     
     def _extract_speaker_segments(self, transcript) -> List[Dict[str, Any]]:
         """화자별 발화 구간을 추출합니다."""
@@ -144,25 +558,30 @@ class AudioProcessor:
             logger.warning("화자 구간 데이터가 없습니다.")
             return []
         
-        segments = []
-        for i, utterance in enumerate(transcript.utterances):
-            segment = {
-                "speaker": f"화자 {utterance.speaker}",
-                "text": utterance.text,
-                "start_time": utterance.start / 1000,  # ms to seconds
-                "end_time": utterance.end / 1000,
+        utterances = transcript.utterances
+        segments = [None] * len(utterances)
+        labels: Dict[str, str] = {}  # 화자 라벨은 화자마다 한 번만 만들어 재사용
+        for i, utterance in enumerate(utterances):
+            speaker = labels.get(utterance.speaker)
+            if speaker is None:
+                speaker = labels[utterance.speaker] = f"화자 {utterance.speaker}"
+            text = utterance.text
+            segment = segments[i] = {
+                "speaker": speaker,
+                "text": text,
+                "start_time": utterance.start * 0.001,  # ms to seconds
+                "end_time": utterance.end * 0.001,
                 "confidence": utterance.confidence,
-                "words": len(utterance.text.split()) if utterance.text else 0
+                "words": len(text.split()) if text else 0
             }
-            segments.append(segment)
             
             if i < 3:  # 처음 3개 구간만 로그 출력
-                logger.info(f"구간 {i+1}: 화자 {utterance.speaker}, 길이 {segment['end_time'] - segment['start_time']:.1f}초, 신뢰도 {utterance.confidence:.2f}")
+                logger.info("구간 %d: 화자 %s, 길이 %.1f초, 신뢰도 %.2f", i+1, utterance.speaker, segment['end_time'] - segment['start_time'], utterance.confidence)
         
         if len(segments) > 3:
-            logger.info(f"... 총 {len(segments)}개 구간 추출됨")
+            logger.info("... 총 %d개 구간 추출됨", len(segments))
         
-        logger.info(f"화자 구간 추출 완료: {len(segments)}개")
+        logger.info("화자 구간 추출 완료: %d개", len(segments))
         return segments
     
     def _extract_highlights(self, transcript) -> List[Dict[str, Any]]:
@@ -170,107 +589,127 @@ class AudioProcessor:
         if not hasattr(transcript, 'auto_highlights') or not transcript.auto_highlights:
             return []
         
-        highlights = []
-        for highlight in transcript.auto_highlights.results:
-            highlights.append({
+        return [
+            {
                 "text": highlight.text,
                 "count": highlight.count,
                 "rank": highlight.rank,
                 "timestamps": [
                     {
-                        "start_time": ts.start / 1000,
-                        "end_time": ts.end / 1000
+                        "start_time": ts.start * 0.001,
+                        "end_time": ts.end * 0.001
                     }
                     for ts in highlight.timestamps
                 ]
-            })
-        
-        return highlights
+            }
+            for highlight in transcript.auto_highlights.results
+        ]
     
     def _extract_sentiment(self, transcript) -> List[Dict[str, Any]]:
         """감정 분석 결과를 추출합니다."""
         if not hasattr(transcript, 'sentiment_analysis_results') or not transcript.sentiment_analysis_results:
             return []
         
-        sentiments = []
-        for sentiment in transcript.sentiment_analysis_results:
-            sentiments.append({
+        return [
+            {
                 "text": sentiment.text,
                 "sentiment": sentiment.sentiment,
                 "confidence": sentiment.confidence,
-                "start_time": sentiment.start / 1000,
-                "end_time": sentiment.end / 1000
-            })
-        
-        return sentiments
+                "start_time": sentiment.start * 0.001,
+                "end_time": sentiment.end * 0.001
+            }
+            for sentiment in transcript.sentiment_analysis_results
+        ]
     
     def _extract_entities(self, transcript) -> List[Dict[str, Any]]:
         """개체명 인식 결과를 추출합니다."""
         if not hasattr(transcript, 'entities') or not transcript.entities:
             return []
         
-        entities = []
-        for entity in transcript.entities:
-            entities.append({
+        return [
+            {
                 "text": entity.text,
                 "entity_type": entity.entity_type,
-                "start_time": entity.start / 1000,
-                "end_time": entity.end / 1000
-            })
+                "start_time": entity.start * 0.001,
+                "end_time": entity.end * 0.001
+            }
+            for entity in transcript.entities
+        ]
+    
+    def _speaker_totals(self, segments: List[Dict[str, Any]]) -> Tuple[List[str], Dict[str, np.ndarray]]:
+        """
+        화자별 합계를 NumPy 배열로 계산합니다.
         
-        return entities
+        구간 목록을 한 번만 훑어 (화자 번호, 길이, 단어 수, 신뢰도) 행렬로 바꾼 뒤
+        np.bincount 가중 합으로 화자별로 모읍니다.
+        
+        Returns:
+            Tuple: (처음 등장한 순서의 화자 목록, 화자 순서와 같은 화자별 합계 배열)
+        """
+        codes: Dict[str, int] = {}
+        columns = np.array(
+            [
+                (codes.setdefault(seg["speaker"], len(codes)), seg["end_time"] - seg["start_time"], seg["words"], seg["confidence"])
+                for seg in segments
+            ],
+            dtype=np.float64
+        ).T
+        speaker_idx = columns[0].astype(np.intp)
+        durations, words, confidences = columns[1:]
+        
+        num_speakers = len(codes)
+        utterances = np.bincount(speaker_idx, minlength=num_speakers)
+        total_time = np.bincount(speaker_idx, weights=durations, minlength=num_speakers)
+        total_words = np.bincount(speaker_idx, weights=words, minlength=num_speakers)
+        sum_confidence = np.bincount(speaker_idx, weights=confidences, minlength=num_speakers)
+        
+        # utterances는 화자마다 1 이상이므로 0으로 나누는 경우가 없음
+        all_time = total_time.sum()
+        all_words = total_words.sum()
+        totals = {
+            "total_time": total_time,
+            "total_words": total_words.astype(np.int64),
+            "utterances": utterances,
+            "avg_confidence": sum_confidence / utterances,
+            "time_percentage": total_time / all_time * 100 if all_time > 0 else np.zeros(num_speakers),
+            "word_percentage": total_words / all_words * 100 if all_words > 0 else np.zeros(num_speakers),
+            "avg_words_per_utterance": total_words / utterances
+        }
+        return list(codes), totals
+    
+    @staticmethod
+    def _speaker_stats_dict(speakers: List[str], totals: Dict[str, np.ndarray]) -> Dict[str, Any]:
+        """화자별 합계 배열을 {화자: 통계} 딕셔너리로 바꿉니다 (JSON 저장을 위해 파이썬 숫자로 변환)."""
+        columns = {key: values.tolist() for key, values in totals.items()}
+        return {
+            speaker: {key: values[i] for key, values in columns.items()}
+            for i, speaker in enumerate(speakers)
+        }
     
     def get_speaker_statistics(self, segments: List[Dict[str, Any]]) -> Dict[str, Any]:
         """화자별 통계를 계산합니다."""
         if not segments:
             return {}
         
-        speaker_stats = {}
-        total_duration = sum(seg["end_time"] - seg["start_time"] for seg in segments)
-        total_words = sum(seg["words"] for seg in segments)
-        
-        for segment in segments:
-            speaker = segment["speaker"]
-            if speaker not in speaker_stats:
-                speaker_stats[speaker] = {
-                    "total_time": 0,
-                    "total_words": 0,
-                    "utterances": 0,
-                    "avg_confidence": 0
-                }
-            
-            duration = segment["end_time"] - segment["start_time"]
-            speaker_stats[speaker]["total_time"] += duration
-            speaker_stats[speaker]["total_words"] += segment["words"]
-            speaker_stats[speaker]["utterances"] += 1
-            speaker_stats[speaker]["avg_confidence"] += segment["confidence"]
-        
-        # 통계 정리
-        for speaker, stats in speaker_stats.items():
-            stats["time_percentage"] = (stats["total_time"] / total_duration * 100) if total_duration > 0 else 0
-            stats["word_percentage"] = (stats["total_words"] / total_words * 100) if total_words > 0 else 0
-            stats["avg_confidence"] = stats["avg_confidence"] / stats["utterances"] if stats["utterances"] > 0 else 0
-            stats["avg_words_per_utterance"] = stats["total_words"] / stats["utterances"] if stats["utterances"] > 0 else 0
-        
-        return speaker_stats
+        return self._speaker_stats_dict(*self._speaker_totals(segments))
     
     def is_teacher_child_conversation(self, segments: List[Dict[str, Any]]) -> Dict[str, Any]:
         """교사-아동 대화인지 판단하고 역할을 분류합니다."""
         if len(segments) < 2:
             return {"is_teacher_child": False, "reason": "화자가 2명 미만입니다."}
         
-        speaker_stats = self.get_speaker_statistics(segments)
-        speakers = list(speaker_stats.keys())
+        speakers, totals = self._speaker_totals(segments)
         
         if len(speakers) != 2:
             return {"is_teacher_child": False, "reason": f"화자가 {len(speakers)}명입니다. 교사-아동 대화는 2명이어야 합니다."}
         
         # 발화 패턴 분석으로 교사/아동 구분
+        speaker_stats = self._speaker_stats_dict(speakers, totals)
         speaker1, speaker2 = speakers
-        stats1, stats2 = speaker_stats[speaker1], speaker_stats[speaker2]
         
         # 교사는 일반적으로 더 많이, 더 길게 말함
-        if stats1["avg_words_per_utterance"] > stats2["avg_words_per_utterance"]:
+        avg_words = totals["avg_words_per_utterance"]
+        if avg_words[0] > avg_words[1]:
             teacher, child = speaker1, speaker2
         else:
             teacher, child = speaker2, speaker1
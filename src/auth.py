@@ -5,10 +5,23 @@ KindCoach 인증 모듈
 
 import streamlit as st
 import bcrypt
+import hmac
 import time
+from functools import lru_cache
 from typing import Dict, Optional
 
 
+@lru_cache(maxsize=4)
+def _hash_admin_password(password: str) -> bytes:
+    """
+    관리자 비밀번호의 bcrypt 해시를 프로세스당 한 번만 계산합니다.
+    
+    Streamlit은 재실행마다 앱 객체(AuthManager 포함)를 새로 만들므로,
+    캐시하지 않으면 화면 조작 한 번마다 bcrypt 해싱 비용이 듭니다.
+    """
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
+
+
 class AuthManager:
     """인증 관리 클래스"""
     
@@ -21,25 +34,24 @@ class AuthManager:
             admin_password: 관리자 비밀번호 (평문)
         """
         self.admin_username = admin_username
-        self.admin_password_hash = self._hash_password(admin_password)
+        # 검증 때마다 encode하지 않도록 해시는 bytes로 보관
+        self._admin_pw_bytes = _hash_admin_password(admin_password)
+        self.admin_password_hash = self._admin_pw_bytes.decode('utf-8')
         
         # 세션 타임아웃 설정 (30분)
         self.session_timeout = 30 * 60  # seconds
         
-    def _hash_password(self, password: str) -> str:
-        """비밀번호를 해싱합니다."""
-        salt = bcrypt.gensalt()
-        hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
-        return hashed.decode('utf-8')
-    
-    def _verify_password(self, password: str, hashed: str) -> bool:
+    def _verify_password(self, password: str, hashed: bytes) -> bool:
         """비밀번호를 검증합니다."""
-        return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+        return bcrypt.checkpw(password.encode('utf-8'), hashed)
     
     def authenticate(self, username: str, password: str) -> bool:
         """
         사용자 인증을 수행합니다.
         
+        bcrypt 검증은 의도적으로 느리므로 로그인 폼 제출 시(login)에만 호출하고,
+        이후 재실행에서는 is_authenticated()의 세션 플래그와 타임아웃만 확인합니다.
+        
         Args:
             username: 사용자명
             password: 비밀번호
@@ -47,9 +59,11 @@ class AuthManager:
         Returns:
             bool: 인증 성공 여부
         """
-        if username == self.admin_username:
-            return self._verify_password(password, self.admin_password_hash)
-        return False
+        # 사용자명 비교도 상수 시간으로 하고, 사용자명이 틀려도 bcrypt 검증을 수행해
+        # 응답 시간으로 사용자명 일치 여부를 알 수 없게 함
+        username_ok = hmac.compare_digest(username.encode('utf-8'), self.admin_username.encode('utf-8'))
+        password_ok = self._verify_password(password, self._admin_pw_bytes)
+        return username_ok and password_ok
     
     def login(self, username: str, password: str) -> bool:
         """
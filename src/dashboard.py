@@ -4,13 +4,144 @@ KindCoach 개인 대시보드
 """
 
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
-from typing import Dict, List, Any
+from typing import TYPE_CHECKING, Dict, List, Any
 from collections import Counter, defaultdict
 
+# pandas/plotly/numpy는 import 비용이 커서 각 함수 안에서 불러옴
+# (로그인 화면 등 대시보드를 그리지 않는 첫 화면의 콜드 스타트 단축, 이후 호출은 sys.modules 캐시 사용)
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+# 대시보드용 분석 목록 캐시 유지 시간 (초)
+DASHBOARD_CACHE_TTL = 60
+
+# 시간/요일 분포 차트의 x축 라벨
+HOUR_LABELS = [f"{h:02d}:00" for h in range(24)]
+WEEKDAY_NAMES = ['월요일', '화요일', '수요일', '목요일', '금요일', '토요일', '일요일']
+
+
+@st.cache_data(ttl=DASHBOARD_CACHE_TTL, show_spinner=False)
+def _load_user_analyses(_analysis_manager, username: str) -> List[Dict[str, Any]]:
+    """
+    사용자의 분석 목록을 Streamlit 재실행 사이에 캐시합니다.
+    
+    탭이나 버튼을 누를 때마다 결과 디렉토리를 다시 훑지 않도록 사용자명으로만 캐시합니다
+    (밑줄로 시작하는 _analysis_manager는 캐시 키에서 제외됨).
+    """
+    return _analysis_manager.get_all_analyses(username=username)
+
+
+@st.cache_data(ttl=DASHBOARD_CACHE_TTL, show_spinner=False)
+def _load_user_frame(_analysis_manager, username: str) -> "pd.DataFrame":
+    """네 개의 대시보드 탭이 함께 쓰는 분석 목록 DataFrame을 캐시합니다."""
+    return _analyses_frame(_load_user_analyses(_analysis_manager, username))
+
+
+def clear_dashboard_cache():
+    """분석이 추가/갱신/삭제되었을 때 대시보드 캐시를 비웁니다."""
+    _load_user_analyses.clear()
+    _load_user_frame.clear()
+
+
+def _analyses_frame(analyses: List[Dict[str, Any]]) -> "pd.DataFrame":
+    """
+    분석 목록을 탭들이 쓰는 열만 담은 DataFrame으로 한 번에 정규화합니다.
+    
+    메타데이터 추출은 목록을 한 번만 훑고, 생성 시각 파싱은 pandas로 열 단위로 처리합니다.
+    녹음 시/요일은 AnalysisManager가 저장할 때 계산해 둔 recording_hour/recording_weekday를 그대로 씁니다.
+    """
+    import pandas as pd
+    
+    records = []
+    for analysis in analyses:
+        metadata = analysis.get('metadata') or {}
+        records.append((
+            analysis.get('completed_analyses', 0) == analysis.get('total_analyses', 5),
+            analysis.get('created_at') or None,
+            metadata.get('child_name', '알 수 없음'),
+            metadata.get('child_age') or '',
+            metadata.get('situation_type') or '',
+            metadata.get('analysis_purpose') or [],
+            analysis.get('recording_hour'),
+            analysis.get('recording_weekday')
+        ))
+    
+    df = pd.DataFrame.from_records(records, columns=[
+        'completed', 'created_at', 'child_name', 'child_age', 'situation',
+        'purposes', 'hour', 'weekday'
+    ])
+    # format='ISO8601'은 C 경로로 일괄 파싱하며 'Z' 접미사도 처리함.
+    # 시간대가 있는 값과 없는 값이 섞여도 되도록 UTC로 맞춘 뒤 시간대 정보만 떼어 냄
+    # (앱이 저장하는 created_at은 시간대가 없으므로 값은 그대로 유지됨)
+    df['created_dt'] = pd.to_datetime(df['created_at'], format='ISO8601', errors='coerce', utc=True).dt.tz_convert(None)
+    return df
+
+
+# 차트 생성 함수들은 입력 데이터로 캐시되어, 데이터가 그대로인 재실행(탭 전환 등)에서는
+# plotly 그림을 다시 만들지 않음
+@st.cache_data(ttl=DASHBOARD_CACHE_TTL, show_spinner=False)
+def _line_figure(df_monthly: "pd.DataFrame"):
+    """월별 분석 추이 꺾은선 차트"""
+    import plotly.express as px
+    
+    fig = px.line(
+        df_monthly, 
+        x='월', 
+        y='분석 수',
+        title="월별 분석 활동 추이",
+        markers=True
+    )
+    fig.update_layout(height=400)
+    return fig
+
+
+@st.cache_data(ttl=DASHBOARD_CACHE_TTL, show_spinner=False)
+def _bar_figure(x: tuple, y: tuple, title: str, x_label: str, y_label: str):
+    """막대 차트 (아동별/시간대별/요일별 건수)"""
+    import plotly.express as px
+    
+    fig = px.bar(
+        x=list(x),
+        y=list(y),
+        title=title,
+        labels={'x': x_label, 'y': y_label}
+    )
+    fig.update_layout(height=400)
+    return fig
+
+
+@st.cache_data(ttl=DASHBOARD_CACHE_TTL, show_spinner=False)
+def _pie_figure(values: tuple, names: tuple):
+    """분석 목적별 비율 파이 차트"""
+    import plotly.express as px
+    
+    fig = px.pie(
+        values=list(values),
+        names=list(names),
+        title="분석 목적별 비율"
+    )
+    fig.update_layout(height=500)
+    return fig
+
+
+@st.cache_data(ttl=DASHBOARD_CACHE_TTL, show_spinner=False)
+def _matrix_figure(matrix: "np.ndarray", purposes: tuple, situations: tuple):
+    """상황별 분석 목적 매트릭스 히트맵"""
+    import plotly.express as px
+    
+    fig = px.imshow(
+        matrix,
+        x=list(purposes),
+        y=list(situations),
+        labels={'x': '분석목적', 'y': '상황', 'color': '빈도'},
+        title="상황별 분석 목적 매트릭스",
+        color_continuous_scale='Blues'
+    )
+    fig.update_layout(height=400)
+    return fig
+
 
 def render_personal_dashboard(analysis_manager, username: str):
     """
@@ -25,9 +156,9 @@ def render_personal_dashboard(analysis_manager, username: str):
     st.markdown("---")
     
     # 사용자 분석 데이터 가져오기
-    user_analyses = analysis_manager.get_all_analyses(username=username)
+    user_df = _load_user_frame(analysis_manager, username)
     
-    if not user_analyses:
+    if user_df.empty:
         st.info("""
         📝 아직 분석 데이터가 없습니다.
         
@@ -44,38 +175,30 @@ def render_personal_dashboard(analysis_manager, username: str):
     tab1, tab2, tab3, tab4 = st.tabs(["📈 활동 개요", "👶 아동별 현황", "📅 시간 분석", "🎯 목적별 분석"])
     
     with tab1:
-        render_activity_overview(user_analyses)
+        render_activity_overview(user_df)
     
     with tab2:
-        render_child_analysis(user_analyses)
+        render_child_analysis(user_df)
     
     with tab3:
-        render_time_analysis(user_analyses)
+        render_time_analysis(user_df)
     
     with tab4:
-        render_purpose_analysis(user_analyses)
+        render_purpose_analysis(user_df)
 
 
-def render_activity_overview(analyses: List[Dict[str, Any]]):
+def render_activity_overview(df: "pd.DataFrame"):
     """활동 개요 탭 렌더링"""
+    import pandas as pd
+    
     st.markdown("### 📈 분석 활동 개요")
     
     # 기본 통계
-    total_analyses = len(analyses)
-    completed_analyses = sum(1 for a in analyses if a.get('completed_analyses', 0) == a.get('total_analyses', 5))
+    total_analyses = len(df)
+    completed_analyses = int(df['completed'].sum())
     
-    # 최근 30일 분석
-    now = datetime.now()
-    recent_analyses = []
-    for analysis in analyses:
-        created_at = analysis.get('created_at', '')
-        if created_at:
-            try:
-                created_date = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                if (now - created_date).days <= 30:
-                    recent_analyses.append(analysis)
-            except:
-                continue
+    # 최근 30일 분석 (생성 시각을 파싱하지 못한 행은 NaT라 비교에서 제외됨)
+    recent_count = int(((datetime.now() - df['created_dt']).dt.days <= 30).sum())
     
     # 메트릭 카드
     col1, col2, col3, col4 = st.columns(4)
@@ -105,84 +228,44 @@ def render_activity_overview(analyses: List[Dict[str, Any]]):
     with col4:
         st.metric(
             label="📅 최근 30일",
-            value=len(recent_analyses),
+            value=recent_count,
             help="지난 30일간 수행한 분석 건수"
         )
     
     st.markdown("---")
     
     # 월별 분석 추이
-    if len(analyses) > 1:
+    if len(df) > 1:
         st.markdown("### 📅 월별 분석 추이")
         
         # 월별 데이터 집계
-        monthly_data = defaultdict(int)
-        for analysis in analyses:
-            created_at = analysis.get('created_at', '')
-            if created_at:
-                try:
-                    created_date = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                    month_key = created_date.strftime('%Y-%m')
-                    monthly_data[month_key] += 1
-                except:
-                    continue
+        monthly_counts = df['created_dt'].dt.to_period('M').value_counts().sort_index()
         
-        if monthly_data:
+        if not monthly_counts.empty:
             # 데이터프레임 생성
-            df_monthly = pd.DataFrame([
-                {'월': month, '분석 수': count}
-                for month, count in sorted(monthly_data.items())
-            ])
+            df_monthly = pd.DataFrame({'월': monthly_counts.index.astype(str), '분석 수': monthly_counts.to_numpy()})
             
             # 차트 생성
-            fig = px.line(
-                df_monthly, 
-                x='월', 
-                y='분석 수',
-                title="월별 분석 활동 추이",
-                markers=True
-            )
-            fig.update_layout(height=400)
-            st.plotly_chart(fig)
+            st.plotly_chart(_line_figure(df_monthly))
 
 
-def render_child_analysis(analyses: List[Dict[str, Any]]):
+def render_child_analysis(df: "pd.DataFrame"):
     """아동별 현황 탭 렌더링"""
     st.markdown("### 👶 아동별 분석 현황")
     
-    # 아동별 분석 집계
-    child_stats = defaultdict(lambda: {
-        'count': 0,
-        'situations': set(),
-        'purposes': set(),
-        'latest_date': None,
-        'ages': set()
-    })
-    
-    for analysis in analyses:
-        metadata = analysis.get('metadata', {})
-        child_name = metadata.get('child_name', '알 수 없음')
-        child_age = metadata.get('child_age', '')
-        situation = metadata.get('situation_type', '')
-        purposes = metadata.get('analysis_purpose', [])
-        created_at = analysis.get('created_at', '')
-        
-        child_stats[child_name]['count'] += 1
-        if situation:
-            child_stats[child_name]['situations'].add(situation)
-        if purposes:
-            child_stats[child_name]['purposes'].update(purposes)
-        if child_age:
-            child_stats[child_name]['ages'].add(child_age)
-        
-        if created_at:
-            try:
-                date = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                if (child_stats[child_name]['latest_date'] is None or 
-                    date > child_stats[child_name]['latest_date']):
-                    child_stats[child_name]['latest_date'] = date
-            except:
-                continue
+    # 아동별 분석 집계 (행마다 집합을 갱신하지 않고 groupby 한 번으로 계산, 처음 등장한 순서 유지)
+    # 아동 이름이 없는 분석도 빠지지 않도록 '알 수 없음'으로 묶음
+    child_keys = df['child_name'].fillna('알 수 없음')
+    grouped = df.groupby(child_keys, sort=False, dropna=False).agg(
+        count=('child_name', 'size'),
+        situations=('situation', lambda values: set(filter(None, values))),
+        purposes=('purposes', lambda values: set().union(*values)),
+        latest_date=('created_dt', 'max'),
+        ages=('child_age', lambda values: set(filter(None, values)))
+    )
+    # 생성 시각을 알 수 없는 아동은 NaT 대신 None으로 두어 아래 표시 분기에서 걸러지게 함
+    grouped['latest_date'] = grouped['latest_date'].astype(object).where(grouped['latest_date'].notna(), None)
+    child_stats = grouped.to_dict(orient='index')
     
     if not child_stats:
         st.info("아직 아동별 데이터가 없습니다.")
@@ -192,14 +275,7 @@ def render_child_analysis(analyses: List[Dict[str, Any]]):
     child_names = list(child_stats.keys())
     child_counts = [child_stats[name]['count'] for name in child_names]
     
-    fig = px.bar(
-        x=child_names,
-        y=child_counts,
-        title="아동별 분석 건수",
-        labels={'x': '아동명', 'y': '분석 수'}
-    )
-    fig.update_layout(height=400)
-    st.plotly_chart(fig)
+    st.plotly_chart(_bar_figure(tuple(child_names), tuple(child_counts), "아동별 분석 건수", '아동명', '분석 수'))
     
     # 아동별 상세 정보
     st.markdown("### 👶 아동별 상세 정보")
@@ -240,85 +316,38 @@ def render_child_analysis(analyses: List[Dict[str, Any]]):
                     st.info("💡 개별 분석 삭제는 '분석 히스토리' 탭에서 가능합니다.")
 
 
-def render_time_analysis(analyses: List[Dict[str, Any]]):
+def render_time_analysis(df: "pd.DataFrame"):
     """시간 분석 탭 렌더링"""
     st.markdown("### 📅 시간별 분석 패턴")
     
-    # 시간별 데이터 수집
-    time_data = {
-        'hour': [],
-        'weekday': [],
-        'date': []
-    }
-    
-    for analysis in analyses:
-        metadata = analysis.get('metadata', {})
-        recording_time = metadata.get('recording_time', '')
-        recording_date = metadata.get('recording_date', '')
-        
-        if recording_time:
-            try:
-                time_obj = datetime.fromisoformat(recording_time.replace('Z', ''))
-                time_data['hour'].append(time_obj.hour)
-            except:
-                continue
-        
-        if recording_date:
-            try:
-                date_obj = datetime.fromisoformat(recording_date).date()
-                time_data['weekday'].append(date_obj.weekday())
-                time_data['date'].append(date_obj)
-            except:
-                continue
-    
-    # 시간대별 분포
-    if time_data['hour']:
+    # 시간대별 분포 (공유 DataFrame의 시/요일 열을 value_counts로 한 번에 집계)
+    if df['hour'].notna().any():
         st.markdown("#### 🕐 시간대별 녹음 분포")
-        hour_counts = Counter(time_data['hour'])
         
-        # 24시간 데이터 준비 (0-23시)
-        hour_labels = [f"{h:02d}:00" for h in range(24)]
-        hour_values = [hour_counts.get(h, 0) for h in range(24)]
+        # 24시간 데이터 준비 (0-23시, 녹음이 없는 시간은 0)
+        hour_values = df['hour'].value_counts().reindex(range(24), fill_value=0).tolist()
         
-        fig = px.bar(
-            x=hour_labels,
-            y=hour_values,
-            title="시간대별 녹음 빈도",
-            labels={'x': '시간', 'y': '녹음 수'}
-        )
-        fig.update_layout(height=400)
-        st.plotly_chart(fig)
+        st.plotly_chart(_bar_figure(tuple(HOUR_LABELS), tuple(hour_values), "시간대별 녹음 빈도", '시간', '녹음 수'))
     
     # 요일별 분포  
-    if time_data['weekday']:
+    if df['weekday'].notna().any():
         st.markdown("#### 📅 요일별 녹음 분포")
-        weekday_counts = Counter(time_data['weekday'])
-        weekday_names = ['월요일', '화요일', '수요일', '목요일', '금요일', '토요일', '일요일']
-        weekday_values = [weekday_counts.get(i, 0) for i in range(7)]
+        weekday_values = df['weekday'].value_counts().reindex(range(7), fill_value=0).tolist()
         
-        fig = px.bar(
-            x=weekday_names,
-            y=weekday_values,
-            title="요일별 녹음 빈도",
-            labels={'x': '요일', 'y': '녹음 수'}
-        )
-        fig.update_layout(height=400)
-        st.plotly_chart(fig)
+        st.plotly_chart(_bar_figure(tuple(WEEKDAY_NAMES), tuple(weekday_values), "요일별 녹음 빈도", '요일', '녹음 수'))
 
 
-def render_purpose_analysis(analyses: List[Dict[str, Any]]):
+def render_purpose_analysis(df: "pd.DataFrame"):
     """목적별 분석 탭 렌더링"""
+    import numpy as np
+    
     st.markdown("### 🎯 분석 목적별 현황")
     
     # 목적별 데이터 수집
     purpose_counts = Counter()
     situation_purpose = defaultdict(set)
     
-    for analysis in analyses:
-        metadata = analysis.get('metadata', {})
-        purposes = metadata.get('analysis_purpose', [])
-        situation = metadata.get('situation_type', '기타')
-        
+    for situation, purposes in zip(df['situation'].replace('', '기타'), df['purposes']):
         for purpose in purposes:
             purpose_counts[purpose] += 1
             situation_purpose[situation].add(purpose)
@@ -330,46 +359,24 @@ def render_purpose_analysis(analyses: List[Dict[str, Any]]):
     # 분석 목적별 파이 차트
     st.markdown("#### 🎯 분석 목적 분포")
     
-    labels = list(purpose_counts.keys())
-    values = list(purpose_counts.values())
-    
-    fig = px.pie(
-        values=values,
-        names=labels,
-        title="분석 목적별 비율"
-    )
-    fig.update_layout(height=500)
-    st.plotly_chart(fig)
+    st.plotly_chart(_pie_figure(tuple(purpose_counts.values()), tuple(purpose_counts.keys())))
     
     # 상황별 목적 매트릭스
     st.markdown("#### 📍 상황별 분석 목적")
     
     if situation_purpose:
-        # 매트릭스 데이터 준비
-        situations = list(situation_purpose.keys())
-        all_purposes = list(set().union(*situation_purpose.values()))
-        
-        matrix_data = []
-        for situation in situations:
-            for purpose in all_purposes:
-                count = 1 if purpose in situation_purpose[situation] else 0
-                matrix_data.append({
-                    '상황': situation,
-                    '분석목적': purpose,
-                    '빈도': count
-                })
+        # 매트릭스 데이터 준비 (셀마다 dict를 만들어 pivot하지 않고 0/1 배열을 바로 생성,
+        # 축은 pivot과 같이 정렬된 순서)
+        situations = sorted(situation_purpose)
+        all_purposes = sorted(set().union(*situation_purpose.values()))
         
-        if matrix_data:
-            df_matrix = pd.DataFrame(matrix_data)
-            pivot_df = df_matrix.pivot(index='상황', columns='분석목적', values='빈도')
+        if situations and all_purposes:
+            matrix = np.fromiter(
+                (purpose in situation_purpose[situation] for situation in situations for purpose in all_purposes),
+                dtype=np.int8, count=len(situations) * len(all_purposes)
+            ).reshape(len(situations), len(all_purposes))
             
-            fig = px.imshow(
-                pivot_df,
-                title="상황별 분석 목적 매트릭스",
-                color_continuous_scale='Blues'
-            )
-            fig.update_layout(height=400)
-            st.plotly_chart(fig)
+            st.plotly_chart(_matrix_figure(matrix, tuple(all_purposes), tuple(situations)))
     
     # 목적별 상세 정보
     st.markdown("#### 📊 목적별 상세 통계")
@@ -0,0 +1,76 @@
+"""
+KindCoach 로그 수집기
+LOG_TO_SOCKET=true로 실행한 앱 프로세스들이 보낸 로그 레코드를 받아
+하나의 로그 파일(logs/kindcoach.log, logs/kindcoach_errors.log)에 모아 기록합니다.
+
+사용법: python src/log_aggregator.py [--host 127.0.0.1] [--port 9020]
+
+레코드는 pickle로 전달되므로 신뢰할 수 있는 로컬 주소에만 바인딩하세요.
+"""
+
+import os
+import sys
+import argparse
+import logging
+import pickle
+import signal
+import socketserver
+import struct
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.logging_config import get_logger, setup_logging, set_log_sampling, LOG_SOCKET_ADDR
+
+# 로거 설정
+logger = get_logger(__name__)
+
+
+class LogRecordStreamHandler(socketserver.StreamRequestHandler):
+    """SocketHandler가 보낸 (길이 + pickle) 레코드를 읽어 로컬 핸들러로 넘깁니다."""
+
+    def handle(self):
+        while True:
+            header = self.connection.recv(4)
+            if len(header) < 4:
+                break
+            length = struct.unpack('>L', header)[0]
+            data = self.connection.recv(length)
+            while len(data) < length:
+                chunk = self.connection.recv(length - len(data))
+                if not chunk:
+                    return
+                data += chunk
+
+            record = logging.makeLogRecord(pickle.loads(data))
+            logging.getLogger(record.name).handle(record)
+
+
+class LogRecordSocketServer(socketserver.ThreadingTCPServer):
+    """앱 프로세스마다 연결 하나씩을 받는 TCP 로그 수집 서버입니다."""
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="KindCoach 로그 수집기")
+    parser.add_argument("--host", default=LOG_SOCKET_ADDR[0], help="바인딩할 호스트")
+    parser.add_argument("--port", type=int, default=LOG_SOCKET_ADDR[1], help="바인딩할 포트")
+    args = parser.parse_args()
+
+    # 수집기 자신은 항상 파일에 기록
+    setup_logging(log_to_file=True, log_to_socket=False)
+    # 받은 레코드는 앱 프로세스에서 이미 샘플링되었으므로 같은 환경 변수로 다시 거르지 않음
+    set_log_sampling(1)
+
+    # SIGTERM으로 종료해도 버퍼에 남은 로그가 기록되도록 정상 종료 경로를 탐
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    with LogRecordSocketServer((args.host, args.port), LogRecordStreamHandler) as server:
+        logger.info("로그 수집기 시작: %s:%d", args.host, args.port)
+        try:
+            server.serve_forever()
+        except (KeyboardInterrupt, SystemExit):
+            logger.info("로그 수집기 종료")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,87 +3,273 @@ KindCoach 로깅 설정 모듈
 통합된 로깅 설정을 제공합니다.
 """
 
+import atexit
+import io
+import itertools
 import logging
+import logging.handlers
 import os
-from datetime import datetime
-from pathlib import Path
+import queue
+import threading
 
+# 로그 포맷
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
 
-def setup_logging(log_level=logging.INFO, log_to_file=True):
+# 파일 로그 버퍼 크기, 주기적 플러시 간격 (초), 보관할 지난 로그 파일 수
+LOG_BUFFER_SIZE = 128 * 1024
+LOG_FLUSH_INTERVAL = 30
+LOG_BACKUP_COUNT = 30
+
+# WARNING 이상만 남길 외부 라이브러리 로거
+QUIET_LIBRARY_LOGGERS = ('httpx', 'httpcore', 'urllib3')
+
+# 로그 파일 경로 (지난 날짜 파일에는 '.YYYY-MM-DD'가 붙음)
+LOG_DIR = "logs"
+LOG_FILE = os.path.join(LOG_DIR, "kindcoach.log")
+ERROR_LOG_FILE = os.path.join(LOG_DIR, "kindcoach_errors.log")
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    같은 초에 만들어진 레코드끼리는 시각 문자열을 재사용하는 포매터입니다.
+    
+    datefmt가 초 단위이므로 초가 바뀔 때만 localtime/strftime을 호출합니다.
+    """
+
+    def __init__(self, fmt: str, datefmt: str):
+        super().__init__(fmt, datefmt, style='%')
+        self._cached_time = (None, '')
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str = None) -> str:
+        second = int(record.created)
+        cached_second, cached = self._cached_time
+        if second != cached_second:
+            cached = super().formatTime(record, datefmt)
+            self._cached_time = (second, cached)
+        return cached
+
+
+# 모든 핸들러가 함께 쓰는 포매터
+LOG_FORMATTER = CachedTimeFormatter(LOG_FORMAT, LOG_DATE_FORMAT)
+
+# 로그 수집기(src/log_aggregator.py) 기본 주소와 전송 전에 모아 둘 레코드 수
+LOG_SOCKET_ADDR = ('127.0.0.1', logging.handlers.DEFAULT_TCP_LOGGING_PORT)
+LOG_SOCKET_BATCH = 1024
+LOG_SOCKET_FLUSH_INTERVAL = 5  # 조용한 구간에도 이 간격(초)마다 모인 레코드를 전송
+
+# setup_logging이 만든 핸들러 (재호출 시 새로 만들지 않고 재사용)
+_root_handlers = []   # 루트 로거에 붙인 핸들러 (콘솔, QueueHandler)
+_level_handlers = []  # log_level을 따르는 핸들러
+
+# 파일 핸들러를 대신 실행하는 백그라운드 리스너
+_queue_listener = None
+
+
+class _PeriodicFlushMixin:
+    """핸들러에 interval초마다 flush()를 호출하는 데몬 스레드를 붙이는 믹스인입니다."""
+
+    def _start_flusher(self, interval: float):
+        """주기적 플러시 스레드를 시작합니다."""
+        self._stop_flusher = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically, args=(interval,),
+            name="log-flusher", daemon=True
+        )
+        self._flusher.start()
+
+    def _flush_periodically(self, interval: float):
+        """닫힐 때까지 interval초마다 버퍼를 비웁니다."""
+        while not self._stop_flusher.wait(interval):
+            self.flush()
+
+
+class BufferedFileHandler(_PeriodicFlushMixin, logging.handlers.TimedRotatingFileHandler):
+    """
+    큰 버퍼를 거쳐 파일에 쓰고 자정마다 새 파일로 넘어가는 핸들러입니다.
+    
+    레코드마다 write() 시스템 콜을 하지 않고 버퍼가 찼을 때, ERROR 이상 레코드가 왔을 때,
+    그리고 LOG_FLUSH_INTERVAL초마다 한 번씩 디스크에 기록합니다.
+    """
+
+    def __init__(self, filename, encoding: str = 'utf-8', backup_count: int = LOG_BACKUP_COUNT,
+                 buffer_size: int = LOG_BUFFER_SIZE, flush_interval: float = LOG_FLUSH_INTERVAL):
+        """
+        Args:
+            filename: 로그 파일 경로 (지난 날짜 파일에는 '.YYYY-MM-DD'가 붙음)
+            encoding: 파일 인코딩
+            backup_count: 보관할 지난 로그 파일 수
+            buffer_size: 쓰기 버퍼 크기 (바이트)
+            flush_interval: 주기적 플러시 간격 (초)
+        """
+        self.buffer_size = buffer_size
+        # 첫 레코드가 올 때까지 파일을 열지 않음
+        super().__init__(filename, when='midnight', backupCount=backup_count,
+                         encoding=encoding, delay=True)
+
+        # 조용한 구간에도 버퍼에 남은 로그가 오래 머물지 않도록 주기적으로 플러시
+        self._start_flusher(flush_interval)
+
+    def _open(self):
+        """버퍼 없는 파일 위에 큰 쓰기 버퍼를 얹어 엽니다. 로그 디렉터리도 이때 처음 만듭니다."""
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        raw = open(self.baseFilename, 'ab', buffering=0)
+        return io.BufferedWriter(raw, buffer_size=self.buffer_size)
+
+    def emit(self, record: logging.LogRecord):
+        """레코드를 버퍼에 쓰고, ERROR 이상이면 즉시 디스크에 기록합니다."""
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            data = (self.format(record) + self.terminator).encode(self.encoding)
+            self.stream.write(data)
+            if record.levelno >= logging.ERROR:
+                self.stream.flush()
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        """주기적 플러시를 멈추고 버퍼를 비운 뒤 파일을 닫습니다."""
+        self._stop_flusher.set()
+        super().close()
+
+
+class BatchedSocketHandler(_PeriodicFlushMixin, logging.handlers.MemoryHandler):
+    """
+    레코드를 모아 로그 수집기로 한 번에 보내는 핸들러입니다.
+    
+    capacity개가 모였을 때, ERROR 이상 레코드가 왔을 때, 그리고 flush_interval초마다 전송하므로
+    조용한 앱에서도 레코드가 프로세스 안에 오래 머물지 않습니다.
+    """
+
+    def __init__(self, host: str, port: int, capacity: int = LOG_SOCKET_BATCH,
+                 flush_interval: float = LOG_SOCKET_FLUSH_INTERVAL):
+        """
+        Args:
+            host: 로그 수집기 호스트
+            port: 로그 수집기 포트
+            capacity: 전송 전에 모아 둘 최대 레코드 수
+            flush_interval: 주기적 전송 간격 (초)
+        """
+        socket_handler = logging.handlers.SocketHandler(host, port)
+        socket_handler.closeOnError = False
+        super().__init__(capacity, flushLevel=logging.ERROR, target=socket_handler)
+        self._start_flusher(flush_interval)
+
+    def close(self):
+        """주기적 전송을 멈추고 남은 레코드를 보낸 뒤 소켓을 닫습니다."""
+        self._stop_flusher.set()
+        target = self.target
+        try:
+            super().close()
+        finally:
+            if target is not None:
+                target.close()
+
+
+def setup_logging(log_level=logging.INFO, log_to_file=True, log_to_socket=False, log_addr=LOG_SOCKET_ADDR):
     """
     KindCoach 애플리케이션의 로깅을 설정합니다.
     
     Args:
         log_level: 로그 레벨 (기본값: INFO)
         log_to_file: 파일로 로그 저장 여부 (기본값: True)
-    """
-    # 로그 디렉터리 생성
-    log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
+        log_to_socket: 로그 파일 대신 로그 수집기로 전송 여부 (기본값: False)
+        log_addr: 로그 수집기 (호스트, 포트)
     
-    # 로그 포맷 설정
-    log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    date_format = '%Y-%m-%d %H:%M:%S'
-    
-    # 기본 로깅 설정
-    logging.basicConfig(
-        level=log_level,
-        format=log_format,
-        datefmt=date_format,
-        handlers=[]
-    )
+    여러 번 호출해도 핸들러는 처음 한 번만 만들고, 이후에는 레벨만 갱신합니다.
+    """
+    # 포맷에서 쓰지 않는 스레드/프로세스/호출 위치 정보는 LogRecord 생성 시 수집하지 않음
+    # (_srcfile = None이면 findCaller의 스택 탐색을 건너뜀. LOG_FORMAT에 %(pathname)s,
+    #  %(lineno)d, %(funcName)s 등을 추가하면 이 줄을 지워야 함)
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = None
     
     # 루트 로거 가져오기
+    # (src.* 로거들은 레벨을 따로 두지 않고 루트 레벨을 그대로 물려받음)
     root_logger = logging.getLogger()
+    root_logger.setLevel(log_level)
+
+    # 이미 설치된 핸들러가 있으면 중복으로 붙이지 않고 레벨만 갱신
+    if _root_handlers:
+        for handler in _level_handlers:
+            handler.setLevel(log_level)
+        return root_logger
     
     # 콘솔 핸들러 추가
     console_handler = logging.StreamHandler()
     console_handler.setLevel(log_level)
-    console_formatter = logging.Formatter(log_format, date_format)
-    console_handler.setFormatter(console_formatter)
+    console_handler.setFormatter(LOG_FORMATTER)
     root_logger.addHandler(console_handler)
+    _root_handlers.append(console_handler)
+    _level_handlers.append(console_handler)
     
     # 파일 핸들러 추가 (선택사항)
-    if log_to_file:
-        # 일별 로그 파일
-        today = datetime.now().strftime('%Y-%m-%d')
-        log_file = log_dir / f"kindcoach_{today}.log"
-        
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    # 디스크 쓰기는 QueueListener 스레드에서 처리하고, 호출 스레드는 큐에 넣기만 함
+    if log_to_socket:
+        # 파일은 수집기 프로세스가 쓰고, 앱은 레코드를 모아 소켓으로만 보냄
+        batched_socket = BatchedSocketHandler(*log_addr)
+        batched_socket.setLevel(log_level)
+        _level_handlers.append(batched_socket)
+
+        _start_queue_listener(root_logger, batched_socket)
+    elif log_to_file:
+        # 일별 로그 파일 (자정마다 kindcoach.log.YYYY-MM-DD로 넘김)
+        file_handler = BufferedFileHandler(LOG_FILE, encoding='utf-8')
         file_handler.setLevel(log_level)
-        file_formatter = logging.Formatter(log_format, date_format)
-        file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
+        file_handler.setFormatter(LOG_FORMATTER)
+        _level_handlers.append(file_handler)
         
         # 에러 전용 로그 파일
-        error_log_file = log_dir / f"kindcoach_errors_{today}.log"
-        error_handler = logging.FileHandler(error_log_file, encoding='utf-8')
+        error_handler = BufferedFileHandler(ERROR_LOG_FILE, encoding='utf-8')
         error_handler.setLevel(logging.ERROR)
-        error_handler.setFormatter(file_formatter)
-        root_logger.addHandler(error_handler)
+        error_handler.setFormatter(LOG_FORMATTER)
+
+        _start_queue_listener(root_logger, file_handler, error_handler)
     
     # 외부 라이브러리 로그 레벨 조정
-    logging.getLogger('httpx').setLevel(logging.WARNING)
-    logging.getLogger('httpcore').setLevel(logging.WARNING)
-    logging.getLogger('urllib3').setLevel(logging.WARNING)
-    
-    # KindCoach 관련 로거들 설정
-    kindcoach_loggers = [
-        'src.ai_analyzer',
-        'src.audio_processor', 
-        'src.analysis_manager',
-        'src.main',
-        'src.prompt_manager',
-        'src.auth'
-    ]
-    
-    for logger_name in kindcoach_loggers:
-        logger = logging.getLogger(logger_name)
-        logger.setLevel(log_level)
+    for library in QUIET_LIBRARY_LOGGERS:
+        logging.getLogger(library).setLevel(logging.WARNING)
     
     return root_logger
 
 
+def _start_queue_listener(root_logger: logging.Logger, *handlers: logging.Handler):
+    """
+    주어진 핸들러들을 백그라운드 QueueListener로 옮기고, 루트 로거에는 QueueHandler만 연결합니다.
+    
+    Args:
+        root_logger: QueueHandler를 연결할 루트 로거
+        *handlers: 리스너 스레드에서 실행할 실제 핸들러들
+    """
+    global _queue_listener
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    root_logger.addHandler(queue_handler)
+    _root_handlers.append(queue_handler)
+
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _queue_listener = listener
+
+
+@atexit.register
+def _stop_queue_listener():
+    """백그라운드 리스너를 멈추고 큐에 남은 로그를 파일에 기록합니다."""
+    global _queue_listener
+
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     지정된 이름의 로거를 반환합니다.
@@ -97,6 +283,84 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
+class _LazyParams:
+    """
+    레코드가 실제로 출력될 때만 'k=v, ...' 문자열을 만드는 지연 포맷 객체입니다.
+    
+    중간 리스트 없이 제너레이터로 바로 이어 붙이며, 메타데이터가 없으면 헬퍼가 빈 문자열을 대신 넘깁니다.
+    """
+
+    __slots__ = ('_items',)
+
+    def __init__(self, items: dict):
+        self._items = items
+
+    def __str__(self) -> str:
+        return ', '.join(f"{k}={v}" for k, v in self._items.items())
+
+
+class SamplingFilter(logging.Filter):
+    """
+    INFO 이하 레코드는 rate개 중 1개만 통과시키는 샘플링 필터입니다.
+    
+    WARNING 이상은 항상 통과시켜 문제 상황의 로그는 잃지 않습니다.
+    """
+
+    def __init__(self, rate: int):
+        """
+        Args:
+            rate: 몇 개 중 1개를 남길지 (1이면 모두 통과)
+        """
+        super().__init__()
+        self.rate = rate
+        # itertools.count의 next()는 GIL 아래에서 원자적이라 별도 잠금이 필요 없음
+        self._counter = itertools.count()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        return next(self._counter) % self.rate == 0
+
+
+def _sample_rate_from_env() -> int:
+    """KINDCOACH_LOG_SAMPLE 환경 변수에서 샘플링 비율을 읽습니다 (없거나 잘못되면 1)."""
+    try:
+        return max(1, int(os.getenv("KINDCOACH_LOG_SAMPLE", "1")))
+    except ValueError:
+        return 1
+
+
+# 로그 헬퍼가 매번 조회하지 않도록 미리 가져온 로거
+_FN_LOGGER = get_logger('function_calls')
+_PERF_LOGGER = get_logger('performance')
+_API_LOGGER = get_logger('api_calls')
+
+_SAMPLED_LOGGERS = (_FN_LOGGER, _PERF_LOGGER, _API_LOGGER)
+
+
+def set_log_sampling(rate: int):
+    """
+    로그 헬퍼 로거(함수 호출/성능/API 호출)의 샘플링 비율을 바꿉니다.
+    
+    Args:
+        rate: 몇 개 중 1개를 남길지 (1 이하이면 샘플링하지 않음)
+    """
+    for helper_logger in _SAMPLED_LOGGERS:
+        for existing in [f for f in helper_logger.filters if isinstance(f, SamplingFilter)]:
+            helper_logger.removeFilter(existing)
+        if rate > 1:
+            helper_logger.addFilter(SamplingFilter(rate))
+
+
+# KINDCOACH_LOG_SAMPLE=N이면 요청마다 남는 헬퍼 로그를 N개 중 1개만 남김 (WARNING 이상은 모두 남김)
+LOG_SAMPLE_RATE = _sample_rate_from_env()
+set_log_sampling(LOG_SAMPLE_RATE)
+
+# 로그 헬퍼 메시지 템플릿 (레코드가 출력될 때 한 번에 채워짐)
+PERFORMANCE_TEMPLATE = "성능: %(operation)s - %(duration).2f초 (%(meta)s)"
+API_CALL_TEMPLATE = "API 호출: %(service)s %(endpoint)s - %(duration).2f초, 상태: %(status)s (%(meta)s)"
+
+
 def log_function_call(func_name: str, **kwargs):
     """
     함수 호출을 로그로 기록합니다.
@@ -105,9 +369,9 @@ def log_function_call(func_name: str, **kwargs):
         func_name: 함수 이름
         **kwargs: 함수 매개변수
     """
-    logger = get_logger('function_calls')
-    params = ', '.join([f"{k}={v}" for k, v in kwargs.items()])
-    logger.info(f"함수 호출: {func_name}({params})")
+    if not _FN_LOGGER.isEnabledFor(logging.INFO):
+        return
+    _FN_LOGGER.info("함수 호출: %s(%s)", func_name, _LazyParams(kwargs) if kwargs else '')
 
 
 def log_performance(operation: str, duration: float, **metadata):
@@ -119,9 +383,13 @@ def log_performance(operation: str, duration: float, **metadata):
         duration: 소요 시간 (초)
         **metadata: 추가 메타데이터
     """
-    logger = get_logger('performance')
-    meta_str = ', '.join([f"{k}={v}" for k, v in metadata.items()])
-    logger.info(f"성능: {operation} - {duration:.2f}초 ({meta_str})")
+    if not _PERF_LOGGER.isEnabledFor(logging.INFO):
+        return
+    _PERF_LOGGER.info(PERFORMANCE_TEMPLATE, {
+        'operation': operation,
+        'duration': duration,
+        'meta': _LazyParams(metadata) if metadata else '',
+    })
 
 
 def log_api_call(service: str, endpoint: str, duration: float, status: str, **metadata):
@@ -135,10 +403,12 @@ def log_api_call(service: str, endpoint: str, duration: float, status: str, **me
         status: 응답 상태
         **metadata: 추가 메타데이터
     """
-    logger = get_logger('api_calls')
-    meta_str = ', '.join([f"{k}={v}" for k, v in metadata.items()])
-    logger.info(f"API 호출: {service} {endpoint} - {duration:.2f}초, 상태: {status} ({meta_str})")
-
-
-# 기본 로깅 설정 적용
-setup_logging()
+    if not _API_LOGGER.isEnabledFor(logging.INFO):
+        return
+    _API_LOGGER.info(API_CALL_TEMPLATE, {
+        'service': service,
+        'endpoint': endpoint,
+        'duration': duration,
+        'status': status,
+        'meta': _LazyParams(metadata) if metadata else '',
+    })
@@ -7,9 +7,6 @@ import streamlit as st
 import os
 import sys
 from datetime import datetime
-import plotly.express as px
-import plotly.graph_objects as go
-import pandas as pd
 from io import BytesIO
 import json
 
@@ -18,18 +15,21 @@ current_dir = os.path.dirname(__file__)
 project_root = os.path.dirname(current_dir)
 sys.path.append(project_root)
 
-from src.logging_config import get_logger, log_performance
+from src.logging_config import setup_logging, get_logger, log_performance
+
+# 로깅 설정 (Streamlit 재실행 시에는 다시 설치하지 않음, LOG_TO_SOCKET=true면 로그 수집기로 전송)
+setup_logging(log_to_socket=os.getenv("LOG_TO_SOCKET", "").lower() == "true")
 
 # 로거 설정
 logger = get_logger(__name__)
 
 from src.audio_processor import AudioProcessor
-from src.ai_analyzer import AIAnalyzer
+from src.ai_analyzer import get_analyzer
 from src.auth import AuthManager, render_login_page, render_logout_button
 from src.prompt_editor import PromptEditor
 from src.analysis_manager import AnalysisManager
 from src.metadata_form import render_metadata_form, display_metadata_summary
-from src.dashboard import render_personal_dashboard
+from src.dashboard import render_personal_dashboard, clear_dashboard_cache
 from src.utils import (
     load_environment, validate_audio_file, format_duration,
     calculate_speaking_balance, generate_conversation_id,
@@ -39,6 +39,22 @@ from src.utils import (
 )
 
 
+@st.cache_resource
+def get_audio_processor(api_key: str) -> AudioProcessor:
+    """Streamlit 재실행·세션 간에 공유하는 오디오 프로세서를 반환합니다."""
+    return AudioProcessor(api_key)
+
+
+@st.cache_resource
+def get_analysis_manager() -> AnalysisManager:
+    """
+    Streamlit 재실행·세션 간에 공유하는 분석 관리자를 반환합니다.
+    
+    요약/문서 캐시와 검색 색인이 재실행마다 버려지지 않도록 프로세스에 하나만 둡니다.
+    """
+    return AnalysisManager()
+
+
 class KindCoachApp:
     def __init__(self):
         """KindCoach 애플리케이션 초기화"""
@@ -61,11 +77,12 @@ class KindCoachApp:
             logger.info("인증 관리자 초기화 완료")
             
             logger.info("오디오 프로세서 초기화 중...")
-            self.audio_processor = AudioProcessor(self.env_vars["assemblyai_key"])
+            self.audio_processor = get_audio_processor(self.env_vars["assemblyai_key"])
             logger.info("오디오 프로세서 초기화 완료")
             
             logger.info("AI 분석기 초기화 중...")
-            self.ai_analyzer = AIAnalyzer(self.env_vars["openai_key"])
+            # Streamlit 재실행마다 새로 만들지 않고 프로세스 공유 인스턴스 사용
+            self.ai_analyzer = get_analyzer(self.env_vars["openai_key"])
             logger.info("AI 분석기 초기화 완료")
             
             logger.info("프롬프트 에디터 초기화 중...")
@@ -73,7 +90,7 @@ class KindCoachApp:
             logger.info("프롬프트 에디터 초기화 완료")
             
             logger.info("분석 관리자 초기화 중...")
-            self.analysis_manager = AnalysisManager()
+            self.analysis_manager = get_analysis_manager()
             logger.info("분석 관리자 초기화 완료")
             
             logger.info("KindCoachApp 초기화 완료")
@@ -437,12 +454,18 @@ class KindCoachApp:
             logger.info("3단계: AI 분석 시작")
             status_placeholder.markdown('<p class="status-processing">🤖 AI가 대화를 분석하고 코칭 피드백을 생성 중...</p>', unsafe_allow_html=True)
             
-            ai_analysis = self.ai_analyzer.analyze_conversation(
+            # 종합 분석과 추가 분석들을 동시에 실행
+            metadata = st.session_state.get('current_metadata', {})
+            duration = transcription_result.get("audio_duration", 0)
+            all_results = self.ai_analyzer.run_all_analyses(
                 transcription_result["transcript"],
                 speaker_segments,
                 teacher_child_analysis,
-                transcription_result.get("sentiment", [])
+                transcription_result.get("sentiment", []),
+                situation=metadata.get('situation_type', "교사-아동 상호작용 상황"),
+                context=f"교사-아동 상호작용 ({duration}초)"
             )
+            ai_analysis = all_results["comprehensive"]
             
             if not ai_analysis.get("success"):
                 logger.error(f"AI 분석 실패: {ai_analysis.get('error', '알 수 없는 오류')}")
@@ -450,8 +473,8 @@ class KindCoachApp:
                 return
             
             logger.info("3단계: AI 분석 완료")
-            progress_bar.progress(80)
-            status_placeholder.markdown('<p class="status-processing">🔄 추가 분석들을 자동으로 실행 중...</p>', unsafe_allow_html=True)
+            progress_bar.progress(90)
+            status_placeholder.markdown('<p class="status-processing">💾 분석 결과를 저장 중...</p>', unsafe_allow_html=True)
             
             # 결과 저장 (새로운 AnalysisManager 사용)
             logger.info("분석 결과 저장 시작")
@@ -460,7 +483,6 @@ class KindCoachApp:
             
             # 새 분석 세션 생성 (메타데이터 포함)
             current_user = self.auth_manager.get_current_user()
-            metadata = st.session_state.get('current_metadata', {})
             logger.info(f"현재 사용자: {current_user}")
             
             analysis_data = self.analysis_manager.create_new_analysis(
@@ -475,16 +497,16 @@ class KindCoachApp:
             
             logger.info("새 분석 세션 생성 완료")
             
-            # 종합 분석 결과 저장
+            # 종합 분석 결과와 추가 분석 결과를 모아 한 번에 저장
             self.analysis_manager.update_analysis_result(
-                conversation_id, "comprehensive", ai_analysis, current_user
+                conversation_id, "comprehensive", ai_analysis, current_user, flush=False
             )
-            logger.info("종합 분석 결과 저장 완료")
-            
-            # 추가 분석들 자동 실행
-            logger.info("추가 분석들 자동 실행 시작")
-            self._execute_additional_analyses(conversation_id, transcription_result, speaker_segments, teacher_child_analysis, current_user)
-            logger.info("추가 분석들 자동 실행 완료")
+            self._save_additional_analyses(conversation_id, all_results, current_user)
+            if self.analysis_manager.flush_analysis(conversation_id):
+                clear_dashboard_cache()
+                logger.info("분석 결과 저장 완료")
+            else:
+                logger.error("분석 결과 저장 실패")
             
             progress_bar.progress(100)
             status_placeholder.markdown('<p class="status-success">✅ 모든 분석이 완료되었습니다!</p>', unsafe_allow_html=True)
@@ -732,86 +754,23 @@ class KindCoachApp:
                 st.error(f"❌ 분석 실패: {cached_result.get('error', '알 수 없는 오류')}")
         elif not is_completed:
             st.info("⏳ 분석이 진행 중입니다. 잠시만 기다려주세요...")
+            # 동시 분석에서 실패했거나 빠진 분석은 여기서 다시 실행 (응답이 도착하는 대로 표시)
+            if st.button(f"▶️ {analysis_info['name']} 실행", key=f"run_{conversation_id}_{analysis_type}"):
+                self._execute_analysis(conversation_id, analysis_type, results)
     
     
-    def _execute_additional_analyses(self, conversation_id: str, transcription_result: dict, 
-                                   speaker_segments: list, teacher_child_analysis: dict, username: str):
-        """추가 분석들을 자동으로 실행합니다"""
-        logger.info("추가 분석들 자동 실행 시작")
-        
-        # 빠른 피드백 분석
-        try:
-            logger.info("빠른 피드백 분석 시작")
-            quick_feedback = self.ai_analyzer.get_quick_feedback(transcription_result["transcript"])
-            if quick_feedback.get("success"):
-                self.analysis_manager.update_analysis_result(conversation_id, "quick_feedback", quick_feedback, username)
-                logger.info("빠른 피드백 분석 완료")
-            else:
-                logger.error(f"빠른 피드백 분석 실패: {quick_feedback.get('error')}")
-        except Exception as e:
-            logger.error(f"빠른 피드백 분석 중 오류: {str(e)}")
-        
-        # 아동 발달 분석
-        try:
-            logger.info("아동 발달 분석 시작")
-            # 교사-아동 분석 결과에서 아동 통계 정보 사용
-            child_stats = teacher_child_analysis.get("child_stats", {})
-            if child_stats and child_stats.get("total_utterances", 0) > 0:
-                # 화자 구간에서 아동으로 추정되는 구간 찾기 (더 유연한 방법)
-                child_segments = []
-                for seg in speaker_segments:
-                    speaker = seg.get("speaker", "")
-                    # 화자 B가 아동일 가능성이 높다고 가정 (일반적으로 교사가 먼저 말함)
-                    if "B" in speaker or "아동" in speaker or "child" in speaker.lower():
-                        child_segments.append(seg)
-                
-                # 아동 구간이 없으면 전체 전사본으로 분석
-                if not child_segments:
-                    logger.info("아동 구간을 찾을 수 없어 전체 전사본으로 발달 분석을 진행합니다")
-                    child_segments = speaker_segments  # 전체 구간 사용
-                
-                child_development = self.ai_analyzer.analyze_child_development(
-                    transcription_result["transcript"], child_segments
+    def _save_additional_analyses(self, conversation_id: str, all_results: dict, username: str):
+        """동시에 실행된 추가 분석 결과들을 반영합니다 (디스크 저장은 호출한 쪽의 flush_analysis에서)"""
+        for analysis_type, result in all_results.items():
+            if analysis_type == "comprehensive":
+                continue
+            if result.get("success"):
+                self.analysis_manager.update_analysis_result(
+                    conversation_id, analysis_type, result, username, flush=False
                 )
-                if child_development.get("success"):
-                    self.analysis_manager.update_analysis_result(conversation_id, "child_development", child_development, username)
-                    logger.info("아동 발달 분석 완료")
-                else:
-                    logger.error(f"아동 발달 분석 실패: {child_development.get('error')}")
+                logger.info(f"{analysis_type} 분석 결과 반영 완료")
             else:
-                logger.warning("아동 발화 통계가 없어 아동 발달 분석을 건너뜁니다")
-        except Exception as e:
-            logger.error(f"아동 발달 분석 중 오류: {str(e)}")
-        
-        # 코칭 팁 분석
-        try:
-            logger.info("코칭 팁 분석 시작")
-            coaching_tips = self.ai_analyzer.get_coaching_tips(
-                transcription_result["transcript"], "교사-아동 상호작용 상황"
-            )
-            if coaching_tips.get("success"):
-                self.analysis_manager.update_analysis_result(conversation_id, "coaching_tips", coaching_tips, username)
-                logger.info("코칭 팁 분석 완료")
-            else:
-                logger.error(f"코칭 팁 분석 실패: {coaching_tips.get('error')}")
-        except Exception as e:
-            logger.error(f"코칭 팁 분석 중 오류: {str(e)}")
-        
-        # 감정 해석 분석
-        try:
-            logger.info("감정 해석 분석 시작")
-            sentiment_interpretation = self.ai_analyzer.interpret_sentiment(
-                transcription_result["transcript"], speaker_segments
-            )
-            if sentiment_interpretation.get("success"):
-                self.analysis_manager.update_analysis_result(conversation_id, "sentiment_interpretation", sentiment_interpretation, username)
-                logger.info("감정 해석 분석 완료")
-            else:
-                logger.error(f"감정 해석 분석 실패: {sentiment_interpretation.get('error')}")
-        except Exception as e:
-            logger.error(f"감정 해석 분석 중 오류: {str(e)}")
-        
-        logger.info("추가 분석들 자동 실행 완료")
+                logger.error(f"{analysis_type} 분석 실패: {result.get('error')}")
 
     def _execute_analysis(self, conversation_id: str, analysis_type: str, results: dict):
         """특정 분석 유형을 실행합니다"""
@@ -823,17 +782,29 @@ class KindCoachApp:
                 result = None
                 
                 if analysis_type == "comprehensive":
-                    # 종합 분석 (이미 완료된 상태이므로 기존 결과 사용)
+                    # 종합 분석 (이미 완료된 상태이면 기존 결과 사용)
                     result = results.get("ai_analysis")
                     if result:
                         st.info("📋 기존 종합 분석 결과를 사용합니다.")
+                    else:
+                        transcription = results["transcription"]
+                        result = {}
+                        st.write_stream(self.ai_analyzer.stream_conversation_analysis(
+                            transcription["transcript"],
+                            results["teacher_child_analysis"],
+                            transcription.get("sentiment", []),
+                            result=result,
+                            speaker_segments=transcription["speakers"]
+                        ))
                 
                 elif analysis_type == "quick_feedback":
                     st.info("⚡ 빠른 피드백을 생성하고 있습니다...")
                     transcript = results["transcription"]["transcript"]
                     if not transcript.strip():
                         raise ValueError("전사본이 비어있어 분석할 수 없습니다.")
-                    result = self.ai_analyzer.get_quick_feedback(transcript)
+                    # 첫 토큰부터 바로 보이도록 스트리밍으로 표시하고, 끝나면 result에 결과가 채워짐
+                    result = {}
+                    st.write_stream(self.ai_analyzer.stream_quick_feedback(transcript, result))
                 
                 elif analysis_type == "child_development":
                     st.info("👶 아동 발달 분석을 수행하고 있습니다...")
@@ -877,9 +848,10 @@ class KindCoachApp:
                     metadata = st.session_state.get('current_metadata', {})
                     situation = metadata.get('situation_type', "일반적인 교사-아동 상호작용")
                     
-                    result = self.ai_analyzer.get_coaching_tips(
-                        results["transcription"]["transcript"], situation
-                    )
+                    result = {}
+                    st.write_stream(self.ai_analyzer.stream_coaching_tips(
+                        results["transcription"]["transcript"], situation, result
+                    ))
                 
                 elif analysis_type == "sentiment_interpretation":
                     st.info("😊 감정 분석 해석을 수행하고 있습니다...")
@@ -899,6 +871,7 @@ class KindCoachApp:
                         conversation_id, analysis_type, result
                     )
                     if success:
+                        clear_dashboard_cache()
                         st.success(f"✅ {analysis_name}이 완료되고 저장되었습니다!")
                         # 세션 상태 업데이트로 UI 즉시 반영
                         if 'analysis_data' in st.session_state:
@@ -938,6 +911,11 @@ class KindCoachApp:
     
     def render_statistics_tab(self, results):
         """통계 탭 렌더링"""
+        # plotly/pandas는 import 비용이 커서 통계 탭을 처음 그릴 때 불러옴 (콜드 스타트 단축)
+        import pandas as pd
+        import plotly.express as px
+        import plotly.graph_objects as go
+        
         st.markdown("### 📈 대화 통계")
         
         transcription = results["transcription"]
@@ -1280,6 +1258,7 @@ class KindCoachApp:
                         success = self.analysis_manager.delete_analysis(analysis['conversation_id'], username=current_user)
                         
                         if success:
+                            clear_dashboard_cache()
                             metadata = analysis.get('metadata', {})
                             child_name = metadata.get('child_name', '알 수 없음')
                             st.success(f"✅ **{child_name}**의 분석이 삭제되었습니다!")
@@ -7,7 +7,7 @@ import streamlit as st
 import json
 from datetime import datetime
 from typing import Dict, Any, Optional
-from src.prompt_manager import PromptManager
+from src.prompt_manager import get_prompt_manager
 
 
 class PromptEditor:
@@ -16,7 +16,7 @@ class PromptEditor:
     def __init__(self):
         """프롬프트 편집기 초기화"""
         if 'prompt_manager' not in st.session_state:
-            st.session_state.prompt_manager = PromptManager()
+            st.session_state.prompt_manager = get_prompt_manager()
         
         self.prompt_manager = st.session_state.prompt_manager
     
@@ -7,8 +7,15 @@ import json
 import os
 import shutil
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 from pathlib import Path
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.logging_config import get_logger
+
+# 로거 설정
+logger = get_logger(__name__)
 
 
 class PromptManager:
@@ -31,6 +38,8 @@ class PromptManager:
             self._initialize_default_prompts()
         
         self.prompts = self._load_prompts()
+        # 프롬프트가 바뀔 때마다 증가 (공유 인스턴스 사용처가 변경 여부를 값 비교로 확인)
+        self.revision = 0
     
     def _initialize_default_prompts(self):
         """기본 프롬프트로 JSON 파일 초기화"""
@@ -93,7 +102,7 @@ class PromptManager:
             with open(self.prompts_file, 'r', encoding='utf-8') as f:
                 return json.load(f)
         except Exception as e:
-            print(f"프롬프트 로드 실패: {e}")
+            logger.error("프롬프트 로드 실패: %s", e)
             return {}
     
     def _save_prompts(self, prompts: Dict[str, Any]):
@@ -105,7 +114,7 @@ class PromptManager:
             with open(self.prompts_file, 'w', encoding='utf-8') as f:
                 json.dump(prompts, f, ensure_ascii=False, indent=2)
         except Exception as e:
-            print(f"프롬프트 저장 실패: {e}")
+            logger.exception("프롬프트 저장 실패: %s", e)
     
     def get_prompt(self, prompt_id: str) -> Optional[str]:
         """특정 프롬프트의 템플릿을 가져옵니다."""
@@ -143,6 +152,7 @@ class PromptManager:
         self.prompts[prompt_id]["template"] = new_template
         self.prompts[prompt_id]["last_modified"] = datetime.now().isoformat()
         self.prompts[prompt_id]["modified_by"] = modified_by
+        self.revision += 1
         
         # 파일에 저장
         self._save_prompts(self.prompts)
@@ -201,7 +211,7 @@ class PromptManager:
             self._cleanup_old_backups()
             
         except Exception as e:
-            print(f"백업 생성 실패: {e}")
+            logger.exception("백업 생성 실패: %s", e)
     
     def _cleanup_old_backups(self, keep_count: int = 10):
         """오래된 백업 파일들을 정리합니다."""
@@ -214,7 +224,7 @@ class PromptManager:
                 old_backup.unlink()
                 
         except Exception as e:
-            print(f"백업 정리 실패: {e}")
+            logger.warning("백업 정리 실패: %s", e)
     
     def get_backup_list(self) -> List[Dict[str, Any]]:
         """사용 가능한 백업 파일 목록을 가져옵니다."""
@@ -234,7 +244,7 @@ class PromptManager:
             
             return backups
         except Exception as e:
-            print(f"백업 목록 조회 실패: {e}")
+            logger.warning("백업 목록 조회 실패: %s", e)
             return []
     
     def restore_from_backup(self, backup_filename: str) -> bool:
@@ -253,13 +263,25 @@ class PromptManager:
             
             # 메모리의 프롬프트도 다시 로드
             self.prompts = self._load_prompts()
+            self.revision += 1
             
             return True
             
         except Exception as e:
-            print(f"백업 복원 실패: {e}")
+            logger.exception("백업 복원 실패: %s", e)
             return False
     
     def reload_prompts(self):
         """프롬프트 파일을 다시 로드합니다."""
-        self.prompts = self._load_prompts()
\ No newline at end of file
+        self.prompts = self._load_prompts()
+        self.revision += 1
+
+
+@lru_cache(maxsize=1)
+def get_prompt_manager() -> PromptManager:
+    """
+    프로세스 전체에서 공유하는 PromptManager를 반환합니다.
+    
+    분석기와 프롬프트 편집기가 같은 인스턴스를 쓰므로, 편집 내용이 파일을 다시 읽지 않아도 반영됩니다.
+    """
+    return PromptManager()
\ No newline at end of file
@@ -0,0 +1,70 @@
+"""
+API 호출 속도 제한 모듈
+분당 요청 수(RPM)/토큰 수(TPM) 한도를 넘지 않도록 호출을 지연시킴
+"""
+
+import os
+import asyncio
+import threading
+import time
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.logging_config import get_logger
+
+# 로거 설정
+logger = get_logger(__name__)
+
+
+class TokenBucket:
+    """
+    분당 한도를 일정한 속도로 채우는 토큰 버킷입니다.
+
+    동기 호출(스레드)과 비동기 호출(이벤트 루프)이 같은 버킷을 공유할 수 있도록,
+    잠금 안에서는 사용량을 예약만 하고 대기는 잠금 밖에서 합니다.
+    """
+
+    def __init__(self, per_minute: float, name: str = "bucket"):
+        """
+        Args:
+            per_minute: 분당 허용량 (버킷 용량이자 1분 동안 채워지는 양)
+            name: 로그에 표시할 버킷 이름
+        """
+        if per_minute <= 0:
+            raise ValueError(f"분당 허용량은 0보다 커야 합니다: {per_minute}")
+
+        self.name = name
+        self.capacity = float(per_minute)
+        self._rate = self.capacity / 60.0
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, amount: float) -> float:
+        """사용량을 예약하고, 한도 안으로 돌아올 때까지 기다려야 할 시간(초)을 반환합니다."""
+        # 용량보다 큰 요청도 한 번은 통과할 수 있도록 용량으로 제한
+        amount = min(float(amount), self.capacity)
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self._rate)
+            self._updated_at = now
+            self._tokens -= amount
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._rate
+
+    def acquire(self, amount: float = 1) -> float:
+        """사용량을 확보할 때까지 현재 스레드를 대기시킵니다. 대기한 시간(초)을 반환합니다."""
+        delay = self._reserve(amount)
+        if delay > 0:
+            logger.debug("%s 한도 도달 - %.2f초 대기", self.name, delay)
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, amount: float = 1) -> float:
+        """acquire의 비동기 버전입니다 (이벤트 루프를 막지 않고 대기)."""
+        delay = self._reserve(amount)
+        if delay > 0:
+            logger.debug("%s 한도 도달 - %.2f초 대기", self.name, delay)
+            await asyncio.sleep(delay)
+        return delay
@@ -5,14 +5,22 @@
 
 import os
 import json
-from typing import Dict, Any, List, Optional, Union
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Union
 from datetime import datetime
-import pandas as pd
 from dotenv import load_dotenv
 import tempfile
 import hashlib
 from mutagen import File
 import io
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.logging_config import get_logger
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# 로거 설정
+logger = get_logger(__name__)
 
 
 def load_environment():
@@ -152,7 +160,7 @@ def save_analysis_result(result: Dict[str, Any], conversation_id: str) -> str:
         return filepath
         
     except Exception as e:
-        print(f"분석 결과 저장 중 오류: {str(e)}")
+        logger.exception("분석 결과 저장 중 오류: %s", e)
         return None
 
 
@@ -168,12 +176,14 @@ def load_analysis_result(conversation_id: str) -> Optional[Dict[str, Any]]:
             return json.load(f)
             
     except Exception as e:
-        print(f"분석 결과 로드 중 오류: {str(e)}")
+        logger.warning("분석 결과 로드 중 오류: %s", e)
         return None
 
 
-def create_segments_dataframe(segments: List[Dict[str, Any]]) -> pd.DataFrame:
+def create_segments_dataframe(segments: List[Dict[str, Any]]) -> "pd.DataFrame":
     """발화 구간을 DataFrame으로 변환합니다."""
+    import pandas as pd  # import 비용이 커서 필요할 때 불러옴
+    
     if not segments:
         return pd.DataFrame()
     
@@ -359,7 +369,7 @@ def extract_audio_duration(uploaded_file) -> Optional[float]:
         return None
         
     except Exception as e:
-        print(f"오디오 길이 추출 실패: {str(e)}")
+        logger.warning("오디오 길이 추출 실패: %s", e)
         return None
 
 
@@ -15,6 +15,7 @@ sys.path.append(str(project_root))
 from src.audio_processor import AudioProcessor
 from src.ai_analyzer import AIAnalyzer
 from src.utils import load_environment, validate_audio_file, format_duration
+from src.logging_config import setup_logging
 
 def test_audio_processing():
     """샘플 오디오 파일로 전체 처리 과정 테스트"""
@@ -66,12 +67,15 @@ def test_audio_processing():
             self.size = os.path.getsize(file_path)
             self._file = None
         
-        def read(self):
-            with open(self.file_path, 'rb') as f:
-                return f.read()
+        def read(self, size=-1):
+            # AudioProcessor는 해시 계산/임시 파일 복사 때 일정 크기씩 나눠 읽음
+            if self._file is None:
+                self._file = open(self.file_path, 'rb')
+            return self._file.read(size)
         
         def seek(self, position):
-            pass  # Streamlit의 seek 호출 처리
+            if self._file is not None:
+                self._file.seek(position)
     
     # 6. 오디오 전사 시작
     print("\n🎙️ 오디오 전사 시작...")
@@ -145,4 +149,5 @@ def test_audio_processing():
     print("\n🎉 테스트 완료!")
 
 if __name__ == "__main__":
+    setup_logging()
     test_audio_processing()
\ No newline at end of file